@@ -584,13 +584,126 @@ def export_slider_button_icons(*_args):
     return exported
 
 
+def toggle_slider_profiler(*_args):
+    """Switch per-tick slider timing on or off for this Maya session."""
+    from TheKeyMachine.tools.sliders import profiler
+
+    profiler.set_enabled(not profiler.enabled())
+    print("TheKeyMachine debug: slider profiler {}.".format("on" if profiler.enabled() else "off"))
+    return profiler.enabled()
+
+
+def dump_slider_profile(*_args):
+    """Write the recorded slider ticks and their p50/p95 summary as JSON."""
+    import time
+
+    from maya import cmds
+
+    from TheKeyMachine.core import application
+    from TheKeyMachine.tools.sliders import profiler
+
+    path = application.get_tool_data_path(
+        "sliders",
+        "slider_profile_{}.json".format(time.strftime("%Y%m%d_%H%M%S")),
+    )
+    try:
+        profiler.dump_json(path)
+    except (OSError, TypeError, ValueError) as error:
+        cmds.warning("Slider profile could not be written: {}".format(error))
+        return None
+    print("TheKeyMachine debug: slider profile written to {}".format(path))
+    return path
+
+
+def reset_slider_profile(*_args):
+    """Forget every recorded slider tick."""
+    from TheKeyMachine.tools.sliders import profiler
+
+    profiler.reset()
+
+
+def _add_slider_profile_summary(menu):
+    """Append the rolling slider timing summary as read-only menu lines."""
+    try:
+        from TheKeyMachine.tools.sliders import profiler
+
+        lines = profiler.summary_lines()
+        profiling = profiler.enabled()
+    except Exception:
+        return
+    if not lines and not profiling:
+        return
+    menu.addSeparator()
+    for line in lines or ["Slider profiler: no ticks recorded"]:
+        action = menu.addAction(line)
+        action.setEnabled(False)
+
+
+def print_registry_startup_report(*_args):
+    """Compare the cold toolbar build with this session's manifest build."""
+    from TheKeyMachine.tools import registry
+
+    timings = dict(registry.STARTUP_TIMINGS)
+    cold_ms = registry.manifest_cold_discovery_ms()
+    cold_builds = registry.manifest_cold_toolbar_ms()
+    builds = timings.get("toolbar_build_ms") or {}
+    from_manifest = "manifest_definitions_ms" in timings
+    lines = ["TheKeyMachine debug: tool registry startup"]
+    lines.append("  manifest: {} (loaded in {:.1f} ms)".format(
+        "valid" if timings.get("manifest_valid") else "missing or stale",
+        timings.get("manifest_load_ms", 0.0),
+    ))
+    if from_manifest:
+        lines.append("  definitions decoded from the manifest: {:.1f} ms".format(timings["manifest_definitions_ms"]))
+    elif "discovery_ms" in timings:
+        lines.append("  full discovery this session (manifest rebuilt): {:.1f} ms".format(timings["discovery_ms"]))
+    else:
+        lines.append("  definitions: not loaded this session")
+    if cold_ms is not None and from_manifest:
+        lines.append("  full discovery when the manifest was built: {:.1f} ms".format(cold_ms))
+
+    lines.append("  toolbar builds ({}):".format("from the manifest" if from_manifest else "cold"))
+    for layout_id in sorted(set(builds) | set(cold_builds)):
+        current = builds.get(layout_id)
+        cold = cold_builds.get(layout_id)
+        if not from_manifest:
+            lines.append("    {}: {}".format(layout_id, "{:.1f} ms".format(current) if current is not None else "not built"))
+            continue
+        lines.append("    {}: {} vs {} cold".format(
+            layout_id,
+            "{:.1f} ms".format(current) if current is not None else "not built",
+            "{:.1f} ms".format(cold) if cold is not None else "unknown",
+        ))
+    if not builds and not cold_builds:
+        lines.append("    none")
+
+    eager = timings.get("eager_packages") or []
+    if eager:
+        lines.append("  packages the manifest can't defer (imported with the definitions): {}".format(
+            ", ".join(eager)))
+    groups = (
+        ("packages imported by a deferred callable", timings.get("deferred_packages_ms") or {}),
+        ("packages imported for a command through the manifest", timings.get("manifest_packages_ms") or {}),
+    )
+    for label, packages in groups:
+        lines.append("  {}: {} in {:.1f} ms".format(label, len(packages), sum(packages.values())))
+        for package_name, elapsed in sorted(packages.items(), key=lambda item: -item[1]):
+            lines.append("    {}: {:.1f} ms".format(package_name, elapsed))
+    print("\n".join(lines))
+    return timings
+
+
 # Dictionary order is the menu order. Add developer actions here; every callback
 # must be callable and live in this module so reloading debug refreshes it.
 DEBUG_ACTIONS = {
     "Print Debug Summary": print_debug_summary,
+    "Print Registry Startup Report": print_registry_startup_report,
     "Export Slider Text Icons": export_slider_text_icons,
     "Export Slider Button Icons": export_slider_button_icons,
     "Export Selection Set Icons": export_selection_set_icons,
+    "Toggle Slider Profiler": toggle_slider_profiler,
+    "Dump Slider Profile": dump_slider_profile,
+    "Reset Slider Profile": reset_slider_profile,
 }
 
 
@@ -600,6 +713,7 @@ def populate_menu(menu):
     for label, callback in DEBUG_ACTIONS.items():
         if callable(callback):
             menu.addAction(label, callback=callback)
+    _add_slider_profile_summary(menu)
     if not menu.actions():
         action = menu.addAction("No debug actions")
         action.setEnabled(False)
@@ -497,6 +497,12 @@ class RuntimeManager(QtCore.QObject):
         self._remove_all()
         self._started = False
         _clear_state()
+        # Preferences are written behind; don't leave the last ones pending.
+        try:
+            from TheKeyMachine.core import settings
+            settings.flush()
+        except Exception:
+            pass
         app = QtWidgets.QApplication.instance()
         if app is not None and getattr(app, _APP_RUNTIME_ATTRIBUTE, None) is self:
             try:
@@ -1,5 +1,8 @@
+import atexit
 import json
 import os
+import tempfile
+import threading
 from typing import Dict, Iterable, Optional
 
 from TheKeyMachine.core.application import USER_FOLDER_PATH
@@ -16,6 +19,19 @@ _DEFAULT_FILENAME = "user_preferences.json"
 # until something on disk actually changes.
 _FILE_CACHE: Dict[str, "tuple[Optional[float], Optional[Dict]]"] = {}
 
+# set_setting() is just as hot: the search dialog stores its text on every
+# keystroke, and window moves, toggles and runners persist state as they go.
+# Writes land in _FILE_CACHE at once and are written behind: every dirty
+# file is flushed together FLUSH_DELAY_SECONDS after the last write, on
+# flush(), and at shutdown. _PENDING keeps only the keys written since the
+# last flush so a file another Maya session changed meanwhile is merged
+# rather than overwritten.
+FLUSH_DELAY_SECONDS = 2.0
+_PENDING: Dict[str, Dict] = {}
+_LOCK = threading.RLock()
+_FLUSH_LOCK = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
 
 def _preferences_dir() -> str:
     """Return (and lazily create) the folder that stores preference json files."""
@@ -45,6 +61,10 @@ def _candidate_files(namespace: Optional[str]) -> Iterable[str]:
 
 
 def _load_file(config_file: str) -> Optional[Dict]:
+    with _LOCK:
+        if config_file in _PENDING:
+            # Unflushed writes are newer than anything on disk.
+            return _FILE_CACHE[config_file][1]
     try:
         mtime = os.path.getmtime(config_file)
     except OSError:
@@ -87,15 +107,107 @@ def set_setting(key: str, value, namespace: Optional[str] = None) -> None:
 
 
 def set_settings(values: Dict[str, object], namespace: Optional[str] = None) -> None:
-    """Persist several settings with a single preferences file update."""
+    """Store several settings at once; the file is written behind."""
     if not values:
         return
     config_file = get_preferences_file(namespace=namespace)
-    os.makedirs(os.path.dirname(config_file), exist_ok=True)
+    with _LOCK:
+        config = _load_file(config_file)
+        if config is None:
+            config = {}
+            _store_cache(config_file, config)
+        config.update(values)
+        _PENDING.setdefault(config_file, {}).update(values)
+        _schedule_flush()
+
+
+def _schedule_flush() -> None:
+    global _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+    _flush_timer = threading.Timer(FLUSH_DELAY_SECONDS, flush)
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def _write_json_atomic(config_file: str, config: Dict) -> None:
+    folder = os.path.dirname(config_file)
+    os.makedirs(folder, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(
+        prefix=".{}-".format(os.path.basename(config_file)), suffix=".tmp", dir=folder,
+    )
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            json.dump(config, handle, indent=4, sort_keys=True)
+        os.replace(temporary_path, config_file)
+    except Exception:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        raise
+
+
+def _flush_file(config_file: str, pending: Dict, cached_mtime: Optional[float], config: Optional[Dict]) -> Dict:
+    """Write *config* (a snapshot of the cache) with *pending* on top; return what was written."""
+    try:
+        mtime = os.path.getmtime(config_file)
+    except OSError:
+        mtime = None
+    if config is None or mtime != cached_mtime:
+        # Changed on disk since it was read: keep those edits, reapply ours.
+        try:
+            with open(config_file, "r", encoding="utf-8") as handle:
+                config = json.load(handle)
+        except Exception:
+            config = dict(config or {})
+        config.update(pending)
+    _write_json_atomic(config_file, config)
+    return config
 
-    config = _load_file(config_file) or {}
-    config.update(values)
 
-    with open(config_file, "w", encoding="utf-8") as handle:
-        json.dump(config, handle, indent=4, sort_keys=True)
-    _store_cache(config_file, config)
+def flush() -> None:
+    """Write every pending settings change to disk now.
+
+    _LOCK is held only to take the pending keys and cache snapshots and to
+    fold the results back, never across the file I/O, so set_setting() on
+    the main thread doesn't wait on a write behind. _FLUSH_LOCK keeps two
+    flushes from writing the same file out of order.
+    """
+    global _flush_timer
+    with _FLUSH_LOCK:
+        with _LOCK:
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+            pending_files = []
+            for config_file, pending in _PENDING.items():
+                cached_mtime, config = _FILE_CACHE.get(config_file, (None, None))
+                snapshot = dict(config) if config is not None else None
+                pending_files.append((config_file, pending, cached_mtime, snapshot))
+            _PENDING.clear()
+
+        failed = False
+        for config_file, pending, cached_mtime, snapshot in pending_files:
+            try:
+                written = _flush_file(config_file, pending, cached_mtime, snapshot)
+            except Exception:
+                written = None
+            with _LOCK:
+                if written is None:
+                    # Keep the values for a retry; anything written since is newer.
+                    requeued = dict(pending)
+                    requeued.update(_PENDING.get(config_file, {}))
+                    _PENDING[config_file] = requeued
+                    failed = True
+                    continue
+                # Writes that landed during the I/O stay pending and on top.
+                config = dict(written)
+                config.update(_PENDING.get(config_file, {}))
+                _store_cache(config_file, config)
+        if failed:
+            with _LOCK:
+                _schedule_flush()
+
+
+atexit.register(flush)
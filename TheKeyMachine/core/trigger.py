@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib
 import inspect
+import time
 from dataclasses import dataclass
 from functools import wraps
 from typing import Callable, Dict, Optional
@@ -36,7 +37,8 @@ class _RegisteredCommand:
 
 
 _COMMANDS: Dict[str, _RegisteredCommand] = {}
-_SLIDER_EXECUTORS: Dict[str, Callable] = {}
+_SLIDER_EXECUTORS: Dict[str, str] = {}
+_REGISTERED_PACKAGES = set()
 _DISCOVERY_COMPLETE = False
 _DISCOVERY_IN_PROGRESS = False
 _SLIDER_POLICY = OperationPolicy(progress=False, undo=False)
@@ -153,6 +155,7 @@ def reset_registry() -> None:
     global _DISCOVERY_COMPLETE, _DISCOVERY_IN_PROGRESS
     _COMMANDS.clear()
     _SLIDER_EXECUTORS.clear()
+    _REGISTERED_PACKAGES.clear()
     _DISCOVERY_COMPLETE = False
     _DISCOVERY_IN_PROGRESS = False
 
@@ -172,6 +175,88 @@ def _register_slider_commands(prefix: str, mode: str, execute: Callable) -> None
             policy=_SLIDER_POLICY,
         )
 
+def _slider_executor(package_name: str) -> Callable:
+    """Proxy for ``<package>.api.execute`` that imports the api on first use."""
+    def execute(mode, value, session=None):
+        api = importlib.import_module(package_name + ".api")
+        _execute = getattr(api, "execute", None)
+        if not callable(_execute):
+            raise RuntimeError("{} must expose api.execute()".format(package_name))
+        return _execute(mode, value, session=session)
+
+    execute.__name__ = "execute"
+    execute.__qualname__ = "{}.api.execute".format(package_name)
+    return execute
+
+
+def _register_definitions(tools, sections) -> None:
+    for tool_id, definition in tools.items():
+        callback = definition.get("callback")
+        if callable(callback):
+            register_command(
+                tool_id,
+                callback,
+                policy=_policy_from_definition(tool_id, definition, callback),
+            )
+
+    for section_id, section in sections.items():
+        if section.get("type") != "slider":
+            continue
+
+        prefix = section.get("slider_type")
+        package_name = section.get("_package")
+        if not prefix or not package_name:
+            raise RuntimeError(
+                "Slider section {!r} is missing its type or owning package".format(
+                    section_id
+                )
+            )
+
+        previous = _SLIDER_EXECUTORS.get(prefix)
+        if previous is not None and previous != package_name:
+            raise RuntimeError("Duplicate slider type {!r}".format(prefix))
+        _SLIDER_EXECUTORS[prefix] = package_name
+
+        execute = _slider_executor(package_name)
+        for mode in section.get("modes") or ():
+            mode_key = getattr(mode, "key", None)
+            if mode_key:
+                _register_slider_commands(prefix, mode_key, execute)
+
+
+def _register_manifest_package(name: str) -> bool:
+    """Register only the package that owns *name*, per the registry manifest.
+
+    Returns False when the manifest doesn't know *name* (stale, missing, or
+    a command the manifest doesn't track), leaving full discovery to the
+    caller.
+    """
+    from TheKeyMachine.tools import registry
+
+    package_name = registry.manifest_command_package(name)
+    if not package_name:
+        return False
+    if package_name not in _REGISTERED_PACKAGES:
+        started = time.perf_counter()
+        try:
+            tools, sections = registry.get_package_definitions(package_name)
+            _register_definitions(tools, sections)
+        except Exception:
+            return False
+        _REGISTERED_PACKAGES.add(package_name)
+        registry.STARTUP_TIMINGS.setdefault("manifest_packages_ms", {})[package_name] = (
+            time.perf_counter() - started
+        ) * 1000.0
+    return name in _COMMANDS
+
+
+def _ensure_command(name: str) -> None:
+    if _DISCOVERY_COMPLETE or _DISCOVERY_IN_PROGRESS:
+        return
+    if not _register_manifest_package(name):
+        _discover_commands()
+
+
 def _discover_commands() -> None:
     global _DISCOVERY_COMPLETE, _DISCOVERY_IN_PROGRESS
     if _DISCOVERY_COMPLETE or _DISCOVERY_IN_PROGRESS:
@@ -182,42 +267,10 @@ def _discover_commands() -> None:
         from TheKeyMachine.tools.custom_tools import service as connect_entries
         from TheKeyMachine.tools import registry
 
-        for tool_id, definition in registry.get_tool_definitions().items():
-            callback = definition.get("callback")
-            if callable(callback):
-                register_command(
-                    tool_id,
-                    callback,
-                    policy=_policy_from_definition(tool_id, definition, callback),
-                )
-
-        for section_id, section in registry.get_section_definitions().items():
-            if section.get("type") != "slider":
-                continue
-
-            prefix = section.get("slider_type")
-            package_name = section.get("_package")
-            if not prefix or not package_name:
-                raise RuntimeError(
-                    "Slider section {!r} is missing its type or owning package".format(
-                        section_id
-                    )
-                )
-
-            api = importlib.import_module(package_name + ".api")
-            execute = getattr(api, "execute", None)
-            if not callable(execute):
-                raise RuntimeError("{} must expose api.execute()".format(package_name))
-
-            previous = _SLIDER_EXECUTORS.get(prefix)
-            if previous is not None and previous is not execute:
-                raise RuntimeError("Duplicate slider type {!r}".format(prefix))
-            _SLIDER_EXECUTORS[prefix] = execute
-
-            for mode in section.get("modes") or ():
-                mode_key = getattr(mode, "key", None)
-                if mode_key:
-                    _register_slider_commands(prefix, mode_key, execute)
+        _register_definitions(
+            registry.get_tool_definitions(),
+            registry.get_section_definitions(),
+        )
 
         for kind in connect_entries.SOURCES:
             for entry in connect_entries.load_entries(kind):
@@ -231,6 +284,11 @@ def _discover_commands() -> None:
         _DISCOVERY_IN_PROGRESS = False
 
 def has_command(name: str) -> bool:
+    if not _DISCOVERY_COMPLETE:
+        from TheKeyMachine.tools import registry
+
+        if registry.manifest_command_package(name):
+            return True
     _discover_commands()
     return name in _COMMANDS
 
@@ -242,14 +300,14 @@ def list_commands() -> list[str]:
 
 def operation_policy(name: str) -> OperationPolicy:
     """Return the standardized execution policy for a registered command."""
-    _discover_commands()
+    _ensure_command(name)
     command = _COMMANDS.get(name)
     return command.policy if command else OperationPolicy()
 
 
 def execute_command(name: str, *args, **kwargs):
     """Execute a discovered command through its standardized operation."""
-    _discover_commands()
+    _ensure_command(name)
     command = _COMMANDS.get(name)
     if command:
         return command.dispatch(*args, **kwargs)
@@ -11,15 +11,26 @@ from .context import (
 )
 from .curves import (
     apply_key_tangent_snapshot,
+    apply_key_tangent_snapshots,
     apply_weighted_tangents,
     apply_curve_shape,
     bouncy_tangent_angles,
     capture_curve_shape,
+    curve_key_data,
+    curve_tangent_snapshots,
     detail_priority_with_scores,
+    key_data,
     key_tangent_snapshots,
     sample_times,
 )
-from .graph import LayerGraph, layer_graph, root_layer_name, scene_layer_objects
+from .graph import (
+    LayerGraph,
+    LayerOwnershipIndex,
+    layer_graph,
+    layer_ownership_index,
+    root_layer_name,
+    scene_layer_objects,
+)
 from .layers import (
     AnimationLayer,
     BASE_LAYER_ID,
@@ -32,3 +43,4 @@ from .layers import (
     scene_layer_names,
     weight_curves,
 )
+from .sampled import SampledCurve
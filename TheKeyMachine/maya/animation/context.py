@@ -8,6 +8,7 @@ from maya import cmds
 
 from TheKeyMachine.maya import selection
 from TheKeyMachine.ui.widgets import timeline
+from . import curves, keys
 from .layers import (
     LayerContext,
     layer_cache,
@@ -63,54 +64,41 @@ class ToolContext(dict):
     def has_graph_keys(self):
         return bool(self.get("has_graph_keys"))
 
+    @property
+    def selected_keys_by_curve(self):
+        grouped = self.get("selected_keys_by_curve")
+        if grouped is None:
+            grouped = keys.group_by_curve(self.selected_keys)
+            self["selected_keys_by_curve"] = grouped
+        return grouped
+
+    def _time_range(self):
+        if self.time and self.time.mode in ("current_frame", "time_slider_range"):
+            return self.time.timerange
+        return None
+
     def key_times(self, curve):
         if self.time and self.time.mode == "graph_editor_keys":
-            selected = [
-                float(key_time)
-                for selected_curve, key_time in self.selected_keys
-                if selected_curve == curve
-            ]
-            return selected or selected_key_times(curve)
+            return list(self.selected_keys_by_curve.get(curve) or ()) or selected_key_times(curve)
 
         query = {"query": True, "timeChange": True}
-        if self.time and self.time.mode in ("current_frame", "time_slider_range"):
-            query["time"] = self.time.timerange
+        time_range = self._time_range()
+        if time_range is not None:
+            query["time"] = time_range
         try:
             return cmds.keyframe(curve, **query) or []
         except _COMMAND_ERRORS:
             return []
 
-    def key_data(self, curve):
+    def key_arrays(self, curve):
+        """``(times, values)`` arrays of the keys this operation targets on *curve*."""
         if self.time and self.time.mode == "graph_editor_keys":
-            data = []
-            for key_time in self.key_times(curve):
-                try:
-                    values = cmds.keyframe(
-                        curve,
-                        query=True,
-                        time=(key_time, key_time),
-                        valueChange=True,
-                    ) or []
-                except _COMMAND_ERRORS:
-                    values = []
-                if values:
-                    data.append((float(key_time), float(values[0])))
-            return data
+            return curves.key_data(curve, key_times=self.key_times(curve))
+        return curves.key_data(curve, time_range=self._time_range())
 
-        query = {"query": True}
-        if self.time and self.time.mode in ("current_frame", "time_slider_range"):
-            query["time"] = self.time.timerange
-        try:
-            times = cmds.keyframe(curve, timeChange=True, **query) or []
-            values = cmds.keyframe(curve, valueChange=True, **query) or []
-        except _COMMAND_ERRORS:
-            return []
-        if len(times) != len(values):
-            return []
-        return [
-            (float(key_time), float(value))
-            for key_time, value in zip(times, values)
-        ]
+    def key_data(self, curve):
+        times, values = self.key_arrays(curve)
+        return list(zip(times, values))
 
     def curves_for_plugs(self, plugs):
         plugs = list(dict.fromkeys(plug for plug in plugs or [] if plug))
@@ -345,6 +333,7 @@ def resolve_context(
         "selected_channels": selected_channels,
         "selected_curves": selected_curves,
         "selected_keyframes": selected_keyframes,
+        "selected_keys_by_curve": keys.group_by_curve(selected_keyframes),
         "time_context": time_context,
         "source": source,
         "has_graph_keys": bool(selected_keyframes),
@@ -3,10 +3,22 @@
 from __future__ import annotations
 
 import math
+from array import array
 
 from maya import cmds
 
+try:
+    from maya.api import OpenMaya as om
+    from maya.api import OpenMayaAnim as oma
+except ImportError:
+    om = None
+    oma = None
+
+from TheKeyMachine.maya import api_undo
 from TheKeyMachine.maya import maya_api
+from TheKeyMachine.maya.animation import hermite
+from TheKeyMachine.maya.animation import keys
+from TheKeyMachine.maya.animation import tangents
 
 
 _COMMAND_ERRORS = (RuntimeError, ValueError, TypeError, AttributeError, KeyError, IndexError)
@@ -39,11 +51,60 @@ def _query_tangents(curve, time_range, flags):
     return values
 
 
+def _tangent_curve_fn(curve):
+    """MFnAnimCurve for the batched tangent path, or None for the commands path."""
+    if om is None or not curve:
+        return None
+    fn = maya_api.anim_curve_fn(curve)
+    if fn is None:
+        return None
+    try:
+        if fn.isUnitlessInput:
+            return None
+    except Exception:
+        return None
+    return fn
+
+
+def _api_tangent_type(name):
+    attribute = tangents.API_TYPE_NAMES.get(name)
+    if oma is None or not attribute:
+        return None
+    return getattr(oma.MFnAnimCurve, attribute, None)
+
+
+def curve_tangent_snapshots(curve, key_times):
+    """Capture tangent data for *key_times* on *curve* in one MFnAnimCurve pass.
+
+    Returns the same snapshots as ``key_tangent_snapshots``, or None when
+    *curve* is not an anim curve node the API can read (a plug, a driven
+    key curve), leaving the caller to query through commands.
+    """
+    fn = _tangent_curve_fn(curve)
+    if fn is None:
+        return None
+    tangent_types = {}
+    try:
+        for flag in tangents.TYPE_FLAGS:
+            tangent_types[flag] = cmds.keyTangent(curve, query=True, **{flag: True}) or []
+        return tangents.read_snapshots(
+            fn,
+            [float(value) for value in key_times or []],
+            maya_api.time_unit(),
+            tangent_types,
+        )
+    except Exception:
+        return None
+
+
 def key_tangent_snapshots(curve, key_times):
-    """Capture tangent data, batching Maya queries whenever keys align."""
+    """Capture tangent data in one API pass, else batching Maya queries whenever keys align."""
     key_times = [float(value) for value in key_times or []]
     if not curve or not key_times:
         return []
+    snapshots = curve_tangent_snapshots(curve, key_times)
+    if snapshots is not None:
+        return snapshots
     snapshots = [{} for _time in key_times]
     time_range = (min(key_times), max(key_times))
     try:
@@ -115,9 +176,59 @@ def apply_key_tangent_snapshot(
     attribute=None,
 ):
     """Restore one tangent snapshot without locks discarding its details."""
-    if not curve or not snapshot:
+    return apply_key_tangent_snapshots(
+        curve,
+        [(key_time, snapshot)],
+        apply_weighted=apply_weighted,
+        attribute=attribute,
+    )
+
+
+def apply_key_tangent_snapshots(curve, snapshots, apply_weighted=True, attribute=None):
+    """Restore ``(key_time, snapshot)`` pairs on *curve* in one MFnAnimCurve pass.
+
+    Same result as ``apply_key_tangent_snapshot`` for each pair in order,
+    committed as one undoable change. Plugs, *attribute* targets, driven
+    key curves and tangent types the API has no constant for take the
+    per-key ``keyTangent`` edits instead.
+    """
+    snapshots = [(float(key_time), snapshot) for key_time, snapshot in snapshots or () if snapshot]
+    if not curve or not snapshots:
         return False
+    if attribute is None and _apply_tangent_snapshots_api(curve, snapshots, apply_weighted):
+        return True
+    for key_time, snapshot in snapshots:
+        _apply_key_tangent_snapshot_commands(curve, key_time, snapshot, apply_weighted, attribute)
+    return True
 
+
+def _apply_tangent_snapshots_api(curve, snapshots, apply_weighted):
+    fn = _tangent_curve_fn(curve)
+    if fn is None:
+        return False
+    change = api_undo.begin()
+    if change is None:
+        return False
+    try:
+        applied = tangents.restore_snapshots(
+            fn,
+            snapshots,
+            maya_api.time_unit(),
+            lambda degrees: om.MAngle(degrees, om.MAngle.kDegrees),
+            _api_tangent_type,
+            apply_weighted=apply_weighted,
+            change=change,
+        )
+    except Exception:
+        api_undo.rollback(change)
+        return False
+    if applied and api_undo.commit(change):
+        return True
+    api_undo.rollback(change)
+    return False
+
+
+def _apply_key_tangent_snapshot_commands(curve, key_time, snapshot, apply_weighted, attribute):
     def edit(**values):
         if not values:
             return
@@ -167,11 +278,139 @@ def apply_key_tangent_snapshot(
     return True
 
 
+def curve_key_data(curve, key_times=None, time_range=None):
+    """Read key times and values of *curve* in one MFnAnimCurve pass.
+
+    Returns ``keys.read_keys``'s ``(times, values)`` arrays, or None when
+    *curve* is not an anim curve node the API can read, leaving the caller
+    to query through commands.
+    """
+    fn = _tangent_curve_fn(curve)
+    if fn is None:
+        return None
+    try:
+        return keys.read_keys(
+            fn,
+            maya_api.time_unit(),
+            maya_api.anim_curve_value_converter(fn),
+            key_times=key_times,
+            time_range=time_range,
+        )
+    except Exception:
+        return None
+
+
+def key_data(curve, key_times=None, time_range=None):
+    """Key times and values of *curve* or a plug as ``(times, values)`` arrays.
+
+    With *key_times* only keys at those times are returned, in that order;
+    otherwise every key, or those inside the inclusive *time_range*. Reads
+    through ``curve_key_data`` when it can, else one ``keyframe`` query
+    spanning the requested keys.
+    """
+    if not curve:
+        return array("d"), array("d")
+    if key_times is not None:
+        key_times = [float(value) for value in key_times]
+        if not key_times:
+            return array("d"), array("d")
+    data = curve_key_data(curve, key_times=key_times, time_range=time_range)
+    if data is not None:
+        return data
+
+    query = {"query": True}
+    if key_times is not None:
+        query["time"] = (min(key_times), max(key_times))
+    elif time_range is not None:
+        query["time"] = tuple(time_range)
+    try:
+        times = cmds.keyframe(curve, timeChange=True, **query) or []
+        values = cmds.keyframe(curve, valueChange=True, **query) or []
+    except _COMMAND_ERRORS:
+        return array("d"), array("d")
+    if len(times) != len(values):
+        return array("d"), array("d")
+    if key_times is None:
+        return array("d", times), array("d", values)
+
+    times = [float(value) for value in times]
+    selected_times = array("d")
+    selected_values = array("d")
+    for key_time in key_times:
+        index = tangents.key_index(times, key_time)
+        if index is not None:
+            selected_times.append(key_time)
+            selected_values.append(values[index])
+    return selected_times, selected_values
+
+
 def evaluate(curve, frame):
     values = cmds.keyframe(curve, query=True, eval=True, time=(frame, frame)) or []
     return float(values[0]) if values else None
 
 
+def curve_evaluator(curve):
+    """Return a memoized ``frame -> value`` evaluator for *curve*.
+
+    Values are in the same command units ``evaluate`` reports, read through
+    the curve's function set, which is resolved once, instead of through one
+    ``keyframe -eval`` per frame. Curves the API can't resolve fall back to
+    ``evaluate``.
+    """
+    values = {}
+    fn = maya_api.anim_curve_fn(curve)
+    if fn is None:
+        def _raw(frame):
+            return evaluate(curve, frame)
+    else:
+        convert = maya_api.anim_curve_value_converter(fn)
+        try:
+            unitless = bool(fn.isUnitlessInput)
+        except Exception:
+            unitless = False
+
+        def _raw(frame):
+            try:
+                position = frame if unitless else maya_api.mtime(frame)
+                return float(convert(fn.evaluate(position)))
+            except Exception:
+                return None
+
+    def _evaluate(frame):
+        frame = float(frame)
+        if frame not in values:
+            values[frame] = _raw(frame)
+        return values[frame]
+
+    return _evaluate
+
+
+def _key_tangents_in_range(curve, time_range, flags):
+    """``{key time: {flag: value}}`` for every key in *time_range*, one query per flag."""
+    try:
+        key_times = [
+            float(frame)
+            for frame in cmds.keyframe(curve, query=True, time=time_range, timeChange=True) or []
+        ]
+    except _COMMAND_ERRORS:
+        key_times = []
+    tangents = {frame: {} for frame in key_times}
+    for flag in flags:
+        try:
+            values = cmds.keyTangent(curve, query=True, time=time_range, **{flag: True}) or []
+        except _COMMAND_ERRORS:
+            values = []
+        if len(values) != len(key_times):
+            # A flag that doesn't report one value per key can't be aligned.
+            return {
+                frame: _query_tangents(curve, (frame, frame), flags)
+                for frame in key_times
+            }
+        for frame, value in zip(key_times, values):
+            tangents[frame][flag] = value
+    return tangents
+
+
 def sample_times(start, end, interval):
     start = float(start)
     end = float(end)
@@ -235,14 +474,11 @@ def fit_hermite_span(curve, start, end, start_value, end_value):
         return 0.0, 0.0
 
     original_keys = cmds.keyframe(curve, query=True, time=(start, end), timeChange=True) or []
-    count = max(9, int(math.ceil(duration * 4.0)) + 1)
-    times = {float(start) + duration * index / float(count - 1) for index in range(1, count - 1)}
+    times = set(hermite.probe_frames(start, end))
     times.update(float(frame) for frame in original_keys if start < float(frame) < end)
 
-    samples = [
-        (frame, evaluate(curve, frame))
-        for frame in sorted(times)
-    ]
+    value_at = curve_evaluator(curve)
+    samples = [(frame, value_at(frame)) for frame in sorted(times)]
     return _fit_hermite_samples(
         start,
         end,
@@ -254,30 +490,14 @@ def fit_hermite_span(curve, start, end, start_value, end_value):
 
 def _fit_hermite_samples(start, end, start_value, end_value, samples):
     """Fit endpoint slopes to already sampled values."""
-    duration = float(end) - float(start)
-    if duration <= 0:
-        return 0.0, 0.0
-    aa = ab = bb = ar = br = 0.0
-    for frame, value in samples:
-        u = (frame - float(start)) / duration
-        u2 = u * u
-        u3 = u2 * u
-        h00 = 2.0 * u3 - 3.0 * u2 + 1.0
-        h01 = -2.0 * u3 + 3.0 * u2
-        a = duration * (u3 - 2.0 * u2 + u)
-        b = duration * (u3 - u2)
-        residual = value - (h00 * start_value + h01 * end_value)
-        aa += a * a
-        ab += a * b
-        bb += b * b
-        ar += a * residual
-        br += b * residual
-
-    determinant = aa * bb - ab * ab
-    if abs(determinant) <= 1e-12:
-        secant = (end_value - start_value) / duration
-        return secant, secant
-    return (ar * bb - br * ab) / determinant, (br * aa - ar * ab) / determinant
+    return hermite.fit_samples(
+        start,
+        end,
+        start_value,
+        end_value,
+        [frame for frame, _value in samples],
+        [value for _frame, value in samples],
+    )
 
 
 def detail_priority_with_scores(curve, key_times):
@@ -292,13 +512,7 @@ def detail_priority_with_scores(curve, key_times):
     frames = sorted(set(float(frame) for frame in key_times))
     if len(frames) <= 2:
         return [], {}
-    values = {}
-
-    def _value(frame):
-        frame = float(frame)
-        if frame not in values:
-            values[frame] = evaluate(curve, frame)
-        return values[frame]
+    _value = curve_evaluator(curve)
 
     def _span_candidate(first_index, last_index):
         if last_index - first_index <= 1:
@@ -315,46 +529,43 @@ def detail_priority_with_scores(curve, key_times):
         if not interior_indices:
             return None
 
-        sample_count = max(9, int(math.ceil((end - start) * 4.0)) + 1)
-        probe_times = {
-            start + (end - start) * index / float(sample_count - 1)
-            for index in range(1, sample_count - 1)
-        }
+        probe_times = set(hermite.probe_frames(start, end))
         probe_times.update(frames[index] for index in interior_indices)
-        samples = []
+        sample_frames = []
+        sampled_values = []
         for frame in sorted(probe_times):
             value = _value(frame)
             if value is None:
                 continue
-            samples.append((frame, value))
-        if not samples:
+            sample_frames.append(frame)
+            sampled_values.append(value)
+        if not sample_frames:
             return None
 
-        start_slope, end_slope = _fit_hermite_samples(
+        start_slope, end_slope = hermite.fit_samples(
             start,
             end,
             start_value,
             end_value,
-            samples,
+            sample_frames,
+            sampled_values,
         )
-        duration = end - start
-
-        deviations = []
-        sampled_values = []
-        for frame, value in samples:
-            sampled_values.append(value)
-            ratio = (frame - start) / (end - start)
-            ratio2 = ratio * ratio
-            ratio3 = ratio2 * ratio
-            tendency_value = (
-                (2.0 * ratio3 - 3.0 * ratio2 + 1.0) * start_value
-                + (-2.0 * ratio3 + 3.0 * ratio2) * end_value
-                + duration * (ratio3 - 2.0 * ratio2 + ratio) * start_slope
-                + duration * (ratio3 - ratio2) * end_slope
+        deviation, center_bias, detail_time = max(
+            zip(
+                hermite.deviations(
+                    start,
+                    end,
+                    start_value,
+                    end_value,
+                    start_slope,
+                    end_slope,
+                    sample_frames,
+                    sampled_values,
+                ),
+                (-abs(frame - midpoint) for frame in sample_frames),
+                sample_frames,
             )
-            deviations.append((abs(value - tendency_value), -abs(frame - midpoint), frame))
-
-        deviation, center_bias, detail_time = max(deviations)
+        )
         value_scale = max(
             max(sampled_values + [start_value, end_value]) - min(sampled_values + [start_value, end_value]),
             abs(end_value - start_value),
@@ -391,34 +602,29 @@ def detail_priority_with_scores(curve, key_times):
 
 
 def capture_curve_shape(curves, target_times):
-    """Capture values and fitted broken tangent rotations at target times."""
+    """Capture values and fitted broken tangent rotations at target times.
+
+    Per curve: one tangent query per flag over the target range, one
+    function-set evaluation per distinct sample time, and a single
+    ``hermite.fit_spans`` pass over every span between the captured times.
+    """
     result = {}
     target_times = sorted(set(float(frame) for frame in target_times))
+    if not target_times:
+        return result
+    time_range = (target_times[0], target_times[-1])
     for curve in dict.fromkeys(curves or []):
+        existing = _key_tangents_in_range(
+            curve,
+            time_range,
+            ("inTangentType", "outTangentType", "inAngle", "outAngle", "lock"),
+        )
+        value_at = curve_evaluator(curve)
         samples = {}
-        existing_times = set(
-            float(frame)
-            for frame in (
-                cmds.keyframe(
-                    curve,
-                    query=True,
-                    time=(target_times[0], target_times[-1]),
-                    timeChange=True,
-                ) or []
-            )
-        ) if target_times else set()
         for frame in target_times:
-            value = evaluate(curve, frame)
+            value = value_at(frame)
             if value is not None:
-                if frame in existing_times:
-                    time_range = (frame, frame)
-                    tangent = _query_tangents(
-                        curve,
-                        time_range,
-                        ("inTangentType", "outTangentType", "inAngle", "outAngle", "lock"),
-                    )
-                else:
-                    tangent = {}
+                tangent = existing.get(frame) or {}
                 samples[frame] = {
                     "value": value,
                     "in_angle": None,
@@ -431,84 +637,166 @@ def capture_curve_shape(curves, target_times):
                 }
 
         frames = sorted(samples)
+        if not frames:
+            continue
+        probes = set(existing)
         for start, end in zip(frames, frames[1:]):
-            out_slope, in_slope = fit_hermite_span(
-                curve, start, end, samples[start]["value"], samples[end]["value"]
-            )
+            probes.update(hermite.probe_frames(start, end))
+        probe_frames = []
+        probe_values = []
+        for frame in sorted(probes):
+            value = value_at(frame)
+            if value is not None:
+                probe_frames.append(frame)
+                probe_values.append(value)
+        out_slopes, in_slopes = hermite.fit_spans(
+            frames,
+            [samples[frame]["value"] for frame in frames],
+            probe_frames,
+            probe_values,
+        )
+        for start, end, out_slope, in_slope in zip(frames, frames[1:], out_slopes, in_slopes):
             samples[start]["out_angle"] = math.degrees(math.atan(out_slope))
             samples[end]["in_angle"] = math.degrees(math.atan(in_slope))
 
-        if frames:
-            first = samples[frames[0]]
-            last = samples[frames[-1]]
-            first["in_angle"] = first["out_angle"] if first["out_angle"] is not None else 0.0
-            last["out_angle"] = last["in_angle"] if last["in_angle"] is not None else 0.0
-            result[curve] = samples
+        first = samples[frames[0]]
+        last = samples[frames[-1]]
+        first["in_angle"] = first["out_angle"] if first["out_angle"] is not None else 0.0
+        last["out_angle"] = last["in_angle"] if last["in_angle"] is not None else 0.0
+        result[curve] = samples
     return result
 
 
+def _apply_curve_samples(fn, samples, set_values, preserve_tangent_types, change, unweight=False):
+    """Write one curve's captured samples through its function set.
+
+    Key indices are resolved in one pass over the curve, keys missing at
+    sample frames are added together, and values and fixed tangents are
+    then set per key on *change*. Raises on a rejected edit.
+    """
+    unit = maya_api.time_unit()
+    to_internal = maya_api.anim_curve_internal_value_converter(fn)
+
+    def _index_by_slot():
+        count = fn.numKeys() if callable(fn.numKeys) else fn.numKeys
+        return {
+            round(float(fn.input(index).asUnits(unit)), 6): index
+            for index in range(count)
+        }
+
+    indices = _index_by_slot()
+    missing = [frame for frame in sorted(samples) if round(float(frame), 6) not in indices]
+    if missing:
+        fn.addKeys(
+            om.MTimeArray([maya_api.mtime(frame) for frame in missing]),
+            om.MDoubleArray([fn.evaluate(maya_api.mtime(frame)) for frame in missing]),
+            keepExistingKeys=True,
+            change=change,
+        )
+        indices = _index_by_slot()
+    if unweight and fn.isWeighted:
+        fn.setIsWeighted(False, change=change)
+    for frame, sample in samples.items():
+        index = indices.get(round(float(frame), 6))
+        if index is None:
+            continue
+        if set_values:
+            fn.setValue(index, to_internal(sample["value"]), change=change)
+        if not preserve_tangent_types:
+            maya_api.set_anim_curve_tangents_by_index(
+                fn,
+                index,
+                sample["in_angle"],
+                sample["out_angle"],
+                change=change,
+            )
+
+
 def apply_curve_shape(
     shape_data,
     set_values=True,
     change=None,
     preserve_tangent_types=False,
 ):
-    """Apply captured values and fitted tangent rotations to existing curves."""
-    for curve, samples in (shape_data or {}).items():
-        if not cmds.objExists(curve):
-            continue
-        curve_fn = maya_api.anim_curve_fn(curve) if change is not None else None
-        if curve_fn is not None:
-            for frame, sample in samples.items():
-                index = maya_api.anim_curve_key_index(curve_fn, frame)
-                if index is None:
-                    index = maya_api.add_anim_curve_key(curve_fn, frame, change=change)
-                if set_values:
-                    curve_value = maya_api.anim_curve_attr_value_to_curve_value(
-                        curve, sample["value"]
-                    )
-                    maya_api.set_anim_curve_value_by_index(
-                        curve_fn, index, curve_value, change=change
-                    )
-                if not preserve_tangent_types:
-                    maya_api.set_anim_curve_tangents(
-                        curve_fn,
-                        frame,
-                        sample["in_angle"],
-                        sample["out_angle"],
-                        change=change,
-                    )
-            continue
-        if not preserve_tangent_types:
-            try:
-                cmds.keyTangent(curve, edit=True, weightedTangents=False)
-            except (RuntimeError, ValueError, TypeError):
-                pass
-        for frame, sample in samples.items():
+    """Apply captured values and fitted tangent rotations to existing curves.
+
+    With *change*, edits go through the curves' function sets on that
+    change. Otherwise fitted tangents are written per curve in one API batch
+    under a change committed to the undo queue; rotating only preserved
+    fixed tangents, or a curve the API can't write, takes the command path.
+    """
+    shape_data = shape_data or {}
+    own_change = None
+    if change is None and not preserve_tangent_types and shape_data:
+        own_change = api_undo.begin()
+    active_change = change if change is not None else own_change
+
+    command_curves = []
+    try:
+        for curve, samples in shape_data.items():
+            if not cmds.objExists(curve):
+                continue
+            curve_fn = maya_api.anim_curve_fn(curve) if active_change is not None else None
+            if curve_fn is None:
+                command_curves.append(curve)
+                continue
             try:
-                if set_values:
-                    cmds.setKeyframe(curve, time=(frame,), value=sample["value"])
-                if preserve_tangent_types:
-                    _apply_preserved_tangent_rotation(curve, frame, sample)
-                    continue
-                cmds.keyTangent(
-                    curve,
-                    edit=True,
-                    time=(frame, frame),
-                    lock=False,
-                    inTangentType="fixed",
-                    outTangentType="fixed",
-                )
-                cmds.keyTangent(
-                    curve,
-                    edit=True,
-                    time=(frame, frame),
-                    absolute=True,
-                    inAngle=sample["in_angle"],
-                    outAngle=sample["out_angle"],
+                _apply_curve_samples(
+                    curve_fn,
+                    samples,
+                    set_values,
+                    preserve_tangent_types,
+                    active_change,
+                    unweight=own_change is not None,
                 )
-            except (RuntimeError, ValueError, TypeError):
+            except Exception:
+                if own_change is not None:
+                    raise
+    except Exception:
+        # The shared change can't be rolled back per curve: undo all of it
+        # and redo every curve through commands.
+        api_undo.rollback(own_change)
+        own_change = None
+        command_curves = [curve for curve in shape_data if cmds.objExists(curve)]
+    if own_change is not None and not api_undo.commit(own_change):
+        api_undo.rollback(own_change)
+        command_curves = [curve for curve in shape_data if cmds.objExists(curve)]
+
+    for curve in command_curves:
+        _apply_curve_samples_commands(curve, shape_data[curve], set_values, preserve_tangent_types)
+
+
+def _apply_curve_samples_commands(curve, samples, set_values, preserve_tangent_types):
+    if not preserve_tangent_types:
+        try:
+            cmds.keyTangent(curve, edit=True, weightedTangents=False)
+        except (RuntimeError, ValueError, TypeError):
+            pass
+    for frame, sample in samples.items():
+        try:
+            if set_values:
+                cmds.setKeyframe(curve, time=(frame,), value=sample["value"])
+            if preserve_tangent_types:
+                _apply_preserved_tangent_rotation(curve, frame, sample)
                 continue
+            cmds.keyTangent(
+                curve,
+                edit=True,
+                time=(frame, frame),
+                lock=False,
+                inTangentType="fixed",
+                outTangentType="fixed",
+            )
+            cmds.keyTangent(
+                curve,
+                edit=True,
+                time=(frame, frame),
+                absolute=True,
+                inAngle=sample["in_angle"],
+                outAngle=sample["out_angle"],
+            )
+        except (RuntimeError, ValueError, TypeError):
+            continue
 
 
 def _angle_changed(original, fitted, tolerance=0.1):
@@ -103,6 +103,11 @@ def _layer_name(layer):
 
 
 def _curve_from_blend_input(plug, blend_node, root):
+    curve = _curve_node_from_blend_input(plug, blend_node, root)
+    return maya_api.mobject_name(curve) if curve is not None else None
+
+
+def _curve_node_from_blend_input(plug, blend_node, root):
     try:
         input_plug = maya_api.dependency_node_fn(blend_node).findPlug(
             "ia" if root else "ib",
@@ -129,7 +134,7 @@ def _curve_from_blend_input(plug, blend_node, root):
     try:
         curve = input_plug.source().node()
         if curve and curve.apiType() in _ANIM_CURVE_TYPES:
-            return maya_api.mobject_name(curve)
+            return curve
     except Exception:
         pass
     return None
@@ -182,6 +187,274 @@ def _layer_curves(plug, scene_layers):
     return curves
 
 
+def _handle_name(handle):
+    if handle is None or not handle.isValid():
+        return None
+    return maya_api.mobject_name(handle.object())
+
+
+def _plug_key(plug):
+    return (
+        int(om.MObjectHandle(plug.node()).hashCode()),
+        plug.partialName(useLongNames=True, useFullAttributePath=True),
+    )
+
+
+def _driving_plug(plug):
+    """Source of *plug*, or of its parent when only the compound is connected."""
+    try:
+        source = plug.source()
+        if source.isNull and plug.isChild:
+            source = plug.parent().source()
+    except Exception:
+        return None
+    return None if source.isNull else source
+
+
+def _chain_source(input_plug):
+    """Upstream plug feeding a blend input, compound or per child."""
+    source = input_plug.source()
+    if source.isNull and input_plug.isCompound:
+        for index in range(input_plug.numChildren()):
+            child_source = input_plug.child(index).source()
+            if not child_source.isNull:
+                return child_source
+    return source
+
+
+def _output_destinations(output):
+    """Plugs fed by a blend output, expanding compound connections to children."""
+    destinations = []
+    plugs = [output]
+    if output.isCompound:
+        plugs.extend(output.child(index) for index in range(output.numChildren()))
+    for plug in plugs:
+        for destination in plug.destinations():
+            destinations.append(destination)
+            if destination.isCompound:
+                destinations.extend(
+                    destination.child(index)
+                    for index in range(destination.numChildren())
+                )
+    return destinations
+
+
+class LayerOwnershipIndex(object):
+    """Map every layered plug to its blend chain in one walk of the scene.
+
+    Each ``animBlendNodeBase`` is read once: the index keeps, per plug the
+    top blend of a chain drives, the root curve and the ``(layer, curve)``
+    pairs down that chain as ``MObjectHandle``s, so renames never go stale
+    and names resolve at lookup. DAG changes, layer events, undo/redo and
+    scene changes reported through the RuntimeManager drop the index; a
+    lookup whose plug is no longer driven by its recorded blend, whose
+    chain lost a node, or whose empty layer input has since been keyed,
+    rebuilds it once.
+    """
+
+    RUNTIME_KEY = "animation_layer_ownership_index"
+    LAYER_EVENTS = ("animLayerRebuild", "animLayerRefresh", "AnimLayerAdded", "AnimLayerRemoved", "Undo", "Redo")
+
+    def __init__(self):
+        # plug key -> (top blend handle, root curve handle,
+        #              ((layer handle, curve handle, blend handle), ...), root blend handle)
+        self._entries = None
+        # Keys still unresolved right after a rebuild: answered by the graph
+        # walk until the next build instead of rebuilding on every lookup.
+        self._misses = set()
+        self._manager = None
+
+    def invalidate(self, *_args):
+        self._entries = None
+
+    def _watch(self):
+        try:
+            from TheKeyMachine.core import runtime
+
+            manager = runtime.get_existing_runtime_manager()
+        except Exception:
+            manager = None
+        if manager is None or manager is self._manager:
+            return
+        self._manager = manager
+        manager.add_dag_change_callback(self.invalidate, key=self.RUNTIME_KEY)
+        for event_name in self.LAYER_EVENTS:
+            manager.add_scriptjob(event=event_name, key=self.RUNTIME_KEY, callback=self.invalidate)
+        manager.connect_signal(manager.scene_opened, self.invalidate, key=self.RUNTIME_KEY + ":open")
+        manager.connect_signal(manager.scene_new, self.invalidate, key=self.RUNTIME_KEY + ":new")
+
+    def _blend_records(self):
+        try:
+            names = cmds.ls(type="animBlendNodeBase") or []
+        except _COMMAND_ERRORS:
+            names = []
+        records = {}
+        for name in names:
+            blend = maya_api.mobject_from_node(name)
+            if blend is None or blend.apiType() not in _BLEND_NODE_TYPES:
+                continue
+            try:
+                node = maya_api.dependency_node_fn(blend)
+                layer = node.findPlug("wa", True).source()
+                records[int(om.MObjectHandle(blend).hashCode())] = (
+                    blend,
+                    None if layer.isNull else om.MObjectHandle(layer.node()),
+                    node.findPlug("ia", True),
+                    node.findPlug("output", True),
+                )
+            except Exception:
+                continue
+        return records
+
+    def _chain(self, records, plug, top):
+        root_curve = None
+        root_blend = None
+        layers = []
+        blend = top
+        visited = set()
+        while blend is not None:
+            hash_code = int(om.MObjectHandle(blend).hashCode())
+            record = records.get(hash_code)
+            if record is None or hash_code in visited:
+                break
+            visited.add(hash_code)
+            _blend, layer, input_a, _output = record
+            layers.append((
+                layer,
+                _curve_handle(_curve_node_from_blend_input(plug, blend, False)),
+                om.MObjectHandle(blend),
+            ))
+            try:
+                source = _chain_source(input_a)
+                upstream = None if source.isNull else source.node()
+            except Exception:
+                upstream = None
+            if upstream is not None and upstream.apiType() in _BLEND_NODE_TYPES:
+                blend = upstream
+                continue
+            root_curve = _curve_handle(_curve_node_from_blend_input(plug, blend, True))
+            root_blend = om.MObjectHandle(blend)
+            break
+        return om.MObjectHandle(top), root_curve, tuple(layers), root_blend
+
+    def build(self):
+        """Walk every blend node once and index the plugs their chains drive."""
+        self._watch()
+        self._misses = set()
+        entries = {}
+        if om is None or cmds is None:
+            self._entries = entries
+            return entries
+        records = self._blend_records()
+        for blend, _layer, _input_a, output in records.values():
+            try:
+                destinations = _output_destinations(output)
+            except Exception:
+                continue
+            for destination in destinations:
+                try:
+                    if destination.node().apiType() in _BLEND_NODE_TYPES:
+                        continue
+                    entries[_plug_key(destination)] = self._chain(records, destination, blend)
+                except Exception:
+                    continue
+        self._entries = entries
+        return entries
+
+    def _entry(self, key, driver, plug):
+        if self._entries is None:
+            self.build()
+        entry = self._entries.get(key)
+        if entry is not None and _entry_current(entry, driver, plug):
+            return entry
+        return None
+
+    def layer_curves(self, plug, scene_layers):
+        """``{layer name: curve}`` for MPlug *plug*, as ``_layer_curves`` returns it.
+
+        Plugs driven straight by a blend node are answered from the index;
+        plugs behind other nodes (pair blends, conversions) keep the
+        upstream graph walk.
+        """
+        if om is None or plug is None or not scene_layers:
+            return {}
+        source = _driving_plug(plug)
+        if source is None:
+            return {}
+        driver = source.node()
+        if driver.apiType() in _ANIM_CURVE_TYPES:
+            return {}
+        if driver.apiType() not in _BLEND_NODE_TYPES:
+            return _layer_curves(plug, scene_layers)
+        try:
+            key = _plug_key(plug)
+        except Exception:
+            return _layer_curves(plug, scene_layers)
+        entry = self._entry(key, driver, plug)
+        if entry is None and key not in self._misses:
+            self.build()
+            entry = self._entry(key, driver, plug)
+            if entry is None:
+                self._misses.add(key)
+        if entry is None:
+            return _layer_curves(plug, scene_layers)
+
+        root_name = _layer_name(scene_layers[0])
+        layer_names = {_layer_name(layer) for layer in scene_layers}
+        _top, root_curve, layers, _root_blend = entry
+        curves = {}
+        if root_name:
+            curve = _handle_name(root_curve)
+            if curve:
+                curves[root_name] = curve
+        seen = set()
+        for layer, curve, _blend in layers:
+            layer_name = _layer_name(layer.object()) if layer is not None and layer.isValid() else None
+            if not layer_name or layer_name == root_name or layer_name not in layer_names:
+                continue
+            if layer_name in seen:
+                continue
+            seen.add(layer_name)
+            curve_name = _handle_name(curve)
+            if curve_name:
+                curves[layer_name] = curve_name
+        return curves
+
+
+def _curve_handle(curve):
+    return om.MObjectHandle(curve) if curve is not None else None
+
+
+def _curve_link_current(plug, blend, root, curve):
+    """Whether the link to *blend*'s input still holds.
+
+    A recorded curve only has to still exist: a fully keyed chain resolves
+    with handle checks alone. An input recorded empty is re-read, since
+    keying that layer for the first time connects a curve to it without any
+    of the index's invalidation events firing.
+    """
+    if curve is not None:
+        return curve.isValid()
+    if blend is None or not blend.isValid():
+        return False
+    return _curve_node_from_blend_input(plug, blend.object(), root) is None
+
+
+def _entry_current(entry, driver, plug):
+    top, root_curve, layers, root_blend = entry
+    if not top.isValid() or top.object() != driver:
+        return False
+    for layer, curve, blend in layers:
+        if layer is not None and not layer.isValid():
+            return False
+        if not _curve_link_current(plug, blend, False, curve):
+            return False
+    return root_blend is None or _curve_link_current(plug, root_blend, True, root_curve)
+
+
+layer_ownership_index = LayerOwnershipIndex()
+
+
 def _unlayered_curve(plug_name):
     if cmds is None:
         return None
@@ -207,6 +480,9 @@ class LayerGraph(object):
         plug = maya_api.mplug_from_name(plug_name)
         if plug is None:
             return []
+        if not plug.isCompound and _driving_plug(plug) is None:
+            # Nothing feeds it, so no layer or unlayered curve can own it.
+            return []
         if scene_layers is None:
             scene_layers = scene_layer_objects()
         if not scene_layers:
@@ -214,7 +490,7 @@ class LayerGraph(object):
             return [{"layer": None, "curve": curve, "root": True}] if curve else []
 
         root_layer = scene_layers[0]
-        layer_curves = _layer_curves(plug, scene_layers)
+        layer_curves = layer_ownership_index.layer_curves(plug, scene_layers)
         try:
             source = plug.source().node()
             direct_curve = (
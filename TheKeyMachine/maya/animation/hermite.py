@@ -0,0 +1,194 @@
+"""Cubic Hermite span fitting for curve-shape capture and simplification.
+
+Pure math: no Maya imports, so benchmarks can load this directly. A span
+from ``start`` to ``end`` keeps its endpoint values and gets the endpoint
+slopes (value per frame) that best fit the samples strictly inside it, by
+least squares. ``fit_spans`` fits every span of a curve at once -- through
+NumPy when it is importable, plain Python loops over the same samples
+otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DEGENERATE = 1e-12
+# Below this many samples a single span is cheaper in plain Python than the
+# cost of building NumPy arrays for it.
+NUMPY_MIN_SAMPLES = 48
+
+
+def probe_frames(start, end):
+    """Evenly spaced frames strictly inside a span: at least 9, four per frame."""
+    duration = float(end) - float(start)
+    if duration <= 0:
+        return []
+    count = max(9, int(math.ceil(duration * 4.0)) + 1)
+    return [float(start) + duration * index / float(count - 1) for index in range(1, count - 1)]
+
+
+def _secant(start, end, start_value, end_value):
+    secant = (end_value - start_value) / (float(end) - float(start))
+    return secant, secant
+
+
+def _solve(aa, ab, bb, ar, br):
+    determinant = aa * bb - ab * ab
+    if abs(determinant) <= DEGENERATE:
+        return None
+    return (ar * bb - br * ab) / determinant, (br * aa - ar * ab) / determinant
+
+
+def fit_samples(start, end, start_value, end_value, frames, values):
+    """``(out_slope, in_slope)`` of one span fitted to ``frames``/``values``."""
+    if float(end) - float(start) <= 0:
+        return 0.0, 0.0
+    if numpy is not None and len(frames) >= NUMPY_MIN_SAMPLES:
+        out_slopes, in_slopes = fit_spans((start, end), (start_value, end_value), frames, values)
+        return out_slopes[0], in_slopes[0]
+    return _fit_python(start, end, start_value, end_value, frames, values)
+
+
+def _fit_python(start, end, start_value, end_value, frames, values):
+    duration = float(end) - float(start)
+    if duration <= 0:
+        return 0.0, 0.0
+    start = float(start)
+    aa = ab = bb = ar = br = 0.0
+    for frame, value in zip(frames, values):
+        u = (frame - start) / duration
+        u2 = u * u
+        u3 = u2 * u
+        h00 = 2.0 * u3 - 3.0 * u2 + 1.0
+        h01 = -2.0 * u3 + 3.0 * u2
+        a = duration * (u3 - 2.0 * u2 + u)
+        b = duration * (u3 - u2)
+        residual = value - (h00 * start_value + h01 * end_value)
+        aa += a * a
+        ab += a * b
+        bb += b * b
+        ar += a * residual
+        br += b * residual
+    solved = _solve(aa, ab, bb, ar, br)
+    return solved if solved is not None else _secant(start, end, start_value, end_value)
+
+
+def fit_spans(knots, knot_values, frames, values):
+    """Fit every span between consecutive *knots* in one pass.
+
+    *knots* are sorted. *frames*/*values* may hold samples for all spans
+    together; each sample counts toward the span whose open interval
+    contains it, and samples on a knot or outside the knots are ignored.
+    Returns parallel ``(out_slopes, in_slopes)`` lists, one per span.
+    """
+    span_count = len(knots) - 1
+    if span_count <= 0:
+        return [], []
+    if numpy is not None:
+        return _fit_spans_numpy(knots, knot_values, frames, values)
+
+    if any(later < earlier for earlier, later in zip(frames, frames[1:])):
+        pairs = sorted(zip(frames, values))
+        frames = [frame for frame, _value in pairs]
+        values = [value for _frame, value in pairs]
+    out_slopes = []
+    in_slopes = []
+    for span in range(span_count):
+        start, end = knots[span], knots[span + 1]
+        first = bisect_right(frames, start)
+        stop = max(first, bisect_left(frames, end))
+        slopes = _fit_python(
+            start,
+            end,
+            knot_values[span],
+            knot_values[span + 1],
+            frames[first:stop],
+            values[first:stop],
+        )
+        out_slopes.append(slopes[0])
+        in_slopes.append(slopes[1])
+    return out_slopes, in_slopes
+
+
+def _fit_spans_numpy(knots, knot_values, frames, values):
+    knots = numpy.asarray(knots, dtype=float)
+    knot_values = numpy.asarray(knot_values, dtype=float)
+    frames = numpy.asarray(frames, dtype=float)
+    values = numpy.asarray(values, dtype=float)
+    span_count = len(knots) - 1
+
+    spans = numpy.searchsorted(knots, frames, side="right") - 1
+    inside = (spans >= 0) & (spans < span_count)
+    spans = spans[inside]
+    frames = frames[inside]
+    values = values[inside]
+    strictly_inside = frames > knots[spans]
+    spans = spans[strictly_inside]
+    frames = frames[strictly_inside]
+    values = values[strictly_inside]
+
+    starts = knots[spans]
+    durations = knots[spans + 1] - starts
+    u = (frames - starts) / durations
+    u2 = u * u
+    u3 = u2 * u
+    a = durations * (u3 - 2.0 * u2 + u)
+    b = durations * (u3 - u2)
+    residual = values - (
+        (2.0 * u3 - 3.0 * u2 + 1.0) * knot_values[spans]
+        + (-2.0 * u3 + 3.0 * u2) * knot_values[spans + 1]
+    )
+
+    def _sum(weights):
+        return numpy.bincount(spans, weights=weights, minlength=span_count)
+
+    aa, ab, bb = _sum(a * a), _sum(a * b), _sum(b * b)
+    ar, br = _sum(a * residual), _sum(b * residual)
+    determinant = aa * bb - ab * ab
+    span_durations = knots[1:] - knots[:-1]
+    solvable = numpy.abs(determinant) > DEGENERATE
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        secant = (knot_values[1:] - knot_values[:-1]) / span_durations
+        out_slopes = numpy.where(solvable, (ar * bb - br * ab) / determinant, secant)
+        in_slopes = numpy.where(solvable, (br * aa - ar * ab) / determinant, secant)
+    flat = span_durations <= 0
+    out_slopes[flat] = 0.0
+    in_slopes[flat] = 0.0
+    return out_slopes.tolist(), in_slopes.tolist()
+
+
+def deviations(start, end, start_value, end_value, start_slope, end_slope, frames, values):
+    """Absolute distance of each sample from the fitted Hermite span."""
+    start = float(start)
+    duration = float(end) - start
+    if numpy is not None and len(frames) >= NUMPY_MIN_SAMPLES:
+        frames = numpy.asarray(frames, dtype=float)
+        ratio = (frames - start) / duration
+        ratio2 = ratio * ratio
+        ratio3 = ratio2 * ratio
+        tendency = (
+            (2.0 * ratio3 - 3.0 * ratio2 + 1.0) * start_value
+            + (-2.0 * ratio3 + 3.0 * ratio2) * end_value
+            + duration * (ratio3 - 2.0 * ratio2 + ratio) * start_slope
+            + duration * (ratio3 - ratio2) * end_slope
+        )
+        return numpy.abs(numpy.asarray(values, dtype=float) - tendency).tolist()
+    result = []
+    for frame, value in zip(frames, values):
+        ratio = (frame - start) / duration
+        ratio2 = ratio * ratio
+        ratio3 = ratio2 * ratio
+        tendency = (
+            (2.0 * ratio3 - 3.0 * ratio2 + 1.0) * start_value
+            + (-2.0 * ratio3 + 3.0 * ratio2) * end_value
+            + duration * (ratio3 - 2.0 * ratio2 + ratio) * start_slope
+            + duration * (ratio3 - ratio2) * end_slope
+        )
+        result.append(abs(value - tendency))
+    return result
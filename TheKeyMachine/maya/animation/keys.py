@@ -0,0 +1,55 @@
+"""Key times and values read in one MFnAnimCurve pass, as compact arrays.
+
+No Maya imports: callers hand in the ``MFnAnimCurve`` (or anything with the
+same methods), the time unit and the converter from internal key values to
+command units, so benchmarks can drive this with a fake curve. Times and
+values come back as parallel ``array('d')`` columns in the units
+``cmds.keyframe`` reports.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from TheKeyMachine.maya.animation import tangents
+
+
+def group_by_curve(selected_keys):
+    """``{curve: [key_time, ...]}`` for ``(curve, key_time)`` pairs, in selection order."""
+    grouped = {}
+    for curve, key_time in selected_keys or ():
+        grouped.setdefault(curve, []).append(float(key_time))
+    return grouped
+
+
+def read_keys(fn, unit, convert=float, key_times=None, time_range=None):
+    """``(times, values)`` arrays for the keys of *fn*.
+
+    With *key_times*, one entry per requested time that has a key, in the
+    requested order and carrying the requested time, as a
+    ``keyframe -time t:t`` query per time would. Otherwise every key, or
+    the keys inside the inclusive *time_range*.
+    """
+    inputs = tangents.key_inputs(fn, unit)
+    if key_times is not None:
+        times = array("d")
+        indices = []
+        for key_time in key_times:
+            key_time = float(key_time)
+            index = tangents.key_index(inputs, key_time)
+            if index is not None:
+                times.append(key_time)
+                indices.append(index)
+    else:
+        if time_range is None:
+            indices = range(len(inputs))
+        else:
+            start, end = (float(value) for value in time_range)
+            indices = range(
+                bisect_left(inputs, start - tangents.TIME_TOLERANCE),
+                bisect_right(inputs, end + tangents.TIME_TOLERANCE),
+            )
+        times = array("d", (inputs[index] for index in indices))
+    values = array("d", (float(convert(fn.value(index))) for index in indices))
+    return times, values
@@ -7,12 +7,28 @@ try:
 except ImportError:
     cmds = None
 
+try:
+    from maya.api import OpenMaya as om
+except ImportError:
+    om = None
+
 from TheKeyMachine.maya import maya_api
 from .graph import layer_graph, root_layer_name, scene_layer_objects
 
 
 BASE_LAYER_ID = "__base__"
 _COMMAND_ERRORS = (RuntimeError, ValueError, TypeError, AttributeError, KeyError, IndexError)
+# Attribute-changed messages that can alter a layer snapshot; evaluation
+# messages from animated weights are not among them.
+_LAYER_CHANGE_MESSAGES = 0
+if om is not None:
+    _LAYER_CHANGE_MESSAGES = (
+        om.MNodeMessage.kAttributeSet
+        | om.MNodeMessage.kConnectionMade
+        | om.MNodeMessage.kConnectionBroken
+        | om.MNodeMessage.kAttributeArrayAdded
+        | om.MNodeMessage.kAttributeArrayRemoved
+    )
 
 
 class LayerContext(dict):
@@ -288,7 +304,26 @@ class AnimationLayer(object):
 
 
 class LayerCache(object):
-    """Current scene layer graph, refreshed at the start of each operation."""
+    """Current scene layer graph, refreshed at the start of each operation.
+
+    ``capture()`` always re-reads the scene. ``tool_context()`` reuses its
+    last scope while ``generation`` is unchanged: attribute-changed
+    callbacks on every layer node and the layer-structure events bump it,
+    so a held nudge or repeated slider clicks stop re-querying every layer.
+    Without a RuntimeManager to deliver those callbacks nothing is reused.
+    """
+
+    RUNTIME_KEY = "animation_layer_cache"
+    ATTRIBUTE_RUNTIME_KEY = "animation_layer_cache:attributes"
+    STRUCTURE_EVENTS = (
+        "animLayerRebuild",
+        "animLayerRefresh",
+        "AnimLayerAdded",
+        "AnimLayerRemoved",
+        "AnimLayerRenamed",
+        "Undo",
+        "Redo",
+    )
 
     def __init__(self):
         self.scene_layers = []
@@ -297,11 +332,59 @@ class LayerCache(object):
         self.unlocked_layers = []
         self.preferred = None
         self.root = AnimationLayer(root=True)
+        self.generation = 0
+        self._scope = None
+        self._manager = None
+        self._watched_layers = None
         # Do NOT call reset() here – module-level instantiation happens at
         # import/reload time, when Maya may refuse cmds.animLayer queries with
         # "Unable to parse the argument list". Data is populated lazily on the
         # first real call to layer_cache.capture().
 
+    def bump(self, *_args):
+        """Mark every cached snapshot stale."""
+        self.generation += 1
+
+    def _on_structure_changed(self, *_args):
+        self._watched_layers = None
+        self.bump()
+
+    def _on_layer_attribute_changed(self, message, *_args):
+        if om is None or message & _LAYER_CHANGE_MESSAGES:
+            self.bump()
+
+    def _watching(self):
+        manager = _existing_runtime_manager()
+        return manager is not None and manager is self._manager
+
+    def _watch(self):
+        """Own the callbacks that bump ``generation`` for the current layers."""
+        manager = _existing_runtime_manager()
+        if manager is None:
+            self._manager = None
+            return
+        if manager is not self._manager:
+            self._manager = manager
+            self._watched_layers = None
+            for event_name in self.STRUCTURE_EVENTS:
+                manager.add_scriptjob(
+                    event=event_name,
+                    key=self.RUNTIME_KEY,
+                    callback=self._on_structure_changed,
+                )
+            manager.connect_signal(manager.scene_opened, self._on_structure_changed, key=self.RUNTIME_KEY + ":open")
+            manager.connect_signal(manager.scene_new, self._on_structure_changed, key=self.RUNTIME_KEY + ":new")
+        layer_names = tuple(layer.name for layer in self.scene_layers if layer.name)
+        if layer_names == self._watched_layers:
+            return
+        manager.disconnect_callbacks(self.ATTRIBUTE_RUNTIME_KEY)
+        manager.add_node_attribute_changed_callbacks(
+            layer_names,
+            self._on_layer_attribute_changed,
+            key=self.ATTRIBUTE_RUNTIME_KEY,
+        )
+        self._watched_layers = layer_names
+
     def reset(self):
         root_name = root_layer_name()
         names = scene_layer_names(include_root=True)
@@ -348,6 +431,7 @@ class LayerCache(object):
 
     def capture(self):
         self.reset()
+        self._watch()
         selected = [layer.layer_id for layer in self.selected_layers]
         selected_unlocked = [
             layer.layer_id for layer in self.selected_unlocked_layers
@@ -373,7 +457,20 @@ class LayerCache(object):
         })
 
     def tool_context(self):
-        """Build the editable layer scope from this cache's current snapshot."""
+        """Build the editable layer scope from this cache's current snapshot.
+
+        While ``generation`` is unchanged the previous scope is reused; each
+        caller gets its own copy, free to annotate (``curve_layers``).
+        """
+        cached = self._scope
+        if cached is not None and cached[0] == self.generation and self._watching():
+            return _copy_scope(cached[1])
+        generation = self.generation
+        scope = self._build_tool_context()
+        self._scope = (generation, scope) if self._watching() else None
+        return _copy_scope(scope)
+
+    def _build_tool_context(self):
         context = self.capture()
         root_name = context.get("root_name")
         layer_data = context.get("layers") or {}
@@ -524,6 +621,36 @@ def _layer_parent(layer_name):
     return None
 
 
+def _existing_runtime_manager():
+    try:
+        from TheKeyMachine.core import runtime
+
+        return runtime.get_existing_runtime_manager()
+    except Exception:
+        return None
+
+
+def _copy_context(context):
+    copied = LayerContext(
+        (key, list(value) if isinstance(value, list) else value)
+        for key, value in context.items()
+    )
+    copied["layers"] = {
+        layer_id: dict(metadata)
+        for layer_id, metadata in (context.get("layers") or {}).items()
+    }
+    return copied
+
+
+def _copy_scope(scope):
+    copied = {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in scope.items()
+    }
+    copied["context"] = _copy_context(scope["context"])
+    return copied
+
+
 layer_cache = LayerCache()
 
 
@@ -0,0 +1,119 @@
+"""Compact sampled curves for timeline overlays.
+
+Pure data: no Maya or Qt imports. A ``SampledCurve`` holds densely
+pre-sampled ``(frame, value)`` data in parallel ``array('d')`` columns so a
+timeline tint can look values up by bisection and redraw from a cached,
+already mapped polyline instead of walking and mapping every sample on
+every repaint.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class SampledCurve:
+    """Sorted frames and values of one sampled curve.
+
+    ``frames`` and ``values`` are parallel ``array('d')`` columns, sorted by
+    frame. Lookups outside the sampled domain clamp to the nearest end.
+    ``polyline`` keeps the last few screen-space mappings, keyed by the
+    visible range and plotting rect, so an unchanged widget size and range
+    reuse the same point list.
+    """
+
+    __slots__ = ("frames", "values", "_polylines")
+
+    POLYLINE_CACHE_SIZE = 4
+
+    def __init__(self, frames=(), values=()):
+        self.frames = array("d", frames)
+        self.values = array("d", values)
+        self._polylines = {}
+
+    @classmethod
+    def from_points(cls, points):
+        """Build from a sorted ``(frame, value)`` sequence."""
+        curve = cls()
+        for frame, value in points or ():
+            curve.frames.append(frame)
+            curve.values.append(value)
+        return curve
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __bool__(self):
+        return bool(self.frames)
+
+    def __eq__(self, other):
+        if not isinstance(other, SampledCurve):
+            return NotImplemented
+        return self.frames == other.frames and self.values == other.values
+
+    __hash__ = None
+
+    def __iter__(self):
+        return zip(self.frames, self.values)
+
+    def value_at(self, frame):
+        """Linearly interpolated value at ``frame``, clamped to the sampled ends."""
+        frames = self.frames
+        if not frames:
+            return 0.0
+        if frame <= frames[0]:
+            return self.values[0]
+        if frame >= frames[-1]:
+            return self.values[-1]
+        index = bisect_left(frames, frame)
+        next_frame = frames[index]
+        if next_frame == frame:
+            return self.values[index]
+        previous_frame = frames[index - 1]
+        if next_frame == previous_frame:
+            return self.values[index]
+        t = (frame - previous_frame) / (next_frame - previous_frame)
+        previous_value = self.values[index - 1]
+        return previous_value + (self.values[index] - previous_value) * t
+
+    def span(self, start_frame, end_frame):
+        """``(first, stop)`` sample indices covering ``start_frame..end_frame``.
+
+        One sample either side of the range is included so a line drawn
+        from the slice still reaches both edges of the visible range.
+        """
+        first = max(0, bisect_right(self.frames, start_frame) - 1)
+        stop = min(len(self.frames), bisect_left(self.frames, end_frame) + 1)
+        return first, max(first, stop)
+
+    def sliced(self, start_frame, end_frame):
+        """A new ``SampledCurve`` restricted to ``start_frame..end_frame``."""
+        first, stop = self.span(start_frame, end_frame)
+        return SampledCurve(self.frames[first:stop], self.values[first:stop])
+
+    def polyline(self, start_frame, end_frame, left, bottom, width, height):
+        """Screen-space ``(x, y)`` points for the visible part of the curve.
+
+        Frames map ``start_frame..end_frame`` onto ``left..left + width``;
+        values map ``0..1`` onto ``bottom..bottom - height``. The result is
+        cached per argument tuple, so repeated repaints at one size and
+        range cost a dict lookup.
+        """
+        key = (start_frame, end_frame, left, bottom, width, height)
+        cached = self._polylines.get(key)
+        if cached is not None:
+            return cached
+        span = float(end_frame - start_frame) or 1.0
+        scale_x = width / span
+        first, stop = self.span(start_frame, end_frame)
+        frames = self.frames
+        values = self.values
+        result = [
+            (left + (frames[index] - start_frame) * scale_x, bottom - values[index] * height)
+            for index in range(first, stop)
+        ]
+        if len(self._polylines) >= self.POLYLINE_CACHE_SIZE:
+            self._polylines.clear()
+        self._polylines[key] = result
+        return result
@@ -0,0 +1,156 @@
+"""Curve-level tangent snapshots read and restored in one MFnAnimCurve pass.
+
+No Maya imports: callers hand in the ``MFnAnimCurve`` (or anything with the
+same methods), the time unit and the few API constructors needed, so
+benchmarks can drive this with a fake curve. Snapshots use the
+``cmds.keyTangent`` flag names, angles in degrees, exactly as
+``curves.key_tangent_snapshots`` has always returned them; the restore
+replays ``apply_key_tangent_snapshot``'s edit order for each key.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+
+TIME_TOLERANCE = 0.000001
+# Angles and weights are left to Maya for these: a computed type would
+# overwrite them anyway, and writing them first would turn the key fixed.
+AUTOMATIC_TYPES = frozenset(("auto", "autoease", "autoEase", "autoMix"))
+TYPE_FLAGS = ("inTangentType", "outTangentType")
+# keyTangent type names -> MFnAnimCurve constant names. The auto variants
+# only exist in newer Maya versions, so callers resolve them with getattr.
+API_TYPE_NAMES = {
+    "spline": "kTangentSmooth",
+    "linear": "kTangentLinear",
+    "fast": "kTangentFast",
+    "slow": "kTangentSlow",
+    "flat": "kTangentFlat",
+    "step": "kTangentStep",
+    "stepnext": "kTangentStepNext",
+    "fixed": "kTangentFixed",
+    "clamped": "kTangentClamped",
+    "plateau": "kTangentPlateau",
+    "auto": "kTangentAuto",
+    "autoease": "kTangentAutoEase",
+    "automix": "kTangentAutoMix",
+    "autocustom": "kTangentAutoCustom",
+}
+# (is_in_tangent, type flag, angle flag, weight flag)
+TANGENT_SIDES = (
+    (True, "inTangentType", "inAngle", "inWeight"),
+    (False, "outTangentType", "outAngle", "outWeight"),
+)
+
+
+def _fn_value(value):
+    return value() if callable(value) else value
+
+
+def key_inputs(fn, unit):
+    """Every key time of *fn* in *unit*, in key order."""
+    return [float(fn.input(index).asUnits(unit)) for index in range(int(_fn_value(fn.numKeys)))]
+
+
+def key_index(inputs, key_time, tolerance=TIME_TOLERANCE):
+    """Index of the key within *tolerance* of *key_time* in sorted *inputs*, or None."""
+    index = bisect_left(inputs, key_time - tolerance)
+    if index < len(inputs) and abs(inputs[index] - key_time) <= tolerance:
+        return index
+    return None
+
+
+def read_snapshots(fn, key_times, unit, tangent_types):
+    """Snapshot the keys of *fn* at *key_times*.
+
+    *tangent_types* maps ``inTangentType``/``outTangentType`` to the type
+    names of every key of the curve, as one ``cmds.keyTangent`` query each
+    returns them, so names keep the command's spelling rather than being
+    derived back from API enums. Times with no key get an empty snapshot.
+    Every snapshot carries the curve's ``weightedTangents`` state.
+    """
+    inputs = key_inputs(fn, unit)
+    weighted = bool(_fn_value(fn.isWeighted))
+    snapshots = []
+    for key_time in key_times:
+        snapshot = {}
+        index = key_index(inputs, float(key_time))
+        if index is not None:
+            in_angle, in_weight = fn.getTangentAngleWeight(index, True)
+            out_angle, out_weight = fn.getTangentAngleWeight(index, False)
+            snapshot["inAngle"] = float(in_angle.asDegrees())
+            snapshot["outAngle"] = float(out_angle.asDegrees())
+            snapshot["inWeight"] = float(in_weight)
+            snapshot["outWeight"] = float(out_weight)
+            for flag in TYPE_FLAGS:
+                names = tangent_types.get(flag) or []
+                if index < len(names):
+                    snapshot[flag] = names[index]
+            snapshot["lock"] = bool(fn.tangentsLocked(index))
+            snapshot["weightLock"] = bool(fn.weightsLocked(index))
+        snapshot["weightedTangents"] = weighted
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def restore_snapshots(fn, snapshots, unit, make_angle, tangent_type, apply_weighted=True, change=None):
+    """Write ``(key_time, snapshot)`` pairs back onto *fn*.
+
+    Per key this is ``apply_key_tangent_snapshot``'s sequence: unlock,
+    types, angles and weights (skipped for automatic types), the types
+    again when details were written, then the snapshot's locks.
+    *make_angle* builds an ``MAngle`` from degrees and *tangent_type* maps a
+    type name to its ``MFnAnimCurve`` constant, or None. Returns False
+    before editing anything when a type name has no constant, so the
+    caller can take the command path instead. Edits raise on failure;
+    *change* then holds whatever was applied.
+    """
+    resolved = []
+    for key_time, snapshot in snapshots:
+        if not snapshot:
+            continue
+        types = {}
+        for flag in TYPE_FLAGS:
+            if flag in snapshot:
+                constant = tangent_type(snapshot[flag])
+                if constant is None:
+                    return False
+                types[flag] = constant
+        resolved.append((float(key_time), snapshot, types))
+
+    inputs = key_inputs(fn, unit)
+    for key_time, snapshot, types in resolved:
+        weighted = snapshot.get("weightedTangents")
+        if apply_weighted and weighted is not None and bool(_fn_value(fn.isWeighted)) != bool(weighted):
+            fn.setIsWeighted(bool(weighted), change=change)
+        index = key_index(inputs, key_time)
+        if index is None:
+            continue
+
+        fn.setTangentsLocked(index, False, change=change)
+        fn.setWeightsLocked(index, False, change=change)
+        _set_types(fn, index, types, change)
+        details = False
+        for is_in_tangent, type_flag, angle_flag, weight_flag in TANGENT_SIDES:
+            if snapshot.get(type_flag) in AUTOMATIC_TYPES:
+                continue
+            if angle_flag in snapshot:
+                fn.setAngle(index, make_angle(float(snapshot[angle_flag])), is_in_tangent, change=change)
+                details = True
+            if weight_flag in snapshot:
+                fn.setWeight(index, float(snapshot[weight_flag]), is_in_tangent, change=change)
+                details = True
+        if details:
+            _set_types(fn, index, types, change)
+        if "lock" in snapshot:
+            fn.setTangentsLocked(index, bool(snapshot["lock"]), change=change)
+        if "weightLock" in snapshot:
+            fn.setWeightsLocked(index, bool(snapshot["weightLock"]), change=change)
+    return True
+
+
+def _set_types(fn, index, types, change):
+    if "inTangentType" in types:
+        fn.setInTangentType(index, types["inTangentType"], change=change)
+    if "outTangentType" in types:
+        fn.setOutTangentType(index, types["outTangentType"], change=change)
@@ -0,0 +1,116 @@
+"""Put direct MFnAnimCurve edits on Maya's undo queue.
+
+API writes collect into an ``MAnimCurveChange`` that Maya knows nothing
+about. ``commit`` hands one to a tiny undoable command, so it undoes and
+redoes with the rest of the surrounding undo chunk like any command edit.
+
+This same file is also the plug-in that registers that command: Maya loads
+it by path as a separate module, so the command reads pending changes from
+the package copy of this module rather than from its own globals.
+"""
+
+from __future__ import annotations
+
+import os
+
+try:
+    from maya import cmds
+except ImportError:  # pragma: no cover
+    cmds = None
+
+try:
+    from maya.api import OpenMaya as om  # type: ignore
+    from maya.api import OpenMayaAnim as oma  # type: ignore
+except ImportError:  # pragma: no cover
+    om = None
+    oma = None
+
+
+COMMAND_NAME = "tkmAnimCurveChange"
+PLUGIN_PATH = os.path.splitext(os.path.abspath(__file__))[0] + ".py"
+
+_pending = []
+
+
+def maya_useNewAPI():
+    """Tell Maya the plug-in side of this module uses API 2.0."""
+
+
+class AnimCurveChangeCommand(om.MPxCommand if om is not None else object):
+    """Own one committed ``MAnimCurveChange`` for undo/redo."""
+
+    def __init__(self):
+        super().__init__()
+        self._change = None
+
+    @staticmethod
+    def creator():
+        return AnimCurveChangeCommand()
+
+    def doIt(self, _args):
+        from TheKeyMachine.maya import api_undo
+
+        if api_undo._pending:
+            self._change = api_undo._pending.pop()
+
+    def isUndoable(self):
+        return self._change is not None
+
+    def undoIt(self):
+        self._change.undoIt()
+
+    def redoIt(self):
+        self._change.redoIt()
+
+
+def initializePlugin(plugin):
+    om.MFnPlugin(plugin, "TheKeyMachine", "1.0").registerCommand(
+        COMMAND_NAME, AnimCurveChangeCommand.creator
+    )
+
+
+def uninitializePlugin(plugin):
+    om.MFnPlugin(plugin).deregisterCommand(COMMAND_NAME)
+
+
+def ensure_loaded():
+    """Load the undo command plug-in once; ``False`` when it can't be."""
+    if cmds is None or om is None:
+        return False
+    try:
+        if cmds.pluginInfo(PLUGIN_PATH, query=True, loaded=True):
+            return True
+        cmds.loadPlugin(PLUGIN_PATH, quiet=True)
+        return bool(cmds.pluginInfo(PLUGIN_PATH, query=True, loaded=True))
+    except Exception:
+        return False
+
+
+def begin():
+    """A fresh ``MAnimCurveChange`` if its edits can be committed, else ``None``."""
+    if oma is None or not ensure_loaded():
+        return None
+    return oma.MAnimCurveChange()
+
+
+def commit(change):
+    """Register *change* (already applied) as one undoable step."""
+    if change is None:
+        return False
+    _pending.append(change)
+    try:
+        getattr(cmds, COMMAND_NAME)()
+    except Exception:
+        if change in _pending:
+            _pending.remove(change)
+        return False
+    return True
+
+
+def rollback(change):
+    if change is None:
+        return
+    try:
+        change.undoIt()
+    except Exception:
+        pass
@@ -6,6 +6,8 @@ which keeps automatic/background updates out of Maya undo history.
 
 from __future__ import annotations
 
+from array import array
+
 try:
     from maya.api import OpenMaya as om  # type: ignore
 except ImportError:  # pragma: no cover
@@ -371,6 +373,87 @@ def move_anim_curve_keys(
     return bool(moved_keys)
 
 
+def set_anim_curve_keys(curve, frames, values=None, remove_others=False, change=None, tolerance=0.000001):
+    """Key every frame of *frames* on *curve* in one MFnAnimCurve pass.
+
+    Frames that already hold a key keep it, taking their entry of *values*
+    (``{frame: command-unit value}``) when there is one. The other frames
+    are added together through ``addKeys`` with the global default
+    tangents, valued from *values* or else from the curve as it was before
+    the call -- what ``setKeyframe`` without a value keys. With
+    *remove_others*, keys inside the frame range that are not in *frames*
+    are removed.
+
+    Returns the number of keys added, or ``None`` without editing anything
+    for a curve this can't key (missing, or unitless-input driven keys).
+    Raises if Maya rejects an edit part-way; *change* then holds the
+    partial edit for the caller to roll back.
+    """
+    fn = anim_curve_fn(curve)
+    if fn is None or not frames:
+        return None
+    try:
+        if fn.isUnitlessInput:
+            return None
+    except Exception:
+        return None
+
+    unit = time_unit()
+    frames = sorted(set(float(frame) for frame in frames))
+    values = values or {}
+    to_internal = anim_curve_internal_value_converter(fn)
+
+    def _slot(time):
+        return round(time / tolerance)
+
+    key_count = _anim_curve_key_count(fn)
+    existing = {}
+    index = _first_key_after(fn, frames[0] - tolerance, unit)
+    while index < key_count:
+        time = _anim_curve_input(fn, index, unit)
+        if time > frames[-1] + tolerance:
+            break
+        existing[_slot(time)] = index
+        index += 1
+
+    wanted = {_slot(frame): frame for frame in frames}
+    stale = sorted(
+        (key_index for slot, key_index in existing.items() if slot not in wanted),
+        reverse=True,
+    ) if remove_others else []
+    updates = []
+    missing_times = []
+    missing_values = []
+    for slot, frame in wanted.items():
+        value = values.get(frame)
+        key_index = existing.get(slot)
+        if key_index is not None:
+            if value is not None:
+                updates.append((key_index, to_internal(value)))
+            continue
+        missing_times.append(frame)
+        # Sampled before any edit so every new key lands on the original
+        # curve, not on one already reshaped by earlier insertions.
+        missing_values.append(
+            to_internal(value) if value is not None else fn.evaluate(om.MTime(frame, unit))
+        )
+
+    for key_index, value in updates:
+        fn.setValue(key_index, value, change=change)
+    for key_index in stale:
+        fn.remove(key_index, change=change)
+    if missing_times:
+        fn.addKeys(
+            om.MTimeArray([om.MTime(frame, unit) for frame in missing_times]),
+            om.MDoubleArray(missing_values),
+            oma.MFnAnimCurve.kTangentGlobal,
+            oma.MFnAnimCurve.kTangentGlobal,
+            keepExistingKeys=True,
+            change=change,
+        )
+    return len(missing_times)
+
+
 def step_anim_curve_key_time(
     curves,
     current,
@@ -536,6 +619,52 @@ def matrix_array_plug_at_time(node, attr, index=0, time=None):
         return None
 
 
+def matrix_array_plug_sampler(node, attr, index=0):
+    """Return a sampler for a matrix-array plug (``attr[index]``) over many times.
+
+    The plug is resolved once, so each call only builds a DG context per
+    time. ``sampler(times)`` returns ``(sampled_times, values)``: the times
+    that evaluated, and their matrices as one flat ``array('d')`` of 16
+    values each. Times the API can't evaluate go through
+    ``matrix_array_plug_at_time`` and are left out if that fails too.
+    Returns None when the plug can't be resolved.
+    """
+    if om is None:
+        return None
+    plug = find_plug(node, attr)
+    if plug is None:
+        return None
+    try:
+        plug = plug.elementByLogicalIndex(index)
+    except Exception:
+        return None
+    unit = time_unit()
+
+    def _sample(times):
+        sampled = []
+        values = array("d")
+        for time in times:
+            try:
+                context = om.MDGContext(om.MTime(float(time), unit))
+                matrix = _matrix_values(om.MFnMatrixData(plug.asMObject(context)).matrix())
+            except Exception:
+                matrix = None
+            if matrix is None:
+                matrix = matrix_array_plug_at_time(node, attr, index=index, time=time)
+            if matrix is None:
+                continue
+            sampled.append(time)
+            values.extend(matrix)
+        return sampled, values
+
+    return _sample
+
+
+def world_matrix_sampler(node):
+    """``matrix_array_plug_sampler`` for *node*'s ``worldMatrix[0]``."""
+    return matrix_array_plug_sampler(node, "worldMatrix")
+
+
 def multiply_matrices(a, b):
     """Multiply two flat 16-value matrices using Maya's row-vector
     convention (``a`` applied first): ``result = a * b``.
@@ -661,7 +790,13 @@ def remove_anim_curve_key(fn, time, change=None):
 
 def set_anim_curve_tangents(fn, time, in_angle, out_angle, change=None):
     """Set broken fixed tangents using Maya API angle/weight representation."""
-    index = anim_curve_key_index(fn, time)
+    return set_anim_curve_tangents_by_index(
+        fn, anim_curve_key_index(fn, time), in_angle, out_angle, change=change
+    )
+
+
+def set_anim_curve_tangents_by_index(fn, index, in_angle, out_angle, change=None):
+    """``set_anim_curve_tangents`` for a key index the caller already resolved."""
     if fn is None or index is None or om is None or oma is None:
         return False
     try:
@@ -702,23 +837,76 @@ def _anim_curve_type(fn):
     return None
 
 
+def anim_curve_value_converter(fn):
+    """Return a callable mapping *fn*'s internal key values to command units.
+
+    Resolving the curve type once lets bulk readers convert every key of a
+    curve without re-resolving the node for each value.
+    """
+    curve_type = _anim_curve_type(fn)
+    if om is None or oma is None or curve_type is None:
+        return float
+    if curve_type in (oma.MFnAnimCurve.kAnimCurveTA, oma.MFnAnimCurve.kAnimCurveUA):
+        unit = om.MAngle.uiUnit()
+        return lambda value: om.MAngle(float(value)).asUnits(unit)
+    if curve_type in (oma.MFnAnimCurve.kAnimCurveTL, oma.MFnAnimCurve.kAnimCurveUL):
+        unit = om.MDistance.uiUnit()
+        return lambda value: om.MDistance(float(value)).asUnits(unit)
+    if curve_type in (oma.MFnAnimCurve.kAnimCurveTT, oma.MFnAnimCurve.kAnimCurveUT):
+        unit = time_unit()
+        return lambda value: om.MTime(float(value), om.MTime.kSeconds).asUnits(unit)
+    return float
+
+
+def anim_curve_internal_value_converter(fn):
+    """Return a callable mapping command-unit values to *fn*'s internal units.
+
+    The inverse of ``anim_curve_value_converter``, for bulk writers.
+    """
+    curve_type = _anim_curve_type(fn)
+    if om is None or oma is None or curve_type is None:
+        return float
+    if curve_type in (oma.MFnAnimCurve.kAnimCurveTA, oma.MFnAnimCurve.kAnimCurveUA):
+        unit = om.MAngle.uiUnit()
+        return lambda value: om.MAngle(float(value), unit).asRadians()
+    if curve_type in (oma.MFnAnimCurve.kAnimCurveTL, oma.MFnAnimCurve.kAnimCurveUL):
+        unit = om.MDistance.uiUnit()
+        return lambda value: om.MDistance(float(value), unit).asCentimeters()
+    if curve_type in (oma.MFnAnimCurve.kAnimCurveTT, oma.MFnAnimCurve.kAnimCurveUT):
+        unit = time_unit()
+        return lambda value: om.MTime(float(value), unit).asUnits(om.MTime.kSeconds)
+    return float
+
+
+def anim_curve_attr_value_converter(curve):
+    """Return a callable doing ``anim_curve_value_to_attr_value`` for *curve*.
+
+    Resolves the curve once, for writers converting many keys of one curve.
+    """
+    if om is None or oma is None or curve is None:
+        return lambda value: value
+    curve_type = _anim_curve_type(anim_curve_fn(curve))
+    if curve_type == oma.MFnAnimCurve.kAnimCurveTA:
+        unit = om.MAngle.uiUnit()
+        convert = lambda value: om.MAngle(float(value)).asUnits(unit)
+    elif curve_type == oma.MFnAnimCurve.kAnimCurveTL:
+        unit = om.MDistance.uiUnit()
+        convert = lambda value: om.MDistance(float(value)).asUnits(unit)
+    else:
+        return lambda value: value
+
+    def _convert(value):
+        try:
+            return convert(value)
+        except Exception:
+            return value
+
+    return _convert
+
+
 def anim_curve_value_to_attr_value(curve, value):
     """Convert an MFnAnimCurve value to command-layer attribute units."""
-    if om is None or oma is None or curve is None:
-        return value
-    fn = anim_curve_fn(curve)
-    curve_type = _anim_curve_type(fn)
-    try:
-        if curve_type == oma.MFnAnimCurve.kAnimCurveTA:
-            return om.MAngle(float(value)).asUnits(om.MAngle.uiUnit())
-    except Exception:
-        pass
-    try:
-        if curve_type == oma.MFnAnimCurve.kAnimCurveTL:
-            return om.MDistance(float(value)).asUnits(om.MDistance.uiUnit())
-    except Exception:
-        pass
-    return value
+    return anim_curve_attr_value_converter(curve)(value)
 
 
 def anim_curve_attr_value_to_curve_value(curve, value):
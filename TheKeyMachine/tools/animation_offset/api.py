@@ -1,5 +1,10 @@
 from maya import cmds
 
+try:
+    from maya.api import OpenMaya as om  # type: ignore
+except ImportError:  # pragma: no cover
+    om = None
+
 from TheKeyMachine.core.Qt import QtCompat, QtCore, QtWidgets
 
 from TheKeyMachine.core import runtime
@@ -57,6 +62,7 @@ class AnimationOffsetController(QtCore.QObject):
 
     POLL_INTERVAL_MS = 70
     RESNAPSHOT_DELAY_MS = 120
+    ATTRIBUTE_WATCH_KEY = "animation_offset:attribute_watch"
 
     def __init__(self, manager):
         super().__init__(manager)
@@ -72,6 +78,13 @@ class AnimationOffsetController(QtCore.QObject):
         self._pending_manip_plugs = set()
         self._pending_resnapshot_update_range = False
         self._settling_after_resnapshot = False
+        # Event-driven mode: attribute-changed callbacks on the baseline
+        # nodes record which plugs were set, and the poll only reads those.
+        # Falls back to reading every baseline plug when the callbacks can't
+        # be registered.
+        self._event_driven = False
+        self._watched_nodes = ()
+        self._dirty_plugs = set()
 
         self._poll_timer = QtCore.QTimer(self)
         self._poll_timer.setInterval(self.POLL_INTERVAL_MS)
@@ -305,22 +318,68 @@ class AnimationOffsetController(QtCore.QObject):
             }
         return obj_snapshot
 
-    def _capture_current_values(self):
+    def _capture_current_values(self, plugs=None):
+        """Read the current value of every baseline plug, or only of *plugs*."""
+        if plugs is None:
+            plugs = [(obj, attr) for obj, attrs in self._baseline.items() for attr in attrs.keys()]
         current_values = {}
-        for obj, attrs in self._baseline.items():
-            if not cmds.objExists(obj):
+        missing = set()
+        for obj, attr in plugs:
+            if obj in missing:
                 continue
-            obj_values = {}
-            for attr in attrs.keys():
-                plug = self._plug_name(obj, attr)
-                value, ok = self._get_plug_value(plug)
-                if not ok:
-                    continue
-                obj_values[attr] = value
-            if obj_values:
-                current_values[obj] = obj_values
+            if obj not in current_values and not cmds.objExists(obj):
+                missing.add(obj)
+                continue
+            if attr not in self._baseline.get(obj, {}):
+                continue
+            value, ok = self._get_plug_value(self._plug_name(obj, attr))
+            if not ok:
+                continue
+            current_values.setdefault(obj, {})[attr] = value
         return current_values
 
+    def _watch_baseline_nodes(self):
+        """Track attribute sets on the baseline nodes; re-register only when they change."""
+        nodes = tuple(sorted(self._baseline))
+        if nodes == self._watched_nodes and (self._event_driven or not nodes):
+            return
+        self._runtime_manager.disconnect_callbacks(self.ATTRIBUTE_WATCH_KEY)
+        self._watched_nodes = nodes
+        self._event_driven = False
+        if om is None or not nodes:
+            return
+        callback_ids = self._runtime_manager.add_node_attribute_changed_callbacks(
+            nodes,
+            self._on_attribute_changed,
+            key=self.ATTRIBUTE_WATCH_KEY,
+        )
+        self._event_driven = len(callback_ids) == len(nodes)
+
+    def _unwatch_baseline_nodes(self):
+        self._runtime_manager.disconnect_callbacks(self.ATTRIBUTE_WATCH_KEY)
+        self._watched_nodes = ()
+        self._event_driven = False
+        self._dirty_plugs.clear()
+
+    def _on_attribute_changed(self, msg, plug, _other_plug, _client_data, node):
+        if not (msg & om.MNodeMessage.kAttributeSet):
+            return
+        attrs = self._baseline.get(node)
+        if not attrs:
+            return
+        try:
+            names = [plug.partialName(useLongNames=True)]
+            if plug.isCompound:
+                names.extend(
+                    plug.child(index).partialName(useLongNames=True)
+                    for index in range(plug.numChildren())
+                )
+        except Exception:
+            return
+        for name in names:
+            if name in attrs:
+                self._dirty_plugs.add((node, name))
+
     def _find_changed_plugs(self, current_values):
         changed_plugs = set()
         for obj, attrs in current_values.items():
@@ -354,6 +413,9 @@ class AnimationOffsetController(QtCore.QObject):
 
         self._baseline = baseline
         self._pending_manip_plugs.clear()
+        self._dirty_plugs.clear()
+        if self._enabled:
+            self._watch_baseline_nodes()
         self._state = self.STATE_ARMED if self._enabled else self.STATE_IDLE
 
     def _can_resnapshot_from_event(self):
@@ -467,17 +529,29 @@ class AnimationOffsetController(QtCore.QObject):
         if self._state in (self.STATE_APPLYING, self.STATE_RESNAPSHOT_PENDING):
             return
 
-        current_selection_signature = self._selection_signature_value()
-        if current_selection_signature != self._selection_signature:
-            self._request_resnapshot(update_range=False)
-            return
+        # Selection changes also arrive through the runtime manager's
+        # selection signal; the per-tick signature check is only needed
+        # when polling is the sole change detector.
+        if not self._event_driven:
+            current_selection_signature = self._selection_signature_value()
+            if current_selection_signature != self._selection_signature:
+                self._request_resnapshot(update_range=False)
+                return
 
         if self._snapshot_time != self._current_time():
             self._pending_manip_plugs.clear()
             self._request_resnapshot(update_range=False)
             return
 
-        current_values = self._capture_current_values()
+        if self._event_driven:
+            if not self._dirty_plugs and self._state != self.STATE_TRACKING_MANIP:
+                self._settling_after_resnapshot = False
+                return
+            dirty_plugs = self._dirty_plugs
+            self._dirty_plugs = set()
+            current_values = self._capture_current_values(dirty_plugs)
+        else:
+            current_values = self._capture_current_values()
         if self._settling_after_resnapshot:
             self._settling_after_resnapshot = False
             changed_plugs = self._find_changed_plugs(current_values)
@@ -541,6 +615,7 @@ class AnimationOffsetController(QtCore.QObject):
     def deactivate(self):
         self._enabled = False
         self._disconnect_runtime_manager()
+        self._unwatch_baseline_nodes()
         self._poll_timer.stop()
         self._resnapshot_timer.stop()
         self._runtime_manager.clear_managed_widget(self._tint_key)
@@ -1,14 +1,14 @@
 """Persistent, scene-scoped animation recovery snapshots."""
 
+from array import array
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime
-import io
-import json
+import hashlib
 import os
-import struct
+import threading
 import time
 import uuid
-import zlib
 
 from maya import cmds
 
@@ -17,8 +17,16 @@ try:
 except ImportError:
     om = None
 
+try:
+    from maya.api import OpenMayaAnim as oma
+except ImportError:
+    oma = None
+
 from TheKeyMachine.maya import animation
+from TheKeyMachine.maya import api_undo
+from TheKeyMachine.maya import maya_api
 from TheKeyMachine.tools import registry
+from TheKeyMachine.tools.animation_recovery import storage
 from TheKeyMachine.core.Qt import QtCore
 from TheKeyMachine.maya.runtime import TkmSceneNode
 from TheKeyMachine.data import icons
@@ -47,22 +55,19 @@ SCENE_ID_ATTRIBUTE = "tkmAnimationRecoverySceneId"
 # needs no create/lock/unlock dance -- unlike a node attribute, it is exactly
 # the right weight for a value stamped on every single snapshot.
 CHECKPOINT_FILEINFO_KEY = "tkm_animationRecoveryLastCheckpoint"
-SCHEMA_VERSION = 7
 BASELINE_INTERVAL = 50
 MAX_BASELINE_GENERATIONS = 20
 SNAPSHOT_DELAY_MS = 350
+# Checkpoints allowed to wait for the writer before new deltas are folded
+# into the newest queued one. Overridable per user through WRITE_QUEUE_SETTING.
+WRITE_QUEUE_DEPTH = 4
+WRITE_QUEUE_SETTING = "write_queue_depth"
 REWATCH_DELAY_MS = 100
-RECOVERY_EXTENSION = ".tkmrec"
-FULL_SNAPSHOT_FLAG = 0x80
-REASON_CODES = {
-    "animation": 0,
-    "dag": 1,
-    "scene_save": 2,
-    "recovery": 3,
-    "transform": 4,
-    "layer": 5,
-}
-REASONS_BY_CODE = {code: reason for reason, code in REASON_CODES.items()}
+# Restore hands curves to the main thread in batches this size, so Cancel is
+# honoured between batches without paying a marshal hop per curve.
+RESTORE_BATCH_CURVES = 64
+RESTORE_BATCH_KEYS = 20000
+_API_TANGENT_TYPES = animation.tangents.API_TYPE_NAMES
 
 _SERVICE = None
 
@@ -109,293 +114,6 @@ def _filename_timestamp_value(path):
         return time.mktime(created.timetuple()) + (created.microsecond / 1000000.0)
 
 
-def _pack_endpoint(endpoint):
-    return [endpoint.get("plug"), endpoint.get("node_uuid")]
-
-
-def _unpack_endpoint(endpoint):
-    plug = endpoint[0]
-    node, attribute = _split_plug(plug)
-    return {
-        "plug": plug,
-        "node": node,
-        "node_uuid": endpoint[1],
-        "attribute": attribute,
-    }
-
-
-def _pack_layer_ref(layer_info):
-    if not layer_info:
-        return None
-    return [
-        layer_info.get("name"),
-        layer_info.get("uuid"),
-        layer_info.get("plug"),
-    ]
-
-
-def _unpack_layer_ref(layer_ref):
-    if not layer_ref:
-        return None
-    return {
-        "name": layer_ref[0],
-        "uuid": layer_ref[1],
-        "plug": layer_ref[2],
-    }
-
-
-def _pack_curve(curve):
-    tangents = curve.get("tangents") or {}
-    return [
-        curve.get("name"),
-        curve.get("uuid"),
-        curve.get("node_type"),
-        1 if curve.get("unitless_input") else 0,
-        curve.get("positions") or [],
-        curve.get("values") or [],
-        [tangents.get(key) or [] for key in ("itt", "ott", "ia", "oa", "iw", "ow")],
-        1 if curve.get("weighted_tangents") else 0,
-        curve.get("pre_infinity", 0),
-        curve.get("post_infinity", 0),
-        [_pack_endpoint(item) for item in curve.get("input_connections") or []],
-        [_pack_endpoint(item) for item in curve.get("output_connections") or []],
-        _pack_layer_ref(curve.get("layer")),
-    ]
-
-
-def _unpack_curve(curve):
-    tangent_values = curve[6]
-    tangent_keys = ("itt", "ott", "ia", "oa", "iw", "ow")
-    return {
-        "name": curve[0],
-        "uuid": curve[1],
-        "node_type": curve[2],
-        "unitless_input": bool(curve[3]),
-        "positions": curve[4],
-        "values": curve[5],
-        "tangents": {
-            key: tangent_values[index]
-            for index, key in enumerate(tangent_keys)
-        },
-        "weighted_tangents": bool(curve[7]),
-        "pre_infinity": curve[8],
-        "post_infinity": curve[9],
-        "input_connections": [_unpack_endpoint(item) for item in curve[10]],
-        "output_connections": [_unpack_endpoint(item) for item in curve[11]],
-        "layer": _unpack_layer_ref(curve[12]),
-    }
-
-
-def _pack_layer(layer):
-    return [
-        layer.get("name"),
-        layer.get("uuid"),
-        layer.get("parent"),
-        layer.get("weight", 1.0),
-        1 if layer.get("mute") else 0,
-        1 if layer.get("solo") else 0,
-        1 if layer.get("override") else 0,
-        1 if layer.get("passthrough") else 0,
-        1 if layer.get("lock") else 0,
-        layer.get("attributes") or [],
-        layer.get("rotation_accumulation_mode"),
-        layer.get("scale_accumulation_mode"),
-    ]
-
-
-def _unpack_layer(layer):
-    return {
-        "name": layer[0],
-        "uuid": layer[1],
-        "parent": layer[2],
-        "weight": layer[3],
-        "mute": bool(layer[4]),
-        "solo": bool(layer[5]),
-        "override": bool(layer[6]),
-        "passthrough": bool(layer[7]),
-        "lock": bool(layer[8]),
-        "attributes": list(layer[9] or []),
-        "rotation_accumulation_mode": layer[10],
-        "scale_accumulation_mode": layer[11],
-    }
-
-
-def _pack_payload(payload):
-    details = payload.get("meta") or {}
-    return [
-        [
-            details.get("source_file"),
-            details.get("location"),
-            details.get("current_frame"),
-            details.get("playback_range"),
-            details.get("animation_range"),
-            details.get("selected_objects"),
-            details.get("source_mtime"),
-            details.get("parent_checkpoint"),
-        ],
-        [_pack_curve(curve) for curve in payload.get("curves") or []],
-        [
-            [
-                item.get("name"),
-                item.get("uuid"),
-                [[name, value] for name, value in sorted((item.get("attributes") or {}).items())],
-            ]
-            for item in payload.get("objects") or []
-        ],
-        [
-            [
-                item.get("name"),
-                item.get("uuid"),
-                [_pack_endpoint(endpoint) for endpoint in item.get("output_connections") or []],
-            ]
-            for item in payload.get("removed_curves") or []
-        ],
-        [_pack_layer(layer) for layer in payload.get("layers") or []],
-    ]
-
-
-def _unpack_payload(payload, reason="animation", full_snapshot=False):
-    details, curves, objects, removed_curves, layers = payload
-    return {
-        "meta": {
-            "version": SCHEMA_VERSION,
-            "reason": reason,
-            "full_snapshot": bool(full_snapshot),
-            "source_file": details[0],
-            "location": details[1],
-            "current_frame": details[2],
-            "playback_range": details[3],
-            "animation_range": details[4],
-            "selected_objects": details[5],
-            "source_mtime": details[6],
-            "parent_checkpoint": details[7],
-        },
-        "curves": [_unpack_curve(curve) for curve in curves],
-        "objects": [
-            {
-                "name": item[0],
-                "uuid": item[1],
-                "attributes": dict(item[2]),
-            }
-            for item in objects
-        ],
-        "removed_curves": [
-            {
-                "name": item[0],
-                "uuid": item[1],
-                "output_connections": [
-                    _unpack_endpoint(endpoint)
-                    for endpoint in item[2]
-                ],
-            }
-            for item in removed_curves
-        ],
-        "layers": [_unpack_layer(layer) for layer in layers],
-    }
-
-
-def _write_recovery_atomic(path, payload):
-    folder = os.path.dirname(path)
-    if not os.path.isdir(folder):
-        try:
-            os.makedirs(folder)
-        except OSError:
-            if not os.path.isdir(folder):
-                raise
-    temporary = path + ".tmp"
-    packed = _pack_payload(payload)
-    serialized = json.dumps(packed, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-    meta = payload.get("meta") or {}
-    reason = meta.get("reason") or "animation"
-    reason_byte = REASON_CODES.get(reason, 0)
-    if meta.get("full_snapshot"):
-        reason_byte |= FULL_SNAPSHOT_FLAG
-    header = struct.pack("BB", SCHEMA_VERSION, reason_byte)
-    compiled = header + zlib.compress(serialized, 9)
-    try:
-        with io.open(temporary, "wb") as stream:
-            stream.write(compiled)
-            stream.flush()
-            os.fsync(stream.fileno())
-        replace = getattr(os, "replace", os.rename)
-        replace(temporary, path)
-    except Exception:
-        try:
-            if os.path.isfile(temporary):
-                os.remove(temporary)
-        except OSError:
-            pass
-        raise
-
-
-def _load_recovery(path):
-    with io.open(path, "rb") as stream:
-        compiled = stream.read()
-    if len(compiled) < 3:
-        raise ValueError("Invalid Animation Recovery file")
-    version, reason_code = struct.unpack("BB", compiled[:2])
-    if version != SCHEMA_VERSION:
-        raise ValueError("Unsupported Animation Recovery version: {}".format(version))
-    serialized = zlib.decompress(compiled[2:]).decode("utf-8")
-    return _unpack_payload(
-        json.loads(serialized),
-        reason=REASONS_BY_CODE.get(reason_code & ~FULL_SNAPSHOT_FLAG, "animation"),
-        full_snapshot=bool(reason_code & FULL_SNAPSHOT_FLAG),
-    )
-
-
-def _recovery_reason(path):
-    try:
-        with io.open(path, "rb") as stream:
-            header = stream.read(2)
-        if len(header) < 2:
-            return "animation"
-        version, reason_code = struct.unpack("BB", header)
-        if version != SCHEMA_VERSION:
-            return "animation"
-        return REASONS_BY_CODE.get(reason_code & ~FULL_SNAPSHOT_FLAG, "animation")
-    except Exception:
-        return "animation"
-
-
-def _recovery_source_file(path):
-    """Cheap peek at the filename a checkpoint recorded at capture time.
-
-    Every checkpoint -- not just full snapshots -- carries its own meta
-    block, so this only needs to decompress and read the leading "details"
-    entry of the packed payload. It skips ``_unpack_payload``'s curve/object/
-    layer reconstruction entirely, which is what actually makes a full
-    ``_load_recovery()`` call expensive on an animation-heavy scene, so
-    list_recoveries() can afford to call this once per row.
-    """
-    try:
-        with io.open(path, "rb") as stream:
-            compiled = stream.read()
-        if len(compiled) < 3:
-            return None
-        version, _reason_code = struct.unpack("BB", compiled[:2])
-        if version != SCHEMA_VERSION:
-            return None
-        serialized = zlib.decompress(compiled[2:]).decode("utf-8")
-        packed = json.loads(serialized)
-        details = packed[0] if packed else []
-        return details[0] if len(details) > 0 else None
-    except Exception:
-        return None
-
-
-def _recovery_header(path):
-    """Return the lightweight format metadata needed to build a replay chain."""
-    with io.open(path, "rb") as stream:
-        header = stream.read(2)
-    if len(header) < 2:
-        raise ValueError("Invalid Animation Recovery file")
-    version, reason_code = struct.unpack("BB", header)
-    if version != SCHEMA_VERSION:
-        raise ValueError("Unsupported Animation Recovery version: {}".format(version))
-    return version, bool(reason_code & FULL_SNAPSHOT_FLAG)
-
-
 def _maya_file_io_active():
     """Avoid DG inspection while Maya is reading or writing scene data."""
     file_io = getattr(om, "MFileIO", None) if om is not None else None
@@ -425,14 +143,8 @@ def _node_uuid(node):
         return None
 
 
-def _split_plug(plug):
-    if not plug or "." not in plug:
-        return plug, ""
-    return plug.split(".", 1)
-
-
 def _endpoint_data(plug):
-    node, attribute = _split_plug(plug)
+    node, attribute = storage.split_plug(plug)
     return {
         "plug": plug,
         "node": node,
@@ -530,9 +242,66 @@ def _query_values(command, curve, flag):
         return []
 
 
-def _capture_curve(curve, layer_info=None):
-    node_type = cmds.nodeType(curve)
-    unitless_input = node_type.startswith("animCurveU")
+def _fn_value(value):
+    return value() if callable(value) else value
+
+
+def _api_curve_keys(curve, fn=None, tangent_types=None):
+    """Read a curve's keys, angles, weights and infinity in one API pass.
+
+    Returns the key fields of ``_capture_curve`` in command units, or None
+    when the API path is unavailable so the caller falls back to command
+    queries. Tangent *types* still come from ``cmds.keyTangent`` -- restore
+    feeds them straight back into it, the same reasoning global_curve's
+    ``_curve_snapshot`` spells out. *fn* and *tangent_types* let a fake
+    MFnAnimCurve-like object stand in for Maya.
+    """
+    fn = fn if fn is not None else maya_api.anim_curve_fn(curve)
+    if fn is None:
+        return None
+    positions = []
+    values = []
+    tangents = {"ia": [], "oa": [], "iw": [], "ow": []}
+    try:
+        count = int(_fn_value(fn.numKeys))
+        unitless_input = bool(_fn_value(fn.isUnitlessInput))
+        unit = maya_api.time_unit()
+        to_command = maya_api.anim_curve_value_converter(fn)
+        for index in range(count):
+            if unitless_input:
+                positions.append(float(fn.unitlessInput(index)))
+            else:
+                positions.append(float(fn.input(index).asUnits(unit)))
+            values.append(to_command(fn.value(index)))
+            in_angle, in_weight = fn.getTangentAngleWeight(index, True)
+            out_angle, out_weight = fn.getTangentAngleWeight(index, False)
+            tangents["ia"].append(float(in_angle.asDegrees()))
+            tangents["oa"].append(float(out_angle.asDegrees()))
+            tangents["iw"].append(float(in_weight))
+            tangents["ow"].append(float(out_weight))
+        weighted = bool(_fn_value(fn.isWeighted))
+        pre_infinity = int(_fn_value(fn.preInfinityType))
+        post_infinity = int(_fn_value(fn.postInfinityType))
+    except Exception:
+        return None
+    if tangent_types is None:
+        tangent_types = {
+            "itt": _query_values(cmds.keyTangent, curve, "inTangentType"),
+            "ott": _query_values(cmds.keyTangent, curve, "outTangentType"),
+        }
+    tangents.update(tangent_types)
+    return {
+        "unitless_input": unitless_input,
+        "positions": positions,
+        "values": values,
+        "tangents": tangents,
+        "weighted_tangents": weighted,
+        "pre_infinity": pre_infinity,
+        "post_infinity": post_infinity,
+    }
+
+
+def _command_curve_keys(curve, unitless_input):
     positions = _query_values(cmds.keyframe, curve, "floatChange" if unitless_input else "timeChange")
     values = _query_values(cmds.keyframe, curve, "valueChange")
     tangent_data = {}
@@ -555,9 +324,6 @@ def _capture_curve(curve, layer_info=None):
             return default
 
     return {
-        "name": curve,
-        "uuid": _node_uuid(curve),
-        "node_type": node_type,
         "unitless_input": unitless_input,
         "positions": positions,
         "values": values,
@@ -565,10 +331,76 @@ def _capture_curve(curve, layer_info=None):
         "weighted_tangents": weighted,
         "pre_infinity": _attribute("preInfinity"),
         "post_infinity": _attribute("postInfinity"),
+    }
+
+
+def _capture_curve(curve, layer_info=None, key_reader=_api_curve_keys):
+    """Capture one curve; *key_reader* supplies its keys (None: commands only)."""
+    node_type = cmds.nodeType(curve)
+    keys = key_reader(curve) if key_reader is not None else None
+    if keys is None:
+        keys = _command_curve_keys(curve, node_type.startswith("animCurveU"))
+    curve_data = {
+        "name": curve,
+        "uuid": _node_uuid(curve),
+        "node_type": node_type,
+    }
+    curve_data.update(keys)
+    curve_data.update({
         "input_connections": _connections("{}.input".format(curve), True, False),
         "output_connections": _connections("{}.output".format(curve), False, True),
         "layer": dict(layer_info) if layer_info else None,
-    }
+    })
+    return curve_data
+
+
+def _curve_cache_key(curve_data):
+    return curve_data.get("uuid") or curve_data.get("name")
+
+
+def _digest_column(digest, values):
+    values = tuple(values or ())
+    try:
+        data = array("d", values).tobytes()
+    except (TypeError, OverflowError):
+        data = repr(values).encode("utf-8")
+    digest.update(len(values).to_bytes(8, "little"))
+    digest.update(data)
+
+
+def _curve_content_hash(curve_data):
+    """Digest everything a checkpoint stores for one curve.
+
+    A blake2b digest over the packed key columns rather than Python's
+    ``hash()``, which collides on values as close as -1 and -2 and would
+    drop such an edit from the delta. The service keeps only this digest
+    per curve, never every curve's key data, to tell whether it changed.
+    """
+    tangents = curve_data.get("tangents") or {}
+    layer = curve_data.get("layer") or {}
+
+    def _endpoints(key):
+        return tuple(
+            (endpoint.get("plug"), endpoint.get("node_uuid"))
+            for endpoint in curve_data.get(key) or []
+        )
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((
+        curve_data.get("name"),
+        curve_data.get("node_type"),
+        bool(curve_data.get("weighted_tangents")),
+        curve_data.get("pre_infinity"),
+        curve_data.get("post_infinity"),
+        _endpoints("input_connections"),
+        _endpoints("output_connections"),
+        (layer.get("name"), layer.get("uuid"), layer.get("plug")),
+    )).encode("utf-8"))
+    _digest_column(digest, curve_data.get("positions"))
+    _digest_column(digest, curve_data.get("values"))
+    for key in storage.TANGENT_KEYS:
+        _digest_column(digest, tangents.get(key))
+    return digest.digest()
 
 
 def _layer_query(layer, flag, default=None):
@@ -694,7 +526,7 @@ def _scene_snapshot_meta(scene_id, reason, created, curves):
 
     return {
         "type": "animation_recovery",
-        "version": SCHEMA_VERSION,
+        "version": storage.SCHEMA_VERSION,
         "scene_id": scene_id,
         "created_at": created.isoformat(),
         "reason": reason,
@@ -716,7 +548,13 @@ def _scene_snapshot_meta(scene_id, reason, created, curves):
     }
 
 
-def capture_scene_animation(scene_id, reason="animation", layers_data=None, curve_layer_map=None):
+def capture_scene_animation(
+    scene_id,
+    reason="animation",
+    layers_data=None,
+    curve_layer_map=None,
+    key_reader=_api_curve_keys,
+):
     if curve_layer_map is None:
         layers_data, curve_layer_map = _animation_layers_snapshot()
     elif layers_data is None:
@@ -725,7 +563,11 @@ def capture_scene_animation(scene_id, reason="animation", layers_data=None, curv
     captured = []
     for curve in curves:
         try:
-            curve_data = _capture_curve(curve, layer_info=curve_layer_map.get(curve))
+            curve_data = _capture_curve(
+                curve,
+                layer_info=curve_layer_map.get(curve),
+                key_reader=key_reader,
+            )
             if curve_data.get("positions"):
                 captured.append(curve_data)
         except Exception:
@@ -872,24 +714,26 @@ def scene_recovery_folder(scene_id=None, create=False):
     return folder
 
 
-def _recovery_paths(scene_id=None):
+def _recovery_entries(scene_id=None):
+    """Return the sidecar index row of every readable checkpoint, oldest first.
+
+    Rows carry the reason, baseline flag, parent and capture details, so
+    listing a scene's history is one small index read rather than opening
+    (and for source files, decompressing) every checkpoint in the folder.
+    """
     folder = scene_recovery_folder(scene_id=scene_id, create=False)
     if not folder or not os.path.isdir(folder):
         return []
-    candidates = [
-        os.path.join(folder, filename)
-        for filename in os.listdir(folder)
-        if filename.lower().endswith(RECOVERY_EXTENSION)
+    entries = [
+        dict(entry, path=os.path.join(folder, name))
+        for name, entry in storage.read_recovery_index(folder).items()
     ]
-    paths = []
-    for path in candidates:
-        try:
-            _recovery_header(path)
-        except (IOError, OSError, ValueError, struct.error):
-            continue
-        paths.append(path)
-    paths.sort(key=_parse_filename_timestamp)
-    return paths
+    entries.sort(key=lambda entry: _parse_filename_timestamp(entry["path"]))
+    return entries
+
+
+def _recovery_paths(scene_id=None):
+    return [entry["path"] for entry in _recovery_entries(scene_id=scene_id)]
 
 
 def _recovery_scene_id(path):
@@ -902,14 +746,14 @@ def _recovery_scene_id(path):
 
 
 def list_recoveries(scene_id=None):
-    paths = _recovery_paths(scene_id=scene_id)
     entries = []
-    for index, path in enumerate(paths):
+    for index, index_entry in enumerate(_recovery_entries(scene_id=scene_id)):
         entries.append({
             "change": index + 1,
-            "path": path,
-            "created": _parse_filename_timestamp(path),
-            "reason": _recovery_reason(path),
+            "path": index_entry["path"],
+            "created": _parse_filename_timestamp(index_entry["path"]),
+            "reason": index_entry.get("reason") or "animation",
+            "source_file": index_entry.get("source_file"),
         })
     entries.reverse()
 
@@ -924,7 +768,7 @@ def list_recoveries(scene_id=None):
         if entry["reason"] != "scene_save":
             entry["status"] = "white"
             continue
-        key = _recovery_source_file(entry["path"]) or entry["path"]
+        key = entry["source_file"] or entry["path"]
         entry["status"] = "muted_green" if key in seen_filenames else "green"
         seen_filenames.add(key)
 
@@ -939,10 +783,11 @@ def newer_recovery_for_current_scene(scene_id=None):
         scene_path = ""
     if not scene_path or not os.path.isfile(scene_path):
         return None
-    paths = _recovery_paths(scene_id=scene_id)
-    if not paths:
+    index_entries = _recovery_entries(scene_id=scene_id)
+    if not index_entries:
         return None
-    newest_path = paths[-1]
+    latest = index_entries[-1]
+    newest_path = latest["path"]
 
     stamped_timestamp = last_saved_checkpoint()
     if stamped_timestamp is not None:
@@ -955,35 +800,26 @@ def newer_recovery_for_current_scene(scene_id=None):
             return None
         return newest_path
 
-    entries = list_recoveries(scene_id=scene_id)
-    if not entries:
-        return None
-    latest = entries[0]
     try:
         scene_mtime = os.path.getmtime(scene_path)
-        checkpoint_time = time.mktime(latest["created"].timetuple()) + (
-            latest["created"].microsecond / 1000000.0
-        )
-    except (KeyError, OSError, TypeError, ValueError, OverflowError):
+        created = _parse_filename_timestamp(newest_path)
+        checkpoint_time = time.mktime(created.timetuple()) + (created.microsecond / 1000000.0)
+    except (OSError, TypeError, ValueError, OverflowError):
         return None
     if checkpoint_time <= scene_mtime:
         return None
 
-    try:
-        details = recovery_details(latest["path"])
-    except Exception:
-        details = {}
     if latest.get("reason") == "scene_save":
-        source_file = details.get("source_file")
-        location = details.get("location")
+        source_file = latest.get("source_file")
+        location = latest.get("location")
         saved_path = os.path.join(location, source_file) if location and source_file else ""
         same_path = bool(saved_path) and os.path.normcase(os.path.realpath(saved_path)) == os.path.normcase(
             os.path.realpath(scene_path)
         )
-        saved_mtime = details.get("source_mtime")
+        saved_mtime = latest.get("source_mtime")
         if same_path and saved_mtime is not None and scene_mtime >= float(saved_mtime):
             return None
-    return latest["path"]
+    return newest_path
 
 
 def _entity_matches(left, right):
@@ -1032,30 +868,122 @@ def _removed_curve_attributes(removed_curves):
     for marker in removed_curves:
         for endpoint in marker.get("output_connections") or []:
             plug = _resolve_endpoint(endpoint, uuid_lookup)
-            node, attribute = _split_plug(plug)
+            node, attribute = storage.split_plug(plug)
             if node and attribute:
                 result.setdefault(node, set()).add(attribute)
     return result
 
 
-def _merge_curve(items, item):
-    items[:] = [existing for existing in items if not _curve_matches(existing, item)]
-    items.append(item)
-
-
-def _remove_curve(items, marker):
-    items[:] = [existing for existing in items if not _curve_matches(existing, marker)]
+class _ReplayIndex:
+    """Records accumulated while replaying one checkpoint chain.
 
+    Matching follows ``_entity_matches``/``_curve_matches`` exactly, but is
+    answered from uuid, name and output-target lookups instead of comparing
+    every accumulated record, so replaying a chain stays linear in the number
+    of records it carries. Insertion order is preserved, which keeps the
+    merged result (and its name-sorted ties) identical to a list replay.
+    """
 
-def _merge_object(items, item):
-    for existing in items:
-        if not _entity_matches(existing, item):
-            continue
+    def __init__(self, track_targets=False):
+        self.records = {}
+        self._keys = {}
+        self._serial = 0
+        self._by_uuid = {}
+        self._by_name = {}
+        # Names of records without a uuid: those still match by name even
+        # when the incoming record carries one.
+        self._by_bare_name = {}
+        self._by_target = {} if track_targets else None
+
+    def __len__(self):
+        return len(self.records)
+
+    def values(self):
+        return list(self.records.values())
+
+    def _record_keys(self, record):
+        targets = _curve_targets(record) if self._by_target is not None else set()
+        return record.get("uuid"), record.get("name"), targets
+
+    def _index(self, serial):
+        record_uuid, name, targets = self._keys[serial] = self._record_keys(self.records[serial])
+        if record_uuid:
+            self._by_uuid.setdefault(record_uuid, set()).add(serial)
+        if name:
+            self._by_name.setdefault(name, set()).add(serial)
+            if not record_uuid:
+                self._by_bare_name.setdefault(name, set()).add(serial)
+        for target in targets:
+            self._by_target.setdefault(target, set()).add(serial)
+
+    def _unindex(self, serial):
+        record_uuid, name, targets = self._keys.pop(serial)
+        lookups = [(self._by_uuid, record_uuid), (self._by_name, name), (self._by_bare_name, name)]
+        lookups.extend((self._by_target, target) for target in targets)
+        for lookup, key in lookups:
+            serials = lookup.get(key)
+            if serials is None:
+                continue
+            serials.discard(serial)
+            if not serials:
+                del lookup[key]
+
+    def entity_matches(self, record):
+        """Serials matching *record* under ``_entity_matches``."""
+        record_uuid = record.get("uuid")
+        name = record.get("name")
+        matches = set()
+        if record_uuid:
+            matches.update(self._by_uuid.get(record_uuid, ()))
+            if name:
+                matches.update(self._by_bare_name.get(name, ()))
+        elif name:
+            matches.update(self._by_name.get(name, ()))
+        return matches
+
+    def curve_matches(self, record):
+        """Serials matching *record* under ``_curve_matches``."""
+        matches = self.entity_matches(record)
+        for target in _curve_targets(record):
+            matches.update(self._by_target.get(target, ()))
+        return matches
+
+    def add(self, record):
+        self._serial += 1
+        self.records[self._serial] = record
+        self._index(self._serial)
+        return self._serial
+
+    def reindex(self, serial):
+        self._unindex(serial)
+        self._index(serial)
+
+    def discard(self, serials):
+        for serial in serials:
+            self._unindex(serial)
+            del self.records[serial]
+
+
+def _merge_curve(index, item):
+    index.discard(index.curve_matches(item))
+    index.add(item)
+
+
+def _remove_curve(index, marker):
+    index.discard(index.curve_matches(marker))
+
+
+def _merge_object(index, item):
+    matches = index.entity_matches(item)
+    if matches:
+        serial = min(matches)
+        existing = index.records[serial]
         existing["name"] = item.get("name") or existing.get("name")
         existing["uuid"] = item.get("uuid") or existing.get("uuid")
         existing.setdefault("attributes", {}).update(item.get("attributes") or {})
+        index.reindex(serial)
         return
-    items.append({
+    index.add({
         "name": item.get("name"),
         "uuid": item.get("uuid"),
         "attributes": dict(item.get("attributes") or {}),
@@ -1066,10 +994,10 @@ def _recovery_chain_paths(path):
     """Return the shortest complete checkpoint chain ending at *path*."""
     target = os.path.realpath(path)
     folder = os.path.dirname(target)
-    paths = _recovery_paths(scene_id=os.path.basename(folder))
+    entries = _recovery_entries(scene_id=os.path.basename(folder))
     target_index = None
-    for index, checkpoint_path in enumerate(paths):
-        if os.path.realpath(checkpoint_path) == target:
+    for index, entry in enumerate(entries):
+        if os.path.realpath(entry["path"]) == target:
             target_index = index
             break
     if target_index is None:
@@ -1077,26 +1005,25 @@ def _recovery_chain_paths(path):
 
     start_index = 0
     for index in range(target_index, -1, -1):
-        _version, full_snapshot = _recovery_header(paths[index])
-        if full_snapshot:
+        if entries[index].get("full"):
             start_index = index
             break
-    return paths[start_index:target_index + 1]
+    return [entry["path"] for entry in entries[start_index:target_index + 1]]
 
 
 def _load_merged_recovery(path, operation=None, chain_paths=None):
     """Rebuild one point by replaying its verified checkpoint chain."""
     target = os.path.realpath(path)
     paths = chain_paths or _recovery_chain_paths(path)
-    curves = []
-    objects = []
+    curves = _ReplayIndex(track_targets=True)
+    objects = _ReplayIndex()
     layers = []
     target_payload = None
     previous_name = None
     for checkpoint_path in paths:
         if operation and operation.cancelled:
             return None
-        payload = _load_recovery(checkpoint_path)
+        payload = storage.load_recovery(checkpoint_path)
         meta = payload.get("meta") or {}
         full_snapshot = bool(meta.get("full_snapshot"))
         if not full_snapshot:
@@ -1108,8 +1035,8 @@ def _load_merged_recovery(path, operation=None, chain_paths=None):
                     )
                 )
         if full_snapshot:
-            curves = []
-            objects = []
+            curves = _ReplayIndex(track_targets=True)
+            objects = _ReplayIndex()
         for marker in payload.get("removed_curves") or []:
             _remove_curve(curves, marker)
         for curve in payload.get("curves") or []:
@@ -1130,8 +1057,8 @@ def _load_merged_recovery(path, operation=None, chain_paths=None):
         raise ValueError("Recovery checkpoint is not part of the current scene")
     return {
         "meta": target_payload.get("meta") or {},
-        "curves": sorted(curves, key=lambda item: item.get("name") or ""),
-        "objects": sorted(objects, key=lambda item: item.get("name") or ""),
+        "curves": sorted(curves.values(), key=lambda item: item.get("name") or ""),
+        "objects": sorted(objects.values(), key=lambda item: item.get("name") or ""),
         "layers": sorted(layers, key=lambda item: item.get("name") or ""),
     }
 
@@ -1149,23 +1076,18 @@ def _newest_valid_recovery(paths):
 
 def _prune_recovery_history(scene_id):
     """Keep recent complete baseline generations without orphaning deltas."""
-    paths = _recovery_paths(scene_id=scene_id)
-    baseline_indices = []
-    for index, checkpoint_path in enumerate(paths):
-        try:
-            _version, full_snapshot = _recovery_header(checkpoint_path)
-        except Exception:
-            continue
-        if full_snapshot:
-            baseline_indices.append(index)
+    entries = _recovery_entries(scene_id=scene_id)
+    baseline_indices = [
+        index for index, entry in enumerate(entries) if entry.get("full")
+    ]
     if len(baseline_indices) <= MAX_BASELINE_GENERATIONS:
         return 0
 
     cutoff = baseline_indices[-MAX_BASELINE_GENERATIONS]
     removed = 0
-    for checkpoint_path in paths[:cutoff]:
+    for entry in entries[:cutoff]:
         try:
-            os.remove(checkpoint_path)
+            os.remove(entry["path"])
             removed += 1
         except OSError:
             continue
@@ -1184,8 +1106,13 @@ def delete_recovery(path):
 
 
 def recovery_details(path):
-    payload = _load_recovery(path)
-    meta = dict(payload.get("meta") or {})
+    entry = storage.read_recovery_index(os.path.dirname(path)).get(os.path.basename(path))
+    if entry is None:
+        meta = dict(storage.load_recovery(path).get("meta") or {})
+    else:
+        meta = dict(entry)
+        meta["full_snapshot"] = meta.pop("full", False)
+        meta["parent_checkpoint"] = meta.pop("parent", None)
     meta.setdefault("created", _parse_filename_timestamp(path))
     created_at = meta.get("created_at")
     if created_at:
@@ -1738,6 +1665,174 @@ def _set_curve_keys(curve, curve_data, operation=None):
     return True
 
 
+def _api_tangent_type(name):
+    attribute = _API_TANGENT_TYPES.get(name)
+    if oma is None or not attribute:
+        return None
+    return getattr(oma.MFnAnimCurve, attribute, None)
+
+
+def _tangent_field(tangents, short_name, index):
+    values = tangents.get(short_name) or []
+    return values[index] if index < len(values) else None
+
+
+def _api_fill_curve(curve, curve_data, change=None):
+    """Write every key of *curve_data* onto *curve* in one API pass.
+
+    Without *change*, *curve* must be empty and created inside the restore's
+    undo chunk: undoing that creation discards these unjournaled edits with
+    the node. With *change*, *curve* is an existing node edited in place --
+    its keys are cleared and rewritten on *change*, so the node keeps its
+    name, uuid, connections, color, extra attributes and notes.
+    Tangents follow ``_set_curve_keys`` -- angles and weights first, then the
+    types again so computed types (auto, spline...) settle the same way.
+    Returns False when the data needs the command path instead.
+    """
+    if om is None or oma is None:
+        return False
+    fn = maya_api.anim_curve_fn(curve)
+    if fn is None:
+        return False
+    positions = curve_data.get("positions") or []
+    values = curve_data.get("values") or []
+    tangents = curve_data.get("tangents") or {}
+    count = min(len(positions), len(values))
+    types = []
+    for index in range(count):
+        pair = []
+        for short_name in ("itt", "ott"):
+            name = _tangent_field(tangents, short_name, index)
+            tangent_type = None if name is None else _api_tangent_type(name)
+            if name is not None and tangent_type is None:
+                return False
+            pair.append(tangent_type)
+        types.append(pair)
+    try:
+        unitless_input = bool(_fn_value(fn.isUnitlessInput))
+        if unitless_input != bool(curve_data.get("unitless_input")):
+            return False
+        existing = int(_fn_value(fn.numKeys))
+        if existing and change is None:
+            return False
+        for index in range(existing - 1, -1, -1):
+            fn.remove(index, change=change)
+        to_internal = maya_api.anim_curve_internal_value_converter(fn)
+        fn.setIsWeighted(bool(curve_data.get("weighted_tangents")), change=change)
+        if unitless_input:
+            for index in range(count):
+                fn.addKey(float(positions[index]), to_internal(values[index]), change=change)
+        elif count:
+            unit = maya_api.time_unit()
+            fn.addKeys(
+                om.MTimeArray([om.MTime(float(position), unit) for position in positions[:count]]),
+                om.MDoubleArray([to_internal(value) for value in values[:count]]),
+                keepExistingKeys=False,
+                change=change,
+            )
+        for index, (in_type, out_type) in enumerate(types):
+            in_angle = _tangent_field(tangents, "ia", index)
+            out_angle = _tangent_field(tangents, "oa", index)
+            if in_angle is not None and out_angle is not None and in_angle != out_angle:
+                fn.setTangentsLocked(index, False, change=change)
+            for is_in_tangent, angle, weight_name in (
+                (True, in_angle, "iw"),
+                (False, out_angle, "ow"),
+            ):
+                if angle is None:
+                    continue
+                weight = _tangent_field(tangents, weight_name, index)
+                if weight is None:
+                    weight = fn.getTangentAngleWeight(index, is_in_tangent)[1]
+                fn.setTangent(
+                    index,
+                    om.MAngle(float(angle), om.MAngle.kDegrees),
+                    float(weight),
+                    is_in_tangent,
+                    change=change,
+                )
+            if in_type is not None:
+                fn.setInTangentType(index, in_type, change=change)
+            if out_type is not None:
+                fn.setOutTangentType(index, out_type, change=change)
+        fn.setPreInfinityType(int(curve_data.get("pre_infinity") or 0), change=change)
+        fn.setPostInfinityType(int(curve_data.get("post_infinity") or 0), change=change)
+    except Exception:
+        return False
+    return True
+
+
+def _curve_editable_in_place(curve, curve_data):
+    """Whether *curve*'s keys may be rewritten through the API on a change."""
+    if om is None or oma is None:
+        return False
+    try:
+        if cmds.nodeType(curve) != curve_data.get("node_type"):
+            return False
+        if cmds.referenceQuery(curve, isNodeReferenced=True):
+            return False
+        return not (cmds.lockNode(curve, query=True, lock=True) or [False])[0]
+    except Exception:
+        return False
+
+
+def _api_rewrite_curve(curve, curve_data):
+    """Rewrite the existing *curve*'s keys in place as one undoable change.
+
+    The edit is rolled back, leaving *curve* as it was for the command
+    path, when the API can't write the data or the change can't be committed.
+    """
+    change = api_undo.begin()
+    if change is None:
+        return False
+    try:
+        written = _api_fill_curve(curve, curve_data, change=change)
+    except Exception:
+        written = False
+    if written and api_undo.commit(change):
+        return True
+    api_undo.rollback(change)
+    return False
+
+
+def _curve_restore_node(curve_data):
+    """The node a saved curve animates, so one node's curves restore together."""
+    layer_node, _attribute = storage.split_plug((curve_data.get("layer") or {}).get("plug"))
+    if layer_node:
+        return layer_node
+    for endpoint in curve_data.get("output_connections") or []:
+        node = endpoint.get("node") or endpoint.get("node_uuid")
+        if node:
+            return node
+    return curve_data.get("name") or ""
+
+
+def _curve_restore_batches(curves_data):
+    """Curve index batches in node order, bounded by curve and key count."""
+    plan = sorted(
+        (
+            (_curve_restore_node(curve_data), curve_data.get("name") or ""),
+            index,
+            len(curve_data.get("positions") or []),
+        )
+        for index, curve_data in enumerate(curves_data)
+    )
+    batch = []
+    batch_keys = 0
+    for _order, index, key_count in plan:
+        if batch and (
+            len(batch) >= RESTORE_BATCH_CURVES
+            or batch_keys + key_count > RESTORE_BATCH_KEYS
+        ):
+            yield batch
+            batch = []
+            batch_keys = 0
+        batch.append(index)
+        batch_keys += key_count
+    if batch:
+        yield batch
+
+
 def _curve_maps(curves=None):
     curves = list(curves) if curves is not None else (cmds.ls(type="animCurve") or [])
     by_name = {curve: curve for curve in curves}
@@ -1818,7 +1913,7 @@ def _filter_recovery_to_selection(curves_data, objects_data, selected_nodes):
     filtered_curves = []
     for curve_data in curves_data:
         layer_plug = (curve_data.get("layer") or {}).get("plug")
-        layer_node, _layer_attribute = _split_plug(layer_plug)
+        layer_node, _layer_attribute = storage.split_plug(layer_plug)
         if (
             curve_data.get("name") in current_curves
             or curve_data.get("uuid") in current_curve_uuids
@@ -1922,12 +2017,24 @@ def _restore_recovery_worker(operation, path, chain_paths, scene_id):
     it to the current selection, and sizing the progress total) is bounded
     by curve/object/layer *count*, not by how many keys each curve carries
     -- the actual worst case this implementation targets -- so
-    it's marshaled as a single batch rather than item-by-item. The curve
-    restore loop just below it, which can each carry many keys and is what
-    dominates the cost on a big recovery, gets a marshal hop *per curve*
-    instead, so Cancel has many chances to land during a large restore
-    instead of only before/after the whole thing.
+    it's marshaled as a single batch rather than item-by-item. Curves then
+    follow the layers they may feed, grouped by the node they animate and
+    handed over in bounded batches (``_curve_restore_batches``), so Cancel
+    lands between batches without a marshal hop per curve. Each curve's keys
+    go in through one MFnAnimCurve pass -- unjournaled on a node created
+    inside the undo chunk, on an undoable ``api_undo`` change for a curve
+    that already exists -- falling back to ``_set_curve_keys`` where that is
+    not possible.
     """
+    timings = {}
+    phase_start = time.perf_counter()
+
+    def _phase(name):
+        nonlocal phase_start
+        now = time.perf_counter()
+        timings[name] = (now - phase_start) * 1000.0
+        phase_start = now
+
     def _setup():
         payload = _load_merged_recovery(path, operation=operation, chain_paths=chain_paths)
         if payload is None:
@@ -1980,12 +2087,13 @@ def _restore_recovery_worker(operation, path, chain_paths, scene_id):
             )
             for item in curves_data
         )
-        key_removal_total = 0
+        removal_counts = []
         for item in curves_data:
             curve = by_uuid.get(item.get("uuid"))
             if not curve and not item.get("uuid"):
                 curve = by_name.get(item.get("name"))
-            key_removal_total += _curve_key_removal_count(curve, item)
+            removal_counts.append(_curve_key_removal_count(curve, item))
+        key_removal_total = sum(removal_counts)
         attribute_total = sum(len(item.get("attributes") or {}) for item in objects_data)
         if allowed_layer_plugs is not None:
             layer_member_count = sum(
@@ -2007,6 +2115,8 @@ def _restore_recovery_worker(operation, path, chain_paths, scene_id):
         return {
             "empty": False,
             "curves_data": curves_data,
+            "removal_counts": removal_counts,
+            "timerange": _curves_timerange(curves_data),
             "objects_data": objects_data,
             "selection_scoped": selection_scoped,
             "allowed_layer_plugs": allowed_layer_plugs,
@@ -2033,6 +2143,7 @@ def _restore_recovery_worker(operation, path, chain_paths, scene_id):
         return False
 
     curves_data = setup["curves_data"]
+    removal_counts = setup["removal_counts"]
     objects_data = setup["objects_data"]
     selection_scoped = setup["selection_scoped"]
     allowed_layer_plugs = setup["allowed_layer_plugs"]
@@ -2041,8 +2152,11 @@ def _restore_recovery_worker(operation, path, chain_paths, scene_id):
     by_uuid = setup["by_uuid"]
     extra_curves = setup["extra_curves"]
     uuid_lookup = setup["uuid_lookup"]
-
+    timerange = setup["timerange"]
     operation.set_total(setup["total"], reset=False)
+    setup = None
+    _phase("setup")
+
     operation.set_status("Applying recovery")
     for curve in extra_curves:
         if operation.cancelled:
@@ -2068,34 +2182,59 @@ def _restore_recovery_worker(operation, path, chain_paths, scene_id):
         restore_layers_data, layer_name_map, operation, allowed_layer_plugs,
     ):
         return False
+    _phase("layers")
     operation.set_status("Applying recovery")
 
-    def _restore_one_curve(curve_data):
+    def _restore_one_curve(curve_data, removal_count):
+        key_count = min(
+            len(curve_data.get("positions") or []),
+            len(curve_data.get("values") or []),
+        )
         curve_uuid = curve_data.get("uuid")
         curve = by_uuid.get(curve_uuid)
         if not curve and not curve_uuid:
             curve = by_name.get(curve_data.get("name"))
+        created = False
         if not curve or not cmds.objExists(curve):
             if not _has_resolvable_curve_output(curve_data, uuid_lookup, layer_name_map):
-                skipped_keys = min(
-                    len(curve_data.get("positions") or []),
-                    len(curve_data.get("values") or []),
-                )
-                if skipped_keys:
-                    operation.step(skipped_keys)
+                if key_count:
+                    operation.step(key_count)
                 return True
             curve = cmds.createNode(curve_data.get("node_type") or "animCurveTU", name=curve_data.get("name"))
+            created = True
         _connect_curve(curve, curve_data, uuid_lookup)
         _connect_curve_output(curve, curve_data, uuid_lookup, layer_name_map)
+        if created:
+            if _api_fill_curve(curve, curve_data):
+                if key_count:
+                    operation.step(key_count)
+                return True
+        elif _curve_editable_in_place(curve, curve_data) and _api_rewrite_curve(curve, curve_data):
+            if key_count + removal_count:
+                operation.step(key_count + removal_count)
+            return True
         return _set_curve_keys(curve, curve_data, operation=operation)
 
-    for curve_data in curves_data:
+    def _restore_curve_batch(indices):
+        for index in indices:
+            if not _restore_one_curve(curves_data[index], removal_counts[index]):
+                return False
+            # Written curves are dropped as the restore goes, so the
+            # merged payload shrinks instead of being held to the end.
+            curves_data[index] = None
+        return True
+
+    curve_count = len(curves_data)
+    key_count = sum(len(curve_data.get("positions") or []) for curve_data in curves_data)
+    for batch in _curve_restore_batches(curves_data):
         if operation.cancelled:
             return False
-        if not operation.run_on_main(_restore_one_curve, curve_data):
+        if not operation.run_on_main(_restore_curve_batch, batch):
             return False
+    _phase("curves")
     if not operation.run_on_main(_restore_object_states, objects_data, uuid_lookup, operation):
         return False
+    _phase("objects")
 
     # Lock state is applied last so it never blocks membership/curve
     # reconnection above -- a locked layer cannot receive new members.
@@ -2106,8 +2245,12 @@ def _restore_recovery_worker(operation, path, chain_paths, scene_id):
     # operation.success + operation.timerange -- same handoff paste
     # animation uses, just resolved after restore instead of before it,
     # since the recovered range isn't known until curves_data loads.
-    operation.timerange = _curves_timerange(curves_data)
+    operation.timerange = timerange
     operation.success = True
+    toolCommon.debug_timing_log(
+        "animation_recovery_restore {} curves {} keys".format(curve_count, key_count),
+        **timings
+    )
     return True
 
 
@@ -2121,47 +2264,193 @@ class _SnapshotWriterSignals(QtCore.QObject):
     failed = QtCore.Signal(str)
 
 
+def _coalesce_checkpoints(older, newer):
+    """Fold two consecutive queued checkpoints into one with the same replay.
+
+    The result keeps *older*'s parent, so the chain on disk stays intact. Any
+    carried curve that a later one replaces or removes becomes a removal
+    marker, because replaying it would still have dropped whatever it matched.
+    """
+    newer_meta = newer.get("meta") or {}
+    if newer_meta.get("full_snapshot"):
+        return newer
+    older_meta = older.get("meta") or {}
+    older_curves = older.get("curves") or []
+    newer_curves = newer.get("curves") or []
+    curves = _ReplayIndex(track_targets=True)
+    for curve in older_curves:
+        _merge_curve(curves, curve)
+    for marker in newer.get("removed_curves") or []:
+        _remove_curve(curves, marker)
+    for curve in newer_curves:
+        _merge_curve(curves, curve)
+    surviving = set(id(curve) for curve in curves.values())
+    removed = list(older.get("removed_curves") or [])
+    removed.extend(
+        _curve_marker(curve)
+        for curve in older_curves + newer_curves
+        if id(curve) not in surviving
+    )
+    removed.extend(newer.get("removed_curves") or [])
+    objects = _ReplayIndex()
+    for object_data in (older.get("objects") or []) + (newer.get("objects") or []):
+        _merge_object(objects, object_data)
+    merged_curves = curves.values()
+    meta = dict(newer_meta)
+    meta["full_snapshot"] = bool(older_meta.get("full_snapshot"))
+    meta["parent_checkpoint"] = older_meta.get("parent_checkpoint")
+    meta["curve_count"] = len(merged_curves)
+    meta["key_count"] = sum(len(curve.get("positions") or []) for curve in merged_curves)
+    layers = newer.get("layers")
+    return {
+        "meta": meta,
+        "curves": merged_curves,
+        "removed_curves": [] if meta["full_snapshot"] else removed,
+        "objects": objects.values(),
+        "layers": older.get("layers") if layers is None else layers,
+    }
+
+
+def _can_coalesce(older_path, older, newer_path, newer):
+    """Whether *newer* directly follows *older* and *older* may go unwritten."""
+    if os.path.dirname(older_path) != os.path.dirname(newer_path):
+        return False
+    older_meta = older.get("meta") or {}
+    newer_meta = newer.get("meta") or {}
+    # Pre-save checkpoints are what a user picks from the recovery list;
+    # never fold one away.
+    if older_meta.get("reason") == "scene_save":
+        return False
+    return newer_meta.get("parent_checkpoint") == os.path.basename(older_path)
+
+
+class _SnapshotWriteQueue:
+    """Bounded FIFO drained by a single writer task on the service pool.
+
+    Checkpoints are written strictly in submission order, so a delta's
+    parent always reaches disk first. Once ``depth`` checkpoints are
+    waiting, new deltas are folded into the newest queued one instead of
+    growing the queue while the disk catches up.
+    """
+
+    def __init__(self, thread_pool, signals, depth=WRITE_QUEUE_DEPTH):
+        self.thread_pool = thread_pool
+        self.signals = signals
+        try:
+            self.depth = max(1, int(depth))
+        except (TypeError, ValueError):
+            self.depth = WRITE_QUEUE_DEPTH
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._draining = False
+        self._stats = {
+            "queued": 0,
+            "coalesced": 0,
+            "written": 0,
+            "failed": 0,
+            "bytes_written": 0,
+        }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self):
+        with self._lock:
+            result = dict(self._stats)
+            result["pending"] = len(self._pending)
+        return result
+
+    def submit(self, path, payload):
+        with self._lock:
+            self._stats["queued"] += 1
+            if len(self._pending) >= self.depth:
+                older_path, older = self._pending[-1]
+                if _can_coalesce(older_path, older, path, payload):
+                    self._pending[-1] = (path, _coalesce_checkpoints(older, payload))
+                    self._stats["coalesced"] += 1
+                    return
+            self._pending.append((path, payload))
+            if self._draining:
+                return
+            self._draining = True
+        self.thread_pool.start(_SnapshotWriteTask(self))
+
+    def _next(self):
+        with self._lock:
+            if not self._pending:
+                self._draining = False
+                return None
+            return self._pending.popleft()
+
+    def _record(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def _write(self, path, payload):
+        meta = payload.get("meta") or {}
+        parent_name = meta.get("parent_checkpoint")
+        if not meta.get("full_snapshot") and parent_name:
+            parent_path = os.path.join(os.path.dirname(path), parent_name)
+            if not os.path.isfile(parent_path):
+                raise IOError(
+                    "Animation Recovery parent checkpoint was not saved: {}".format(parent_name)
+                )
+        byte_size = storage.write_recovery_atomic(path, payload)
+        self._record("bytes_written", byte_size)
+        try:
+            storage.append_index_entries(
+                os.path.dirname(path),
+                [storage.index_entry(path, payload, byte_size)],
+            )
+        except Exception:
+            # The index rebuilds missing rows from the checkpoints
+            # themselves, so a failed append must not fail the write.
+            pass
+        scene_id = _recovery_scene_id(path)
+        if scene_id and meta.get("full_snapshot"):
+            try:
+                _prune_recovery_history(scene_id)
+            except Exception:
+                # Retention is maintenance; a successfully written recovery
+                # must remain successful if old files cannot be removed.
+                pass
+
+    def drain(self):
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            path, payload = item
+            try:
+                self._write(path, payload)
+            except Exception as exc:
+                self._record("failed")
+                self.signals.failed.emit(str(exc))
+                continue
+            self._record("written")
+            self.signals.saved.emit(path)
+
+
 class _SnapshotWriteTask(QtCore.QRunnable):
-    def __init__(self, path, payload, signals):
+    def __init__(self, queue):
         QtCore.QRunnable.__init__(self)
-        self.path = path
-        self.payload = payload
-        self.signals = signals
+        self.queue = queue
         self.setAutoDelete(True)
 
     def run(self):
-        try:
-            meta = self.payload.get("meta") or {}
-            parent_name = meta.get("parent_checkpoint")
-            if not meta.get("full_snapshot") and parent_name:
-                parent_path = os.path.join(os.path.dirname(self.path), parent_name)
-                if not os.path.isfile(parent_path):
-                    raise IOError(
-                        "Animation Recovery parent checkpoint was not saved: {}".format(
-                            parent_name
-                        )
-                    )
-            _write_recovery_atomic(self.path, self.payload)
-            scene_id = _recovery_scene_id(self.path)
-            if scene_id and meta.get("full_snapshot"):
-                try:
-                    _prune_recovery_history(scene_id)
-                except Exception:
-                    # Retention is maintenance; a successfully written recovery
-                    # must remain successful if old files cannot be removed.
-                    pass
-        except Exception as exc:
-            self.signals.failed.emit(str(exc))
-            return
-        self.signals.saved.emit(self.path)
+        self.queue.drain()
 
 
 class AnimationRecoveryService(QtCore.QObject):
     snapshotSaved = QtCore.Signal(str)
 
-    def __init__(self, manager):
+    def __init__(self, manager, curve_key_reader=_api_curve_keys):
         QtCore.QObject.__init__(self, manager)
         self.manager = manager
+        # Injectable so capture can run against fake curves; None forces the
+        # command-query path.
+        self.curve_key_reader = curve_key_reader
         self.scene_id = None
         self._suspend_count = 0
         self._pending_reason = None
@@ -2170,6 +2459,7 @@ class AnimationRecoveryService(QtCore.QObject):
         self._pending_object_attributes = {}
         self._full_refresh_pending = False
         self._curve_cache = None
+        self._curve_hashes = {}
         self._layer_cache = None
         self._object_cache = {}
         self._attribute_cache = {}
@@ -2190,6 +2480,13 @@ class AnimationRecoveryService(QtCore.QObject):
         self._writer_signals = _SnapshotWriterSignals(self)
         self._writer_signals.saved.connect(self._on_snapshot_saved)
         self._writer_signals.failed.connect(self._on_snapshot_failed)
+        self._write_queue = _SnapshotWriteQueue(
+            self._thread_pool,
+            self._writer_signals,
+            depth=settings.get_setting(
+                WRITE_QUEUE_SETTING, WRITE_QUEUE_DEPTH, namespace=SETTINGS_NAMESPACE
+            ),
+        )
 
     @contextmanager
     def suspended(self):
@@ -2241,7 +2538,7 @@ class AnimationRecoveryService(QtCore.QObject):
             return
         try:
             chain_paths = _recovery_chain_paths(valid_path)
-            _version, full_snapshot = _recovery_header(chain_paths[0])
+            _version, full_snapshot = storage.recovery_header(chain_paths[0])
             baseline_offset = 1 if full_snapshot else 0
             self._snapshots_since_baseline = max(0, len(chain_paths) - baseline_offset)
         except Exception:
@@ -2308,6 +2605,7 @@ class AnimationRecoveryService(QtCore.QObject):
             self.manager.disconnect_callbacks(key)
         self.scene_id = None
         self._curve_cache = None
+        self._curve_hashes = {}
         self._layer_cache = None
         self.discard_pending()
         self._object_cache.clear()
@@ -2321,6 +2619,7 @@ class AnimationRecoveryService(QtCore.QObject):
         with self.suspended():
             self.discard_pending()
             self._curve_cache = None
+            self._curve_hashes = {}
             self._layer_cache = None
             self._object_cache.clear()
             self._attribute_cache.clear()
@@ -2543,29 +2842,41 @@ class AnimationRecoveryService(QtCore.QObject):
             reason=reason,
             layers_data=layers_data,
             curve_layer_map=curve_layer_map,
+            key_reader=self.curve_key_reader,
         )
-        current_cache = {
+        current_curves = {
             curve_data.get("name"): curve_data
             for curve_data in payload.get("curves") or []
             if curve_data.get("name")
         }
+        current_hashes = {
+            _curve_cache_key(curve_data): _curve_content_hash(curve_data)
+            for curve_data in current_curves.values()
+        }
         baseline = self._curve_cache is None or bool(force_baseline)
         previous_cache = self._curve_cache or {}
         if baseline:
-            changed_curves = list(current_cache.values())
+            changed_curves = list(current_curves.values())
             removed_curves = []
         else:
             changed_curves = [
                 curve_data
-                for name, curve_data in current_cache.items()
-                if previous_cache.get(name) != curve_data
+                for curve_data in current_curves.values()
+                if self._curve_hashes.get(_curve_cache_key(curve_data))
+                != current_hashes[_curve_cache_key(curve_data)]
             ]
             removed_curves = [
-                _curve_marker(curve_data, fallback_name=name)
-                for name, curve_data in previous_cache.items()
-                if name not in current_cache
+                _curve_marker(marker, fallback_name=name)
+                for name, marker in previous_cache.items()
+                if name not in current_curves
             ]
-        self._curve_cache = current_cache
+        # Only markers (for removal) and content hashes (for change
+        # detection) stay in memory between checkpoints, never key data.
+        self._curve_cache = {
+            name: _curve_marker(curve_data)
+            for name, curve_data in current_curves.items()
+        }
+        self._curve_hashes = current_hashes
         payload["curves"] = changed_curves
         payload["removed_curves"] = removed_curves
         payload["meta"]["full_snapshot"] = baseline
@@ -2577,25 +2888,32 @@ class AnimationRecoveryService(QtCore.QObject):
         removed_curves = []
         for cached_name in list(self._curve_cache):
             if cached_name not in current_names:
-                removed = self._curve_cache.pop(cached_name, None)
+                removed = self._forget_curve(cached_name)
                 if removed:
                     removed_curves.append(_curve_marker(removed, fallback_name=cached_name))
         for curve in changed_names:
             if curve not in current_names:
-                removed = self._curve_cache.pop(curve, None)
+                removed = self._forget_curve(curve)
                 if removed and not any(_curve_matches(removed, item) for item in removed_curves):
                     removed_curves.append(_curve_marker(removed, fallback_name=curve))
                 continue
             try:
-                curve_data = _capture_curve(curve, layer_info=curve_layer_map.get(curve))
+                curve_data = _capture_curve(
+                    curve,
+                    layer_info=curve_layer_map.get(curve),
+                    key_reader=self.curve_key_reader,
+                )
             except Exception:
                 continue
             if curve_data.get("positions"):
-                if self._curve_cache.get(curve) != curve_data:
+                cache_key = _curve_cache_key(curve_data)
+                content_hash = _curve_content_hash(curve_data)
+                if self._curve_hashes.get(cache_key) != content_hash:
                     changed_curves.append(curve_data)
-                self._curve_cache[curve] = curve_data
+                self._curve_hashes[cache_key] = content_hash
+                self._curve_cache[curve] = _curve_marker(curve_data)
             else:
-                removed = self._curve_cache.pop(curve, None)
+                removed = self._forget_curve(curve)
                 if removed:
                     removed_curves.append(_curve_marker(removed, fallback_name=curve))
 
@@ -2608,6 +2926,12 @@ class AnimationRecoveryService(QtCore.QObject):
         }
         return payload, created
 
+    def _forget_curve(self, name):
+        marker = self._curve_cache.pop(name, None)
+        if marker:
+            self._curve_hashes.pop(_curve_cache_key(marker), None)
+        return marker
+
     def _captured_objects(
         self,
         changed_names=None,
@@ -2711,10 +3035,10 @@ class AnimationRecoveryService(QtCore.QObject):
                 float(_safe_filename_timestamp(created)),
                 self._last_snapshot_timestamp + 0.000001,
             )
-            path = os.path.join(folder, "{:.8f}{}".format(timestamp, RECOVERY_EXTENSION))
+            path = os.path.join(folder, "{:.8f}{}".format(timestamp, storage.RECOVERY_EXTENSION))
             while os.path.exists(path):
                 timestamp += 0.000001
-                path = os.path.join(folder, "{:.8f}{}".format(timestamp, RECOVERY_EXTENSION))
+                path = os.path.join(folder, "{:.8f}{}".format(timestamp, storage.RECOVERY_EXTENSION))
             self._last_snapshot_timestamp = timestamp
             payload["meta"]["parent_checkpoint"] = self._last_checkpoint_name
             self._last_checkpoint_name = os.path.basename(path)
@@ -2722,9 +3046,13 @@ class AnimationRecoveryService(QtCore.QObject):
                 self._snapshots_since_baseline = 0
             else:
                 self._snapshots_since_baseline += 1
-        self._thread_pool.start(_SnapshotWriteTask(path, payload, self._writer_signals))
+        self._write_queue.submit(path, payload)
         return path
 
+    def write_stats(self):
+        """Writer counters: queued, coalesced, written, failed, bytes written."""
+        return self._write_queue.stats()
+
     def _on_snapshot_saved(self, path):
         # Keep the scene-node stamp current as of every checkpoint, not just
         # the explicit pre-save one -- so whenever Maya does write the file
@@ -2744,6 +3072,7 @@ class AnimationRecoveryService(QtCore.QObject):
         # Any queued delta may depend on the failed point. Rebuild both caches
         # so the next real checkpoint is a self-contained baseline.
         self._curve_cache = None
+        self._curve_hashes = {}
         self._layer_cache = None
         self._object_cache.clear()
         self._initialize_history_state()
@@ -0,0 +1,772 @@
+"""Pure encoding of Animation Recovery checkpoint files.
+
+Kept free of Maya imports so the file format can be exercised and
+benchmarked outside Maya (see ``scripts/benchmarks/recovery_format.py``).
+
+Every checkpoint starts with a one-byte schema version and a one-byte reason
+code (with ``FULL_SNAPSHOT_FLAG`` marking a baseline). Version 7 follows that
+with the zlib-compressed JSON of ``_pack_payload``. Version 8 adds a codec
+byte and stores the key data columnar: a small JSON skeleton that refers to a
+shared string table, followed by packed little-endian numeric columns. The
+``CODEC_PACKED`` body stores each column in its narrowest lossless form
+(integral columns as int32 deltas, float32 where every value survives it,
+string indices in the fewest bytes) with the bytes of each column split into
+planes, so zlib sees runs of alike exponent and high-order bytes.
+
+Each scene folder also keeps an append-only ``INDEX_FILENAME`` sidecar with
+one summary row per checkpoint, so browsing history never opens payloads.
+"""
+
+from array import array
+from itertools import accumulate, chain
+import io
+import json
+import operator
+import os
+import struct
+import sys
+import zlib
+
+
+LEGACY_SCHEMA_VERSION = 7
+SCHEMA_VERSION = 8
+SUPPORTED_VERSIONS = (LEGACY_SCHEMA_VERSION, SCHEMA_VERSION)
+RECOVERY_EXTENSION = ".tkmrec"
+# Per-scene sidecar summarizing every checkpoint, one JSON row per write.
+INDEX_FILENAME = "recovery_index.jsonl"
+FULL_SNAPSHOT_FLAG = 0x80
+REASON_CODES = {
+    "animation": 0,
+    "dag": 1,
+    "scene_save": 2,
+    "recovery": 3,
+    "transform": 4,
+    "layer": 5,
+}
+REASONS_BY_CODE = {code: reason for reason, code in REASON_CODES.items()}
+# Snapshots are written every few hundred milliseconds while animating, so
+# the cheapest zlib level wins: the columns are already compact and level 9
+# mostly buys CPU time. 0 stores the body uncompressed.
+COMPRESSION_LEVEL = 1
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_PACKED = 2
+TANGENT_KEYS = ("itt", "ott", "ia", "oa", "iw", "ow")
+# Column order of a v8 body: every curve's keys are concatenated per column.
+VALUE_COLUMNS = ("positions", "values", "ia", "oa", "iw", "ow")
+STRING_COLUMNS = ("itt", "ott")
+_INDEX_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+_INT32_TYPECODE = "i" if array("i").itemsize == 4 else "l"
+_NARROW_PROBE = 64
+_NEGATIVE_ZERO = array("d", [-0.0]).tobytes()
+# CODEC_PACKED column encodings, named in the skeleton: (typecode, delta).
+_PACKED_ENCODINGS = {
+    "f64": ("d", False),
+    "f32": ("f", False),
+    "i32d": (_INT32_TYPECODE, True),
+    "u8": ("B", False),
+    "u16": ("H", False),
+    "u32": (_INDEX_TYPECODE, False),
+}
+_BIG_ENDIAN = sys.byteorder == "big"
+_SKELETON_LENGTH = struct.Struct("<I")
+
+
+def split_plug(plug):
+    if not plug or "." not in plug:
+        return plug, ""
+    return plug.split(".", 1)
+
+
+def _pack_endpoint(endpoint):
+    return [endpoint.get("plug"), endpoint.get("node_uuid")]
+
+
+def _unpack_endpoint(endpoint):
+    plug = endpoint[0]
+    node, attribute = split_plug(plug)
+    return {
+        "plug": plug,
+        "node": node,
+        "node_uuid": endpoint[1],
+        "attribute": attribute,
+    }
+
+
+def _pack_layer_ref(layer_info):
+    if not layer_info:
+        return None
+    return [
+        layer_info.get("name"),
+        layer_info.get("uuid"),
+        layer_info.get("plug"),
+    ]
+
+
+def _unpack_layer_ref(layer_ref):
+    if not layer_ref:
+        return None
+    return {
+        "name": layer_ref[0],
+        "uuid": layer_ref[1],
+        "plug": layer_ref[2],
+    }
+
+
+def _pack_curve(curve):
+    tangents = curve.get("tangents") or {}
+    return [
+        curve.get("name"),
+        curve.get("uuid"),
+        curve.get("node_type"),
+        1 if curve.get("unitless_input") else 0,
+        curve.get("positions") or [],
+        curve.get("values") or [],
+        [tangents.get(key) or [] for key in ("itt", "ott", "ia", "oa", "iw", "ow")],
+        1 if curve.get("weighted_tangents") else 0,
+        curve.get("pre_infinity", 0),
+        curve.get("post_infinity", 0),
+        [_pack_endpoint(item) for item in curve.get("input_connections") or []],
+        [_pack_endpoint(item) for item in curve.get("output_connections") or []],
+        _pack_layer_ref(curve.get("layer")),
+    ]
+
+
+def _unpack_curve(curve):
+    tangent_values = curve[6]
+    tangent_keys = ("itt", "ott", "ia", "oa", "iw", "ow")
+    return {
+        "name": curve[0],
+        "uuid": curve[1],
+        "node_type": curve[2],
+        "unitless_input": bool(curve[3]),
+        "positions": curve[4],
+        "values": curve[5],
+        "tangents": {
+            key: tangent_values[index]
+            for index, key in enumerate(tangent_keys)
+        },
+        "weighted_tangents": bool(curve[7]),
+        "pre_infinity": curve[8],
+        "post_infinity": curve[9],
+        "input_connections": [_unpack_endpoint(item) for item in curve[10]],
+        "output_connections": [_unpack_endpoint(item) for item in curve[11]],
+        "layer": _unpack_layer_ref(curve[12]),
+    }
+
+
+def _pack_layer(layer):
+    return [
+        layer.get("name"),
+        layer.get("uuid"),
+        layer.get("parent"),
+        layer.get("weight", 1.0),
+        1 if layer.get("mute") else 0,
+        1 if layer.get("solo") else 0,
+        1 if layer.get("override") else 0,
+        1 if layer.get("passthrough") else 0,
+        1 if layer.get("lock") else 0,
+        layer.get("attributes") or [],
+        layer.get("rotation_accumulation_mode"),
+        layer.get("scale_accumulation_mode"),
+    ]
+
+
+def _unpack_layer(layer):
+    return {
+        "name": layer[0],
+        "uuid": layer[1],
+        "parent": layer[2],
+        "weight": layer[3],
+        "mute": bool(layer[4]),
+        "solo": bool(layer[5]),
+        "override": bool(layer[6]),
+        "passthrough": bool(layer[7]),
+        "lock": bool(layer[8]),
+        "attributes": list(layer[9] or []),
+        "rotation_accumulation_mode": layer[10],
+        "scale_accumulation_mode": layer[11],
+    }
+
+
+def _pack_details(payload):
+    details = payload.get("meta") or {}
+    return [
+        details.get("source_file"),
+        details.get("location"),
+        details.get("current_frame"),
+        details.get("playback_range"),
+        details.get("animation_range"),
+        details.get("selected_objects"),
+        details.get("source_mtime"),
+        details.get("parent_checkpoint"),
+    ]
+
+
+def _unpack_details(details, reason, full_snapshot, version):
+    return {
+        "version": version,
+        "reason": reason,
+        "full_snapshot": bool(full_snapshot),
+        "source_file": details[0],
+        "location": details[1],
+        "current_frame": details[2],
+        "playback_range": details[3],
+        "animation_range": details[4],
+        "selected_objects": details[5],
+        "source_mtime": details[6],
+        "parent_checkpoint": details[7],
+    }
+
+
+def _pack_object(item):
+    return [
+        item.get("name"),
+        item.get("uuid"),
+        [[name, value] for name, value in sorted((item.get("attributes") or {}).items())],
+    ]
+
+
+def _unpack_object(item):
+    return {
+        "name": item[0],
+        "uuid": item[1],
+        "attributes": dict(item[2]),
+    }
+
+
+def _pack_payload(payload):
+    return [
+        _pack_details(payload),
+        [_pack_curve(curve) for curve in payload.get("curves") or []],
+        [_pack_object(item) for item in payload.get("objects") or []],
+        [
+            [
+                item.get("name"),
+                item.get("uuid"),
+                [_pack_endpoint(endpoint) for endpoint in item.get("output_connections") or []],
+            ]
+            for item in payload.get("removed_curves") or []
+        ],
+        [_pack_layer(layer) for layer in payload.get("layers") or []],
+    ]
+
+
+def _unpack_payload(payload, reason="animation", full_snapshot=False, version=LEGACY_SCHEMA_VERSION):
+    details, curves, objects, removed_curves, layers = payload
+    return {
+        "meta": _unpack_details(details, reason, full_snapshot, version),
+        "curves": [_unpack_curve(curve) for curve in curves],
+        "objects": [_unpack_object(item) for item in objects],
+        "removed_curves": [
+            {
+                "name": item[0],
+                "uuid": item[1],
+                "output_connections": [
+                    _unpack_endpoint(endpoint)
+                    for endpoint in item[2]
+                ],
+            }
+            for item in removed_curves
+        ],
+        "layers": [_unpack_layer(layer) for layer in layers],
+    }
+
+
+class _StringTable:
+    """Interned strings of one v8 checkpoint; index 0 is always ``None``."""
+
+    def __init__(self):
+        self.strings = [None]
+        self._indices = {None: 0}
+
+    def index(self, value):
+        index = self._indices.get(value)
+        if index is None:
+            index = self._indices[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def _column_bytes(column):
+    if _BIG_ENDIAN:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _shuffle(data, itemsize):
+    """Split *data* into byte planes: every item's first byte, then second..."""
+    if itemsize == 1:
+        return data
+    return b"".join(data[plane::itemsize] for plane in range(itemsize))
+
+
+def _unshuffle(data, itemsize):
+    if itemsize == 1:
+        return data
+    count = len(data) // itemsize
+    interleaved = bytearray(len(data))
+    for plane in range(itemsize):
+        interleaved[plane::itemsize] = data[plane * count:(plane + 1) * count]
+    return interleaved
+
+
+def _narrow_value_column(column):
+    """``(encoding, array)`` storing the float64 *column* in the fewest lossless bytes.
+
+    A leading probe keeps the full checks off columns that clearly won't
+    narrow, and constant columns (unit weights) are left alone: zlib
+    already reduces those to almost nothing.
+    """
+    if not column or column.count(column[0]) == len(column):
+        return "f64", column
+    probe = column[:_NARROW_PROBE]
+    # int() would turn -0.0 into 0.0; a byte match off the item boundary only
+    # costs the integer form, never correctness.
+    if (
+        all(map(float.is_integer, probe))
+        and all(map(float.is_integer, column))
+        and _NEGATIVE_ZERO not in column.tobytes()
+    ):
+        integers = list(map(int, column))
+        try:
+            return "i32d", array(_INT32_TYPECODE, map(operator.sub, integers, chain((0,), integers)))
+        except OverflowError:
+            pass
+    if array("d", array("f", probe)) == probe:
+        narrow = array("f", column)
+        if array("d", narrow) == column:
+            return "f32", narrow
+    return "f64", column
+
+
+def _narrow_index_column(column, string_count):
+    if string_count <= 0x100:
+        return "u8", array("B", column)
+    if string_count <= 0x10000:
+        return "u16", array("H", column)
+    return "u32", column
+
+
+def _unpack_packed_column(encoding, data):
+    typecode, delta = _PACKED_ENCODINGS[encoding]
+    column = array(typecode)
+    column.frombytes(bytes(_unshuffle(data, column.itemsize)))
+    if _BIG_ENDIAN:
+        column.byteswap()
+    if delta:
+        return [float(value) for value in accumulate(column)]
+    if typecode == "f":
+        return array("d", column).tolist()
+    return column.tolist()
+
+
+def _encode_columnar(payload, packed=False):
+    """Return the uncompressed v8 body: skeleton length, skeleton, columns.
+
+    With *packed*, columns are narrowed and split into byte planes for
+    ``CODEC_PACKED`` and their encodings are appended to the skeleton.
+    """
+    strings = _StringTable()
+    columns = [array("d") for _name in VALUE_COLUMNS]
+    columns += [array(_INDEX_TYPECODE) for _name in STRING_COLUMNS]
+
+    def _endpoints(endpoints):
+        return [
+            [strings.index(endpoint.get("plug")), strings.index(endpoint.get("node_uuid"))]
+            for endpoint in endpoints or []
+        ]
+
+    curves = []
+    for curve in payload.get("curves") or []:
+        tangents = curve.get("tangents") or {}
+        sources = {
+            "positions": curve.get("positions") or [],
+            "values": curve.get("values") or [],
+        }
+        sources.update((key, tangents.get(key) or []) for key in TANGENT_KEYS)
+        counts = []
+        for position, name in enumerate(VALUE_COLUMNS):
+            columns[position].extend(sources[name])
+            counts.append(len(sources[name]))
+        for position, name in enumerate(STRING_COLUMNS, len(VALUE_COLUMNS)):
+            columns[position].extend(strings.index(value) for value in sources[name])
+            counts.append(len(sources[name]))
+        layer = curve.get("layer")
+        curves.append([
+            strings.index(curve.get("name")),
+            strings.index(curve.get("uuid")),
+            strings.index(curve.get("node_type")),
+            1 if curve.get("unitless_input") else 0,
+            1 if curve.get("weighted_tangents") else 0,
+            curve.get("pre_infinity", 0),
+            curve.get("post_infinity", 0),
+            counts,
+            _endpoints(curve.get("input_connections")),
+            _endpoints(curve.get("output_connections")),
+            [
+                strings.index(layer.get("name")),
+                strings.index(layer.get("uuid")),
+                strings.index(layer.get("plug")),
+            ] if layer else None,
+        ])
+    removed_curves = [
+        [
+            strings.index(item.get("name")),
+            strings.index(item.get("uuid")),
+            _endpoints(item.get("output_connections")),
+        ]
+        for item in payload.get("removed_curves") or []
+    ]
+    skeleton = [
+        _pack_details(payload),
+        strings.strings,
+        curves,
+        [_pack_object(item) for item in payload.get("objects") or []],
+        removed_curves,
+        [_pack_layer(layer) for layer in payload.get("layers") or []],
+    ]
+    if packed:
+        narrowed = [_narrow_value_column(column) for column in columns[:len(VALUE_COLUMNS)]]
+        narrowed += [
+            _narrow_index_column(column, len(strings.strings))
+            for column in columns[len(VALUE_COLUMNS):]
+        ]
+        skeleton.append([encoding for encoding, _column in narrowed])
+        column_chunks = [_shuffle(_column_bytes(column), column.itemsize) for _encoding, column in narrowed]
+    else:
+        column_chunks = [_column_bytes(column) for column in columns]
+    skeleton = json.dumps(skeleton, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    chunks = [_SKELETON_LENGTH.pack(len(skeleton)), skeleton]
+    chunks.extend(column_chunks)
+    return b"".join(chunks)
+
+
+def _read_skeleton(body):
+    (length,) = _SKELETON_LENGTH.unpack_from(body, 0)
+    end = _SKELETON_LENGTH.size + length
+    if end > len(body):
+        raise ValueError("Truncated Animation Recovery file")
+    return json.loads(bytes(body[_SKELETON_LENGTH.size:end]).decode("utf-8")), end
+
+
+def _decode_columnar(body, reason, full_snapshot, version, packed=False):
+    body = memoryview(body)
+    skeleton, offset = _read_skeleton(body)
+    if packed:
+        details, strings, curves, objects, removed_curves, layers, encodings = skeleton
+    else:
+        details, strings, curves, objects, removed_curves, layers = skeleton
+        encodings = None
+
+    column_names = VALUE_COLUMNS + STRING_COLUMNS
+    columns = []
+    for position, name in enumerate(column_names):
+        if encodings is not None:
+            encoding = encodings[position]
+            if encoding not in _PACKED_ENCODINGS:
+                raise ValueError("Invalid Animation Recovery file")
+            column = array(_PACKED_ENCODINGS[encoding][0])
+        else:
+            column = array("d" if name in VALUE_COLUMNS else _INDEX_TYPECODE)
+        size = sum(curve[7][position] for curve in curves) * column.itemsize
+        if offset + size > len(body):
+            raise ValueError("Truncated Animation Recovery file")
+        if encodings is not None:
+            values = _unpack_packed_column(encoding, body[offset:offset + size])
+        else:
+            column.frombytes(body[offset:offset + size])
+            if _BIG_ENDIAN:
+                column.byteswap()
+            values = column.tolist()
+        offset += size
+        if name in STRING_COLUMNS:
+            values = [strings[index] for index in values]
+        columns.append(values)
+    if offset != len(body):
+        raise ValueError("Invalid Animation Recovery file")
+
+    def _endpoints(endpoints):
+        return [_unpack_endpoint([strings[plug], strings[node_uuid]]) for plug, node_uuid in endpoints]
+
+    unpacked_curves = []
+    cursors = [0] * len(column_names)
+    for curve in curves:
+        sliced = {}
+        for position, name in enumerate(column_names):
+            start = cursors[position]
+            cursors[position] = start + curve[7][position]
+            sliced[name] = columns[position][start:cursors[position]]
+        layer = curve[10]
+        unpacked_curves.append({
+            "name": strings[curve[0]],
+            "uuid": strings[curve[1]],
+            "node_type": strings[curve[2]],
+            "unitless_input": bool(curve[3]),
+            "positions": sliced["positions"],
+            "values": sliced["values"],
+            "tangents": {key: sliced[key] for key in TANGENT_KEYS},
+            "weighted_tangents": bool(curve[4]),
+            "pre_infinity": curve[5],
+            "post_infinity": curve[6],
+            "input_connections": _endpoints(curve[8]),
+            "output_connections": _endpoints(curve[9]),
+            "layer": _unpack_layer_ref([strings[index] for index in layer]) if layer else None,
+        })
+    return {
+        "meta": _unpack_details(details, reason, full_snapshot, version),
+        "curves": unpacked_curves,
+        "objects": [_unpack_object(item) for item in objects],
+        "removed_curves": [
+            {
+                "name": strings[item[0]],
+                "uuid": strings[item[1]],
+                "output_connections": _endpoints(item[2]),
+            }
+            for item in removed_curves
+        ],
+        "layers": [_unpack_layer(layer) for layer in layers],
+    }
+
+
+def _reason_byte(payload):
+    meta = payload.get("meta") or {}
+    reason_byte = REASON_CODES.get(meta.get("reason") or "animation", 0)
+    if meta.get("full_snapshot"):
+        reason_byte |= FULL_SNAPSHOT_FLAG
+    return reason_byte
+
+
+def encode_recovery(payload, version=SCHEMA_VERSION, compression_level=COMPRESSION_LEVEL, packed=True):
+    """Return the complete file contents for *payload*.
+
+    Only ``SCHEMA_VERSION`` is ever written by the service, compressed with
+    ``CODEC_PACKED``; the legacy version and the plain codecs stay encodable
+    so the formats can be compared directly.
+    """
+    if version == LEGACY_SCHEMA_VERSION:
+        serialized = json.dumps(
+            _pack_payload(payload), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        return struct.pack("BB", version, _reason_byte(payload)) + zlib.compress(serialized, 9)
+    if version != SCHEMA_VERSION:
+        raise ValueError("Unsupported Animation Recovery version: {}".format(version))
+    codec = CODEC_RAW
+    if compression_level:
+        codec = CODEC_PACKED if packed else CODEC_ZLIB
+    body = _encode_columnar(payload, packed=codec == CODEC_PACKED)
+    if compression_level:
+        body = zlib.compress(body, compression_level)
+    return struct.pack("BBB", version, _reason_byte(payload), codec) + body
+
+
+def _split_recovery(compiled):
+    """Return ``(version, reason_code, body, codec)`` with the body decompressed."""
+    if len(compiled) < 3:
+        raise ValueError("Invalid Animation Recovery file")
+    version, reason_code = struct.unpack("BB", compiled[:2])
+    if version == LEGACY_SCHEMA_VERSION:
+        return version, reason_code, zlib.decompress(compiled[2:]), None
+    if version != SCHEMA_VERSION:
+        raise ValueError("Unsupported Animation Recovery version: {}".format(version))
+    codec = compiled[2]
+    if codec in (CODEC_ZLIB, CODEC_PACKED):
+        return version, reason_code, zlib.decompress(compiled[3:]), codec
+    if codec == CODEC_RAW:
+        return version, reason_code, compiled[3:], codec
+    raise ValueError("Unsupported Animation Recovery codec: {}".format(codec))
+
+
+def decode_recovery(compiled):
+    version, reason_code, body, codec = _split_recovery(compiled)
+    reason = REASONS_BY_CODE.get(reason_code & ~FULL_SNAPSHOT_FLAG, "animation")
+    full_snapshot = bool(reason_code & FULL_SNAPSHOT_FLAG)
+    if version == LEGACY_SCHEMA_VERSION:
+        return _unpack_payload(
+            json.loads(body.decode("utf-8")),
+            reason=reason,
+            full_snapshot=full_snapshot,
+            version=version,
+        )
+    return _decode_columnar(body, reason, full_snapshot, version, packed=codec == CODEC_PACKED)
+
+
+def write_recovery_atomic(path, payload):
+    folder = os.path.dirname(path)
+    if not os.path.isdir(folder):
+        try:
+            os.makedirs(folder)
+        except OSError:
+            if not os.path.isdir(folder):
+                raise
+    temporary = path + ".tmp"
+    compiled = encode_recovery(payload)
+    try:
+        with io.open(temporary, "wb") as stream:
+            stream.write(compiled)
+            stream.flush()
+            os.fsync(stream.fileno())
+        replace = getattr(os, "replace", os.rename)
+        replace(temporary, path)
+    except Exception:
+        try:
+            if os.path.isfile(temporary):
+                os.remove(temporary)
+        except OSError:
+            pass
+        raise
+    return len(compiled)
+
+
+def load_recovery(path):
+    with io.open(path, "rb") as stream:
+        compiled = stream.read()
+    return decode_recovery(compiled)
+
+
+def recovery_header(path):
+    """Return the lightweight format metadata needed to build a replay chain."""
+    with io.open(path, "rb") as stream:
+        header = stream.read(2)
+    if len(header) < 2:
+        raise ValueError("Invalid Animation Recovery file")
+    version, reason_code = struct.unpack("BB", header)
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError("Unsupported Animation Recovery version: {}".format(version))
+    return version, bool(reason_code & FULL_SNAPSHOT_FLAG)
+
+
+def _summary_entry(name, version, reason_code, details, curve_count, byte_size):
+    meta = _unpack_details(
+        details,
+        REASONS_BY_CODE.get(reason_code & ~FULL_SNAPSHOT_FLAG, "animation"),
+        reason_code & FULL_SNAPSHOT_FLAG,
+        version,
+    )
+    entry = {
+        "name": name,
+        "version": version,
+        "reason": meta.pop("reason"),
+        "full": meta.pop("full_snapshot"),
+        "parent": meta.pop("parent_checkpoint"),
+        "curves": curve_count,
+        "bytes": byte_size,
+    }
+    meta.pop("version")
+    entry.update(meta)
+    return entry
+
+
+def index_entry(path, payload, byte_size):
+    """Build the sidecar index row for a checkpoint that was just written."""
+    return _summary_entry(
+        os.path.basename(path),
+        SCHEMA_VERSION,
+        _reason_byte(payload),
+        _pack_details(payload),
+        len(payload.get("curves") or []),
+        byte_size,
+    )
+
+
+def index_entry_from_file(path):
+    """Rebuild one index row by reading the checkpoint itself."""
+    with io.open(path, "rb") as stream:
+        compiled = stream.read()
+    version, reason_code, body, _codec = _split_recovery(compiled)
+    if version == LEGACY_SCHEMA_VERSION:
+        packed = json.loads(body.decode("utf-8"))
+        details, curves = packed[0], packed[1]
+    else:
+        skeleton, _offset = _read_skeleton(memoryview(body))
+        details, curves = skeleton[0], skeleton[2]
+    return _summary_entry(
+        os.path.basename(path), version, reason_code, details, len(curves), len(compiled)
+    )
+
+
+def _index_path(folder):
+    return os.path.join(folder, INDEX_FILENAME)
+
+
+def _read_index_file(folder):
+    entries = {}
+    try:
+        with io.open(_index_path(folder), "r", encoding="utf-8") as stream:
+            for line in stream:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn trailing line from an interrupted append; the
+                    # checkpoint it described is simply re-read below.
+                    continue
+                if isinstance(entry, dict) and entry.get("name"):
+                    entries[entry["name"]] = entry
+    except (IOError, OSError):
+        pass
+    return entries
+
+
+def _index_lines(entries):
+    return "".join(
+        json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for entry in entries
+    )
+
+
+def append_index_entries(folder, entries):
+    if not entries:
+        return
+    with io.open(_index_path(folder), "a", encoding="utf-8") as stream:
+        stream.write(_index_lines(entries))
+        stream.flush()
+
+
+def _rewrite_index(folder, entries):
+    path = _index_path(folder)
+    temporary = path + ".tmp"
+    with io.open(temporary, "w", encoding="utf-8") as stream:
+        stream.write(_index_lines(entries))
+    replace = getattr(os, "replace", os.rename)
+    replace(temporary, path)
+
+
+def read_recovery_index(folder):
+    """Return ``{filename: entry}`` for every readable checkpoint in *folder*.
+
+    The index is append-only: each write adds one row, and rows whose file has
+    since been pruned or deleted are simply ignored. Checkpoints missing from
+    the index (written by an older build, or lost to a torn append) are read
+    once and appended, so a scene folder is never opened file by file twice.
+    Once stale rows outnumber live ones the file is compacted.
+    """
+    try:
+        names = [
+            filename
+            for filename in os.listdir(folder)
+            if filename.lower().endswith(RECOVERY_EXTENSION)
+        ]
+    except OSError:
+        return {}
+    indexed = _read_index_file(folder)
+    entries = {}
+    rebuilt = []
+    for name in names:
+        entry = indexed.get(name)
+        if entry is None:
+            try:
+                entry = index_entry_from_file(os.path.join(folder, name))
+            except (IOError, OSError, ValueError, IndexError, struct.error, zlib.error):
+                continue
+            rebuilt.append(entry)
+        entries[name] = entry
+    try:
+        if len(indexed) - (len(entries) - len(rebuilt)) > len(entries):
+            _rewrite_index(folder, list(entries.values()))
+        else:
+            append_index_entries(folder, rebuilt)
+    except (IOError, OSError):
+        # The index is a cache; a read-only folder still lists correctly.
+        pass
+    return entries
@@ -881,7 +881,7 @@ def _paste_entry_to_curve(
     )
 
     changed = False
-    weighted_applied = False
+    pasted_tangents = []
     for key in keys:
         destination_time = anchor + (float(key["time"]) - source_start)
         if (
@@ -897,15 +897,11 @@ def _paste_entry_to_curve(
             continue
         value = float(key["value"]) + value_offset
         cmds.setKeyframe(curve, time=(destination_time,), value=value)
-        tangent = key.get("tangent") or {}
-        animation.apply_key_tangent_snapshot(
-            curve,
-            destination_time,
-            tangent,
-            apply_weighted=not weighted_applied,
-        )
-        weighted_applied = weighted_applied or "weightedTangents" in tangent
+        pasted_tangents.append((destination_time, key.get("tangent") or {}))
         changed = True
+    # Every key is in place before any tangent is restored, so the whole
+    # paste restores in one curve pass.
+    animation.apply_key_tangent_snapshots(curve, pasted_tangents)
 
     if relative and anchor_exists:
         cmds.keyframe(
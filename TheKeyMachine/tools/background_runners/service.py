@@ -9,7 +9,7 @@ from __future__ import annotations
 import math
 from typing import Dict, Optional
 
-from maya import cmds
+from maya import cmds, mel
 
 try:
     from maya.api import OpenMaya as om  # type: ignore
@@ -536,6 +536,8 @@ class HideStaticAnimationCurvesRunner(QtCore.QObject):
         super().__init__(parent or manager)
         self._manager = manager
         self._running = False
+        # Curve MObjectHandle hash -> (handle, is_flat).
+        self._flat_curves = {}
         self._sync_timer = QtCore.QTimer(self)
         self._sync_timer.setSingleShot(True)
         self._sync_timer.setInterval(self.SYNC_DELAY_MS)
@@ -551,6 +553,7 @@ class HideStaticAnimationCurvesRunner(QtCore.QObject):
             self._manager.graph_editor_opened,
         ):
             self._manager.connect_signal(signal, self._schedule_sync, key=self.RUNTIME_KEY, unique=False)
+        self._manager.add_anim_curve_edited_callback(self._on_curve_edited, key=self.RUNTIME_KEY)
         # An already-open Graph Editor is ready to update immediately. Deferred
         # syncing remains useful only for subsequent Maya UI/selection events.
         self.sync()
@@ -562,6 +565,7 @@ class HideStaticAnimationCurvesRunner(QtCore.QObject):
         self._manager.disconnect_callbacks(self.RUNTIME_KEY)
         self._sync_timer.stop()
         self.sync(include_flat=True)
+        self._flat_curves.clear()
 
     def _schedule_sync(self, *_args):
         if not self._running:
@@ -594,52 +598,136 @@ class HideStaticAnimationCurvesRunner(QtCore.QObject):
         except Exception:
             return []
 
-    @staticmethod
-    def _is_flat_curve(curve):
+    def _on_curve_edited(self, *args):
+        """Drop the cached flatness of every edited curve."""
+        try:
+            curves = args[0]
+            for index in range(len(curves)):
+                self._flat_curves.pop(int(om.MObjectHandle(curves[index]).hashCode()), None)
+        except Exception:
+            self._flat_curves.clear()
+
+    def _is_flat_curve(self, curve):
+        """Whether every key of *curve* (an MObject) holds the same value.
+
+        Cached per curve ``MObjectHandle`` and invalidated by the anim-curve
+        edited callback, so a selection change only reads curves it has not
+        seen since they were last edited.
+        """
+        handle = om.MObjectHandle(curve)
+        hash_code = int(handle.hashCode())
+        cached = self._flat_curves.get(hash_code)
+        if cached is not None and cached[0].isValid() and cached[0] == handle:
+            return cached[1]
         try:
-            values = cmds.keyframe(curve, query=True, valueChange=True) or []
+            curve_fn = oma.MFnAnimCurve(curve)
+            count = curve_fn.numKeys
+            first = curve_fn.value(0) if count else None
+            flat = bool(count) and all(
+                abs(curve_fn.value(index) - first) <= 1e-10 for index in range(1, count)
+            )
         except Exception:
-            values = []
-        if len(values) < 2:
-            return bool(values)
-        first = values[0]
-        return all(abs(value - first) <= 1e-10 for value in values[1:])
+            flat = False
+        self._flat_curves[hash_code] = (handle, flat)
+        return flat
 
     @staticmethod
     def _selected_curve_attributes():
+        """``(curve MObject, plug name)`` for every keyable/channel-box plug animated on the selection.
+
+        One API pass: the active selection and its shapes are walked once
+        and ``MAnimUtil`` reports the animated plugs and their curves,
+        instead of a ``listAttr`` and a ``keyframe`` query per attribute.
+        """
+        if om is None or oma is None:
+            return []
         try:
-            nodes = cmds.ls(selection=True, long=True) or []
+            selection = om.MGlobal.getActiveSelectionList()
         except Exception:
-            nodes = []
+            return []
 
-        lookup_nodes = list(nodes)
-        for node in nodes:
+        lookup = []
+        for index in range(selection.length()):
             try:
-                lookup_nodes.extend(cmds.listRelatives(node, shapes=True, fullPath=True) or [])
+                path = selection.getDagPath(index)
             except Exception:
-                pass
+                path = None
+            if path is None:
+                try:
+                    node = selection.getDependNode(index)
+                    lookup.append((node, om.MFnDependencyNode(node).name()))
+                except Exception:
+                    pass
+                continue
+            lookup.append((path, path.fullPathName()))
+            try:
+                shape_count = path.numberOfShapesDirectlyBelow()
+            except Exception:
+                shape_count = 0
+            for shape_index in range(shape_count):
+                shape_path = om.MDagPath(path)
+                try:
+                    shape_path.extendToShape(shape_index)
+                except Exception:
+                    continue
+                lookup.append((shape_path, shape_path.fullPathName()))
 
         curve_attributes = []
         seen = set()
-        for node in lookup_nodes:
+        for node, node_name in lookup:
             try:
-                attributes = cmds.listAttr(node, keyable=True, scalar=True) or []
-                attributes.extend(cmds.listAttr(node, channelBox=True, scalar=True) or [])
+                plugs = oma.MAnimUtil.findAnimatedPlugs(node)
             except Exception:
-                attributes = []
-            for attribute in attributes:
-                plug = "{}.{}".format(node, attribute)
+                continue
+            for plug_index in range(len(plugs)):
+                plug = plugs[plug_index]
                 try:
-                    curves = cmds.keyframe(plug, query=True, name=True) or []
+                    if not (plug.isKeyable or plug.isChannelBox):
+                        continue
+                    attribute = "{}.{}".format(
+                        node_name, plug.partialName(useLongNames=True)
+                    )
+                    curves = oma.MAnimUtil.findAnimation(plug)
                 except Exception:
-                    curves = []
-                for curve in curves:
-                    pair = (curve, plug)
+                    continue
+                for curve_index in range(len(curves)):
+                    curve = curves[curve_index]
+                    pair = (int(om.MObjectHandle(curve).hashCode()), attribute)
                     if pair not in seen:
-                        curve_attributes.append(pair)
+                        curve_attributes.append((curve, attribute))
                         seen.add(pair)
         return curve_attributes
 
+    def _apply_selection_connection(self, attributes):
+        """Make the outliner selection connection hold exactly *attributes*.
+
+        The current members are queried once and only the difference is
+        edited, in a single MEL batch instead of one command per plug.
+        """
+        try:
+            current = cmds.selectionConnection(
+                self.OUTLINER_SELECTION, query=True, object=True
+            ) or []
+        except Exception:
+            current = None
+        wanted = set(attributes)
+        commands = []
+        if current is None or not wanted.issuperset(current):
+            commands.append(
+                "selectionConnection -edit -clear {};".format(self.OUTLINER_SELECTION)
+            )
+            current = ()
+        present = set(current)
+        for attribute in attributes:
+            if attribute not in present:
+                commands.append(
+                    'selectionConnection -edit -select "{}" {};'.format(
+                        attribute, self.OUTLINER_SELECTION
+                    )
+                )
+        if commands:
+            mel.eval("\n".join(commands))
+
     def sync(self, include_flat=False):
         editors = self._visible_graph_editors()
         if not editors:
@@ -659,13 +747,7 @@ class HideStaticAnimationCurvesRunner(QtCore.QObject):
                 self.OUTLINER_SELECTION, exists=True
             ):
                 return
-            cmds.selectionConnection(
-                self.OUTLINER_SELECTION, edit=True, clear=True
-            )
-            for attribute in attributes:
-                cmds.selectionConnection(
-                    self.OUTLINER_SELECTION, edit=True, select=attribute
-                )
+            self._apply_selection_connection(attributes)
         except Exception:
             return
 
@@ -822,31 +904,59 @@ def _layer_weight_points(layer_name, start_frame, end_frame):
     return tuple((time, max(0.0, min(1.0, value))) for time, value in samples)
 
 
-def _value_at_frame(points, frame):
-    """Linearly interpolate a resolved weight curve's value at ``frame``.
+def _weight_curve_signature(curve_name):
+    """Cheap content identity of a weight curve: its keys, tangents, infinity.
 
-    ``points`` is the same dense ``(frame, value)`` sequence used to paint
-    the curve, sorted by frame and pre-sampled across a domain wider than
-    any one visible range (see ``_weight_curve_domain``), so this holds up
-    across a reframe without needing new data -- clamping to the nearest
-    end for a frame that still falls outside it.
+    A handful of function-set reads per key -- far less than the hundreds of
+    ``evaluate()`` calls one resample costs -- so a layer whose curve didn't
+    actually change can keep its cached samples.
     """
-    if not points:
-        return 0.0
-    if frame <= points[0][0]:
-        return points[0][1]
-    if frame >= points[-1][0]:
-        return points[-1][1]
-
-    previous_frame, previous_value = points[0]
-    for next_frame, next_value in points[1:]:
-        if next_frame >= frame:
-            if next_frame == previous_frame:
-                return next_value
-            t = (frame - previous_frame) / (next_frame - previous_frame)
-            return previous_value + (next_value - previous_value) * t
-        previous_frame, previous_value = next_frame, next_value
-    return points[-1][1]
+    if oma is None:
+        return None
+    curve_mobject = maya_api.mobject_from_node(curve_name)
+    if curve_mobject is None:
+        return None
+    try:
+        curve_fn = oma.MFnAnimCurve(curve_mobject)
+        parts = [
+            curve_name,
+            curve_fn.numKeys,
+            curve_fn.preInfinityType,
+            curve_fn.postInfinityType,
+            curve_fn.isWeighted,
+        ]
+        for index in range(curve_fn.numKeys):
+            parts.extend(
+                (
+                    curve_fn.input(index).value,
+                    curve_fn.value(index),
+                    curve_fn.inTangentType(index),
+                    curve_fn.outTangentType(index),
+                )
+            )
+            for is_in_tangent in (True, False):
+                angle, weight = curve_fn.getTangentAngleWeight(index, is_in_tangent)
+                parts.extend((angle.value, weight))
+    except Exception:
+        return None
+    return tuple(parts)
+
+
+def _layer_weight_signature(layer_name):
+    """Signature of whatever drives ``layer.weight``: a curve, or a static value."""
+    weight_plug = "{}.weight".format(layer_name)
+    try:
+        curves = cmds.listConnections(
+            weight_plug, source=True, destination=False, type="animCurve"
+        ) or []
+    except Exception:
+        curves = []
+    if curves:
+        return _weight_curve_signature(curves[0])
+    try:
+        return ("static", float(cmds.getAttr(weight_plug)))
+    except Exception:
+        return None
 
 
 class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
@@ -882,6 +992,8 @@ class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
 
     def __init__(self, parent=None, z_index=-2):
         self._layer_curves = ()
+        # Layer name -> (plot key, QPainterPath) of its last mapped polyline.
+        self._paths = {}
         super().__init__(
             timerange=timelineWidgets.get_playback_range(),
             color=(0, 0, 0, 0),
@@ -896,6 +1008,7 @@ class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
 
     def set_layer_curves(self, layer_curves):
         self._layer_curves = tuple(layer_curves or ())
+        self._paths.clear()
         self.update()
 
     def paintEvent(self, event):
@@ -926,6 +1039,14 @@ class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
         span = float(end_frame - start_frame) or 1.0
         margin = min(rect.height() * 0.5, wutil.DPI(3))
         usable_height = max(1.0, rect.height() - margin * 2.0)
+        plot_key = (
+            start_frame,
+            end_frame,
+            rect.left(),
+            rect.bottom() - margin,
+            rect.width(),
+            usable_height,
+        )
 
         def map_point(frame, value):
             return QtCore.QPointF(
@@ -936,7 +1057,7 @@ class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
         for layer_curve in self._layer_curves:
-            self._paint_layer_curve(painter, layer_curve, map_point)
+            self._paint_layer_curve(painter, layer_curve, plot_key)
         # Drawn in its own pass, after every curve, so a label never ends up
         # underneath another layer's line.
         for layer_curve in self._layer_curves:
@@ -966,20 +1087,35 @@ class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
             return rect
         return rect.adjusted(0, inset, 0, -inset)
 
-    def _paint_layer_curve(self, painter, layer_curve, map_point):
-        points = layer_curve.get("points") or ()
-        if len(points) < 2:
+    def _layer_path(self, layer_curve, plot_key):
+        """The layer's visible polyline as a path, rebuilt only on a reframe or resize."""
+        name = layer_curve.get("name")
+        cached = self._paths.get(name)
+        if cached is not None and cached[0] == plot_key:
+            return cached[1]
+        polyline = layer_curve["points"].polyline(*plot_key)
+        path = QtGui.QPainterPath()
+        if len(polyline) >= 2:
+            path.moveTo(*polyline[0])
+            for x, y in polyline[1:]:
+                path.lineTo(x, y)
+        self._paths[name] = (plot_key, path)
+        return path
+
+    def _paint_layer_curve(self, painter, layer_curve, plot_key):
+        points = layer_curve.get("points")
+        if not points or len(points) < 2:
             return
 
         # Points are already densely sampled from the real curve evaluation
         # (see _evaluate_weight_curve), so connecting them with straight
         # segments reproduces the actual curve -- sharp corners (stepped
         # tangents) included -- instead of a further curve-fit smoothing
-        # them into a shape that no longer matches the real animCurve.
-        path = QtGui.QPainterPath()
-        path.moveTo(map_point(*points[0]))
-        for frame, value in points[1:]:
-            path.lineTo(map_point(frame, value))
+        # them into a shape that no longer matches the real animCurve. Only
+        # the samples inside the visible range are mapped.
+        path = self._layer_path(layer_curve, plot_key)
+        if path.isEmpty():
+            return
 
         pen = QtGui.QPen()
         if layer_curve.get("muted"):
@@ -1011,7 +1147,7 @@ class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
 
     def _paint_layer_label(self, painter, rect, layer_curve, start_frame, map_point):
         name = layer_curve.get("name")
-        points = layer_curve.get("points") or ()
+        points = layer_curve.get("points")
         # A single resolved point is enough to anchor the label. Curve drawing
         # itself still requires two points, but selected unmuted layers should
         # never lose their name merely because their weight is flat.
@@ -1022,7 +1158,7 @@ class AnimLayerWeightsTint(timelineWidgets.TimelineTint):
         # height of the curve's own value there -- both re-derived from the
         # live rect/range every paint, so the tag tracks a reframe on its
         # own instead of needing a fresh recompute to catch up.
-        anchor = map_point(start_frame, _value_at_frame(points, start_frame))
+        anchor = map_point(start_frame, points.value_at(start_frame))
 
         font = QtGui.QFont(painter.font())
         font.setPixelSize(int(round(wutil.DPI(self.LABEL_FONT_SIZE))))
@@ -1103,6 +1239,13 @@ class AnimLayerWeightsRunner(QtCore.QObject):
         self._manager = manager
         self._last_curves_key = None
         self._weight_curve_names = set()
+        # Weight curve name -> owning layer, so a curve edit resamples only
+        # the layers it names.
+        self._curve_layers = {}
+        # Layer name -> (domain, signature, points) of its last resample.
+        self._layer_samples = {}
+        self._dirty_layers = set()
+        self._tint_widget = None
         self._structure_refresh_timer = QtCore.QTimer(self)
         self._structure_refresh_timer.setSingleShot(True)
         self._structure_refresh_timer.setInterval(0)
@@ -1132,8 +1275,12 @@ class AnimLayerWeightsRunner(QtCore.QObject):
         self._manager.disconnect_callbacks(self.CURVE_EDIT_KEY)
         self._manager.disconnect_callbacks(self.NODE_WATCH_KEY)
         self._manager.clear_managed_widget(ANIM_LAYER_WEIGHTS_TINT_KEY)
+        self._tint_widget = None
         self._last_curves_key = None
         self._weight_curve_names.clear()
+        self._curve_layers.clear()
+        self._layer_samples.clear()
+        self._dirty_layers.clear()
 
     def _schedule_layer_structure_change(self, *_args):
         # Maya can emit both refresh and rebuild for one layer edit. Coalesce
@@ -1144,7 +1291,11 @@ class AnimLayerWeightsRunner(QtCore.QObject):
     def _apply_layer_structure_change(self):
         # The layer set itself changed shape -- rebuild the node watch list
         # from scratch rather than trying to diff it against the old one.
+        # Cached samples go too: a weight keyed for the first time, a weight
+        # curve disconnected or deleted, or a layer recreated under the same
+        # name changes samples without any watched curve being edited.
         self._watch_layer_nodes()
+        self._layer_samples.clear()
         self._recompute()
 
     def _on_curve_edited(self, *args):
@@ -1158,28 +1309,38 @@ class AnimLayerWeightsRunner(QtCore.QObject):
             pass
         if edited and not edited.intersection(self._weight_curve_names):
             return
+        if edited:
+            self._dirty_layers.update(
+                self._curve_layers[name] for name in edited if name in self._curve_layers
+            )
+        else:
+            # Unknown edit set: let every layer re-check its signature.
+            self._layer_samples.clear()
         if not self._curve_refresh_timer.isActive():
             self._curve_refresh_timer.start()
 
     def _watch_layer_nodes(self):
         self._manager.disconnect_callbacks(self.NODE_WATCH_KEY)
         self._weight_curve_names.clear()
+        self._curve_layers.clear()
         for layer_name in animation.scene_layer_names(include_root=False):
             self._manager.add_node_attribute_changed_callback(
                 layer_name,
                 self._on_layer_attribute_changed,
                 key=self.NODE_WATCH_KEY,
+                client_data=layer_name,
             )
             try:
-                self._weight_curve_names.update(
-                    cmds.keyframe(
-                        "{}.weight".format(layer_name), query=True, name=True
-                    ) or []
-                )
+                curve_names = cmds.keyframe(
+                    "{}.weight".format(layer_name), query=True, name=True
+                ) or []
             except Exception:
-                pass
+                curve_names = []
+            self._weight_curve_names.update(curve_names)
+            for curve_name in curve_names:
+                self._curve_layers[curve_name] = layer_name
 
-    def _on_layer_attribute_changed(self, msg, plug, *_args):
+    def _on_layer_attribute_changed(self, msg, plug, *args):
         if not _is_authored_attribute_change(msg):
             return
         try:
@@ -1191,15 +1352,45 @@ class AnimLayerWeightsRunner(QtCore.QObject):
         if msg & (om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken):
             self._schedule_layer_structure_change()
             return
+        if attribute_name == "weight" and args and args[-1]:
+            # A static weight edit (client data is the layer name); select
+            # and mute only change how the cached samples are drawn.
+            self._dirty_layers.add(args[-1])
         self._recompute()
 
+    def _layer_points(self, layer_name, domain):
+        """Cached samples for one layer, resampled only when they are stale.
+
+        A layer named by a curve edit is always re-checked; any other layer
+        reuses its samples while the sampling domain is unchanged. A
+        re-checked layer resamples only if its weight signature moved.
+        """
+        cached = self._layer_samples.get(layer_name)
+        if cached is not None and cached[0] == domain and layer_name not in self._dirty_layers:
+            return cached[2]
+        signature = _layer_weight_signature(layer_name)
+        if cached is not None and signature is not None and cached[0] == domain and cached[1] == signature:
+            return cached[2]
+        points = animation.SampledCurve.from_points(
+            _layer_weight_points(layer_name, domain[0], domain[1])
+        )
+        if points:
+            self._layer_samples[layer_name] = (domain, signature, points)
+        else:
+            self._layer_samples.pop(layer_name, None)
+        return points
+
     def _recompute(self, force=False):
-        start_frame, end_frame = _weight_curve_domain()
+        domain = _weight_curve_domain()
+
+        layer_names = animation.scene_layer_names(include_root=False)
+        for stale_name in set(self._layer_samples).difference(layer_names):
+            self._layer_samples.pop(stale_name, None)
 
         layer_curves = []
-        for layer_name in animation.scene_layer_names(include_root=False):
+        for layer_name in layer_names:
             layer = animation.AnimationLayer(layer_name)
-            points = _layer_weight_points(layer_name, start_frame, end_frame)
+            points = self._layer_points(layer_name, domain)
             if not points:
                 continue
             layer_curves.append(
@@ -1215,21 +1406,33 @@ class AnimLayerWeightsRunner(QtCore.QObject):
             (entry["name"], entry["selected"], entry["muted"], entry["points"])
             for entry in layer_curves
         )
+        self._dirty_layers.clear()
         if not force and curves_key == self._last_curves_key:
             return
         self._last_curves_key = curves_key
 
         if not layer_curves:
             self._manager.clear_managed_widget(ANIM_LAYER_WEIGHTS_TINT_KEY)
+            self._tint_widget = None
             return
 
-        widget = AnimLayerWeightsTint()
-        widget.set_layer_curves(layer_curves)
-        self._manager.register_managed_widget(
-            widget, key=ANIM_LAYER_WEIGHTS_TINT_KEY, owner=self._manager
-        )
+        widget = self._tint_widget
+        if widget is None:
+            widget = AnimLayerWeightsTint()
+            widget.set_layer_curves(layer_curves)
+            self._manager.register_managed_widget(
+                widget, key=ANIM_LAYER_WEIGHTS_TINT_KEY, owner=self._manager
+            )
+            widget.destroyed.connect(self._on_tint_destroyed)
+            self._tint_widget = widget
+        else:
+            # Repaint the existing overlay in place instead of replacing it.
+            widget.set_layer_curves(layer_curves)
         _emit_runner_triggered(self._manager, ANIM_LAYER_WEIGHTS_ID)
 
+    def _on_tint_destroyed(self, *_args):
+        self._tint_widget = None
+
 
 class BackgroundRunnerController(QtCore.QObject):
     def __init__(self, manager):
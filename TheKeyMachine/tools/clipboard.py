@@ -16,12 +16,23 @@ Usage (read):
 
 Usage (paths, for export/import dialogs):
     path = clipboard.path("animation")
+
+Bulk key-data slots (animation, pose, worldspace, mirror) are stored in a
+compact binary format written behind on a timer thread; export/import
+always exchange JSON.
 """
 from __future__ import annotations
 
+import atexit
 import json
+import mmap
 import os
 import shutil
+import struct
+import sys
+import tempfile
+import threading
+from array import array
 from typing import Any, Optional
 
 # ---------------------------------------------------------------------------
@@ -48,11 +59,44 @@ _SLOTS: dict = {
     "animation_layers": "animation_layers",
 }
 
+# Slots whose payloads are bulk key data. Their slot files use the compact
+# format below and are written behind; the other slots stay plain JSON
+# written on save, since some tools read or hand out those files directly.
+_COMPACT_SLOTS = frozenset(("animation", "curve_keys", "pose", "worldspace", "mirror"))
+
 # Same-session copy/paste should not pay JSON serialization and parsing costs.
 # Files remain the durable/exportable representation and the cache is refreshed
 # whenever a slot is saved or imported.
 _MEMORY: dict = {}
 
+# Compact slot files are written behind: save() stores the payload in
+# _MEMORY, which is authoritative from then on, encodes it, and leaves the
+# file write to a timer thread. _PENDING keeps only the newest encoding per
+# slot file; flush() writes them now, and runs at shutdown.
+WRITE_DELAY_SECONDS = 0.25
+_PENDING: dict = {}
+_LOCK = threading.RLock()
+_WRITE_LOCK = threading.Lock()
+_write_timer: Optional[threading.Timer] = None
+
+# Compact format: a header, a compact JSON skeleton, then packed blocks.
+# Numeric lists of at least _PACK_MIN_LENGTH floats (or ints), and
+# ``array('d')`` values, are stored as little-endian 8-byte blocks and
+# referenced from the skeleton as {"__tkm_packed__": [typecode, offset, count]}.
+_COMPACT_SUFFIX = ".tkmc"
+_COMPACT_MAGIC = b"TKMC"
+_COMPACT_VERSION = 1
+_COMPACT_HEADER = struct.Struct("<4sBQ")
+_PACKED_KEY = "__tkm_packed__"
+_PACK_MIN_LENGTH = 8
+
+
+def _json_default(value: Any) -> Any:
+    """Write ``array`` blocks (e.g. worldspace matrices) as plain JSON lists."""
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError("Object of type {} is not JSON serializable".format(type(value).__name__))
+
 
 def _root() -> str:
     """Return the user data root folder (lazy import to avoid circular deps)."""
@@ -74,6 +118,165 @@ def _resolve(slot: str) -> str:
     return os.path.join(_root(), "TheKeyMachine_user_data", "tools", sub, filename)
 
 
+def _resolve_compact(slot: str) -> str:
+    """Return the compact slot file path, next to the slot's JSON path."""
+    return os.path.splitext(_resolve(slot))[0] + _COMPACT_SUFFIX
+
+
+# ---------------------------------------------------------------------------
+# Compact slot format
+# ---------------------------------------------------------------------------
+
+
+def _packed_array(values) -> Optional[array]:
+    """``values`` as an ``array('d')``/``array('q')`` block, or None to keep it JSON."""
+    if isinstance(values, array):
+        return values if values.typecode == "d" else None
+    if len(values) < _PACK_MIN_LENGTH:
+        return None
+    first = type(values[0])
+    if first is float:
+        if all(type(value) is float for value in values):
+            return array("d", values)
+    elif first is int:
+        if all(type(value) is int for value in values):
+            try:
+                return array("q", values)
+            except OverflowError:
+                return None
+    return None
+
+
+class _Packer:
+    """Swap numeric lists in a payload for references to packed blocks."""
+
+    def __init__(self):
+        self.blocks = []
+        self.size = 0
+
+    def pack(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: self.pack(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple, array)):
+            block = _packed_array(value)
+            if block is None:
+                return [self.pack(item) for item in value]
+            if sys.byteorder != "little":
+                block = array(block.typecode, block)
+                block.byteswap()
+            data = block.tobytes()
+            reference = {_PACKED_KEY: [block.typecode, self.size, len(block)]}
+            self.blocks.append(data)
+            self.size += len(data)
+            return reference
+        return value
+
+
+def encode_compact(data: Any) -> bytes:
+    """Encode *data* in the compact slot format."""
+    packer = _Packer()
+    skeleton = json.dumps(
+        packer.pack(data),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=_json_default,
+    ).encode("utf-8")
+    header = _COMPACT_HEADER.pack(_COMPACT_MAGIC, _COMPACT_VERSION, len(skeleton))
+    return b"".join([header, skeleton] + packer.blocks)
+
+
+def decode_compact(buffer) -> Any:
+    """Decode a compact slot payload from ``bytes`` or a memory map.
+
+    Packed blocks are sliced straight out of *buffer* as the skeleton is
+    parsed and come back as plain lists, like the JSON they replace.
+    """
+    magic, version, skeleton_size = _COMPACT_HEADER.unpack_from(buffer, 0)
+    if magic != _COMPACT_MAGIC or version != _COMPACT_VERSION:
+        raise ValueError("Not a compact clipboard file")
+    skeleton_start = _COMPACT_HEADER.size
+    blocks_start = skeleton_start + skeleton_size
+
+    def _unpack(value):
+        reference = value.get(_PACKED_KEY) if len(value) == 1 else None
+        if reference is None:
+            return value
+        typecode, offset, count = reference
+        block = array(typecode)
+        start = blocks_start + offset
+        block.frombytes(buffer[start:start + count * block.itemsize])
+        if sys.byteorder != "little":
+            block.byteswap()
+        return block.tolist()
+
+    skeleton = bytes(buffer[skeleton_start:blocks_start]).decode("utf-8")
+    return json.loads(skeleton, object_hook=_unpack)
+
+
+def _load_compact(file_path: str) -> Any:
+    with open(file_path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_compact(mapped)
+
+
+def _write_atomic(file_path: str, payload: bytes) -> None:
+    folder = os.path.dirname(file_path)
+    os.makedirs(folder, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(
+        prefix=".{}-".format(os.path.basename(file_path)), suffix=".tmp", dir=folder,
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as fh:
+            fh.write(payload)
+        os.replace(temporary_path, file_path)
+    except Exception:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        raise
+
+
+def _schedule_write() -> None:
+    global _write_timer
+    if _write_timer is not None:
+        _write_timer.cancel()
+    _write_timer = threading.Timer(WRITE_DELAY_SECONDS, flush)
+    _write_timer.daemon = True
+    _write_timer.start()
+
+
+def flush() -> None:
+    """Write every pending compact slot file to disk now."""
+    global _write_timer
+    with _WRITE_LOCK:
+        with _LOCK:
+            if _write_timer is not None:
+                _write_timer.cancel()
+                _write_timer = None
+            pending = list(_PENDING.items())
+            _PENDING.clear()
+        for file_path, payload in pending:
+            try:
+                _write_atomic(file_path, payload)
+            except Exception:
+                # Keep it unless a newer save replaced it meanwhile, so the
+                # next save or flush() retries it.
+                with _LOCK:
+                    _PENDING.setdefault(file_path, payload)
+                continue
+            # The JSON file an older version left would shadow nothing now,
+            # but it would go stale next to the compact one.
+            legacy_path = os.path.splitext(file_path)[0] + ".json"
+            try:
+                os.remove(legacy_path)
+            except OSError:
+                pass
+
+
+atexit.register(flush)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -85,31 +288,58 @@ def path(slot: str) -> str:
 
 
 def exists(slot: str) -> bool:
-    """Return True if a clipboard file exists for the given slot."""
+    """Return True if the given slot holds data, saved or on disk."""
+    if slot in _MEMORY:
+        return True
+    if slot in _COMPACT_SLOTS and os.path.exists(_resolve_compact(slot)):
+        return True
     return os.path.exists(_resolve(slot))
 
 
 def save(slot: str, data: Any) -> None:
-    """Serialize *data* as JSON and write it to the clipboard slot file.
+    """Store *data* in the clipboard slot and persist it to the slot file.
 
-    Creates parent directories if they do not exist.
+    Compact slots are encoded now and written behind on a timer thread;
+    the others are written as JSON straight away. Creates parent
+    directories if they do not exist.
     """
+    if slot in _COMPACT_SLOTS:
+        file_path = _resolve_compact(slot)
+        payload = encode_compact(data)
+        _MEMORY[slot] = data
+        with _LOCK:
+            _PENDING[file_path] = payload
+            _schedule_write()
+        return
+
     file_path = _resolve(slot)
     _MEMORY[slot] = data
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     with open(file_path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2, ensure_ascii=False)
+        json.dump(data, fh, indent=2, ensure_ascii=False, default=_json_default)
         fh.write("\n")
 
 
 def load(slot: str, missing_warning: Optional[str] = None) -> Optional[Any]:
-    """Load and return the JSON data from the given clipboard slot.
+    """Load and return the data stored in the given clipboard slot.
 
-    Returns ``None`` and emits a Maya warning if the file is absent.
+    Reads the compact slot file when there is one, else the JSON file.
+    Returns ``None`` and emits a Maya warning if neither exists.
     """
     if slot in _MEMORY:
         return _MEMORY[slot]
 
+    if slot in _COMPACT_SLOTS:
+        compact_path = _resolve_compact(slot)
+        if os.path.exists(compact_path):
+            try:
+                data = _load_compact(compact_path)
+            except (OSError, ValueError, struct.error):
+                data = None
+            if data is not None:
+                _MEMORY[slot] = data
+                return data
+
     file_path = _resolve(slot)
     if not os.path.exists(file_path):
         if missing_warning:
@@ -140,9 +370,8 @@ def load_raw(file_path: str, missing_warning: Optional[str] = None) -> Optional[
 
 
 def export_to(slot: str, target: str, operation=None) -> Optional[str]:
-    """Copy a clipboard slot to an explicit JSON path."""
-    source = _resolve(slot)
-    if not os.path.exists(source) or not target:
+    """Write a clipboard slot to an explicit JSON path."""
+    if not target or not exists(slot):
         return None
     if not target.lower().endswith(".json"):
         target += ".json"
@@ -151,7 +380,15 @@ def export_to(slot: str, target: str, operation=None) -> Optional[str]:
     target_dir = os.path.dirname(target)
     if target_dir:
         os.makedirs(target_dir, exist_ok=True)
-    shutil.copyfile(source, target)
+    if slot in _COMPACT_SLOTS:
+        data = load(slot)
+        if data is None:
+            return None
+        with open(target, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2, ensure_ascii=False, default=_json_default)
+            fh.write("\n")
+    else:
+        shutil.copyfile(_resolve(slot), target)
     if operation is not None:
         operation.step()
     return target
@@ -175,15 +412,14 @@ def import_from(slot: str, source: str, operation=None) -> Optional[Any]:
 
 
 def export_dialog(slot: str, caption: str, operation=None) -> Optional[str]:
-    """Open a Save dialog and copy the slot file to a user-chosen location.
+    """Open a Save dialog and export the slot as JSON to a user-chosen location.
 
     Returns the exported path, or None if the user cancelled / no data exists.
     """
     from maya import cmds
     from TheKeyMachine.ui.widgets import util as wutil
 
-    file_path = _resolve(slot)
-    if not os.path.exists(file_path):
+    if not exists(slot):
         wutil.make_inViewMessage("No copied data found")
         return None
     result = cmds.fileDialog2(fileMode=0, caption=caption, fileFilter="JSON Files (*.json)")
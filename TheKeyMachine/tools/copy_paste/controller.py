@@ -285,18 +285,13 @@ def _query_anim_channel_data(source, time_context, selected_times=None):
                 keyframes = cmds.keyframe(source, query=True, selected=True, timeChange=True)
                 values = cmds.keyframe(source, query=True, selected=True, valueChange=True)
             else:
-                keyframes = []
-                values = []
-                for key_time in sorted(set(float(value) for value in selected_times)):
-                    queried_values = cmds.keyframe(
+                keyframes, values = (
+                    list(column)
+                    for column in animation.key_data(
                         source,
-                        query=True,
-                        time=(key_time, key_time),
-                        valueChange=True,
-                    ) or []
-                    if queried_values:
-                        keyframes.append(key_time)
-                        values.append(queried_values[0])
+                        key_times=sorted(set(float(value) for value in selected_times)),
+                    )
+                )
         elif time_context.mode == "time_slider_range":
             keyframes = cmds.keyframe(source, query=True, time=(time_context.start_frame, time_context.end_frame))
             values = cmds.keyframe(source, query=True, vc=True, time=(time_context.start_frame, time_context.end_frame))
@@ -331,7 +326,7 @@ def _query_layered_anim_channel_data(
     time_context,
     layer_context=None,
     selected_curves=None,
-    selected_keyframes=None,
+    selected_times_by_curve=None,
     scene_layers=None,
 ):
     layer_context = (
@@ -350,10 +345,8 @@ def _query_layered_anim_channel_data(
         return _query_anim_channel_data(plug, time_context)
 
     allowed_layer_ids = set(layer_context.get("copy_layer_ids") or [])
-    selected_curves = set(selected_curves or [])
-    selected_times_by_curve = {}
-    for selected_curve, key_time in selected_keyframes or []:
-        selected_times_by_curve.setdefault(selected_curve, []).append(float(key_time))
+    selected_curves = selected_curves or ()
+    selected_times_by_curve = selected_times_by_curve or {}
     layer_data = {}
     for entry in layer_entries:
         curve = entry.get("curve")
@@ -1378,13 +1371,15 @@ def copy_animation(*args, **kwargs):
             processor = operation["operation"]
             processor.set_status("Copying Animation")
 
+            selected_curves = set(target_info.curves)
+
             def _query_channel(plug):
                 channel_data = _query_layered_anim_channel_data(
                     plug,
                     time_context,
                     layer_context=layer_context,
-                    selected_curves=target_info.curves,
-                    selected_keyframes=target_info.selected_keys,
+                    selected_curves=selected_curves,
+                    selected_times_by_curve=target_info.selected_keys_by_curve,
                     scene_layers=scene_layers,
                 )
                 if channel_data.get(ANIMATION_FRAME_KEY) or channel_data.get(ANIMATION_LAYERS_KEY):
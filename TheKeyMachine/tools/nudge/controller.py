@@ -487,11 +487,11 @@ def nudge_range(direction):
             start_frame, end_frame = time_context.timerange
 
             if target_info.has_graph_keys:
-                curve_times = {}
-                for curve, key_time in target_info.selected_keys or []:
-                    if not _on_main(operation, edit_filter.is_editable, curve):
-                        continue
-                    curve_times.setdefault(curve, []).append(float(key_time))
+                curve_times = {
+                    curve: key_times
+                    for curve, key_times in target_info.selected_keys_by_curve.items()
+                    if _on_main(operation, edit_filter.is_editable, curve)
+                }
                 if not curve_times:
                     return
                 collisions = _on_main(
@@ -1,8 +1,12 @@
+import dataclasses
+import enum
 import importlib
+import inspect
 import json
 import os
 import pkgutil
 import sys
+import time
 from types import MappingProxyType
 
 
@@ -109,6 +113,25 @@ _PACKAGE_TOOL_DEFINITIONS = None
 _PACKAGE_SECTION_DEFINITIONS = None
 _CHOICE_SETTINGS_BY_OWNER = None
 
+# Importing every tool package (each one imports its api, controllers and Qt
+# widgets, and parses its tooltip.json) is the slowest part of TKM startup.
+# After a full discovery the registry writes a manifest holding every
+# package's tool and section definitions -- ids, sections, labels, resolved
+# icon paths, tooltips, order, shortcuts and slider modes -- plus which
+# package owns each command. Later sessions build the toolbars from it
+# without importing the packages: each callable in a definition (callbacks,
+# widget factories, checked getters, ...) comes back as a proxy that imports
+# its package on first call, the way trigger._slider_executor does for
+# slider apis. A package whose definitions hold something the manifest can't
+# store is recorded as None and imported eagerly. The manifest is keyed by
+# __build__, the install folder, the platform and the files of every tool
+# package, walked recursively; any change there rebuilds it.
+_MANIFEST_VERSION = 3
+_MANIFEST = None
+_MANIFEST_WRITTEN = False
+_DEFERRED_PACKAGES = {}
+STARTUP_TIMINGS = {}
+
 
 
 
@@ -490,7 +513,24 @@ def _validate_definition_graph(tools, sections):
         raise RuntimeError("Invalid tool package graph:\n- " + "\n- ".join(errors))
 
 
+def _package_tool_object_definitions(package_name, tool_object):
+    package_tools = tool_object.tools()
+    for definition in package_tools.values():
+        definition.setdefault("_package", package_name)
+        definition.setdefault("_package_file", tool_object._package_file)
+    package_sections = tool_object.sections()
+    for definition in package_sections.values():
+        definition.setdefault("_package", package_name)
+        definition.setdefault("_package_file", tool_object._package_file)
+    return package_tools, package_sections
+
+
 def _collect_package_definitions():
+    """Import every tool package and merge its definitions in load order.
+
+    Returns ``(tools, sections, packages)``; *packages* lists each package's
+    own ``(name, tools, sections)`` in that order, for the manifest.
+    """
     import TheKeyMachine.tools as tools_package
 
     tools = {}
@@ -517,33 +557,425 @@ def _collect_package_definitions():
     if import_errors:
         raise RuntimeError("Unable to import tool packages:\n- " + "\n- ".join(import_errors))
 
+    package_definitions = []
     for _order, package_name, tool_object in sorted(packages, key=lambda item: (item[0], item[1])):
-        package_tools = tool_object.tools()
-        for definition in package_tools.values():
-            definition.setdefault("_package", package_name)
-            definition.setdefault("_package_file", tool_object._package_file)
-        package_sections = tool_object.sections()
-        for definition in package_sections.values():
-            definition.setdefault("_package", package_name)
-            definition.setdefault("_package_file", tool_object._package_file)
+        package_tools, package_sections = _package_tool_object_definitions(package_name, tool_object)
         _merge_owned(tools, tool_owners, package_tools, package_name, "tool")
         _merge_owned(sections, section_owners, package_sections, package_name, "section")
+        package_definitions.append((package_name, package_tools, package_sections))
     _validate_definition_graph(tools, sections)
+    return tools, sections, package_definitions
+
+
+def _import_package_definitions(package_name):
+    package = importlib.import_module(package_name)
+    tool_object = _tool_object_from_package(package)
+    if tool_object is None:
+        return {}, {}
+    tool_object._package_file = getattr(package, "__file__", None)
+    return _package_tool_object_definitions(package_name, tool_object)
+
+
+def get_package_definitions(package_name):
+    """Return ``(tools, sections)`` owned by one tool package.
+
+    Imports only *package_name* unless the full registry is already loaded.
+    The graph-wide validation still runs on the next full discovery.
+    """
+    if _PACKAGE_TOOL_DEFINITIONS is not None:
+        return (
+            {key: value for key, value in _PACKAGE_TOOL_DEFINITIONS.items() if value.get("_package") == package_name},
+            {key: value for key, value in _PACKAGE_SECTION_DEFINITIONS.items() if value.get("_package") == package_name},
+        )
+    return _import_package_definitions(package_name)
+
+
+class _NotManifestable(Exception):
+    """A definition value the manifest can't store and rebuild."""
+
+
+def _type_reference(value_type):
+    module = value_type.__module__
+    qualname = value_type.__qualname__
+    # Resolving a type that lives in a tool package would import it.
+    if "<locals>" in qualname or module == __name__ or module.startswith("TheKeyMachine.tools."):
+        raise _NotManifestable("{}.{} can't be referenced".format(module, qualname))
+    return [module, qualname]
+
+
+def _resolve_type(reference):
+    module, qualname = reference
+    value = importlib.import_module(module)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def _encode_callable(value, path):
+    if isinstance(value, type):
+        raise _NotManifestable("{} is a class".format("/".join(map(str, path))))
+    try:
+        parameters = [
+            [parameter.name, parameter.kind.name, parameter.default is not parameter.empty]
+            for parameter in inspect.signature(value).parameters.values()
+        ]
+    except (TypeError, ValueError):
+        raise _NotManifestable("{} has no signature".format("/".join(map(str, path))))
+    attributes = {
+        name: item
+        for name, item in getattr(value, "__dict__", {}).items()
+        if name.startswith("_tkm_") and type(item) in (bool, int, float, str)
+    }
+    return {
+        "~": "callable",
+        "name": str(getattr(value, "__name__", path[-1])),
+        "signature": parameters,
+        "attributes": attributes,
+    }
+
+
+def _encode_manifest_value(value, path=()):
+    """JSON form of one definition value; raises _NotManifestable.
+
+    Values JSON can't hold are tagged dicts under the ``"~"`` key. Callables
+    keep only their name, signature and ``_tkm_*`` flags -- the decoded proxy
+    finds the real callable again at the same *path* once its package is
+    imported.
+    """
+    value_type = type(value)
+    if value is None or value_type in (bool, int, float, str):
+        return value
+    if value_type is list:
+        return [_encode_manifest_value(item, path + (index,)) for index, item in enumerate(value)]
+    if value_type is tuple:
+        return {
+            "~": "tuple",
+            "items": [_encode_manifest_value(item, path + (index,)) for index, item in enumerate(value)],
+        }
+    if value_type is dict:
+        if "~" in value or not all(type(key) is str for key in value):
+            raise _NotManifestable("{} has keys JSON can't hold".format("/".join(map(str, path))))
+        return {key: _encode_manifest_value(item, path + (key,)) for key, item in value.items()}
+
+    from TheKeyMachine.ui.tooltips import separator
+
+    if value is separator:
+        return {"~": "separator"}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        encoded = {
+            "~": "dataclass",
+            "type": _type_reference(value_type),
+            "fields": {
+                field.name: _encode_manifest_value(getattr(value, field.name), path + (field.name,))
+                for field in dataclasses.fields(value)
+                if field.init
+            },
+        }
+    elif isinstance(value, enum.Enum):
+        encoded = {
+            "~": "enum",
+            "type": _type_reference(value_type),
+            "value": _encode_manifest_value(value.value, path),
+        }
+    elif callable(value):
+        return _encode_callable(value, path)
+    else:
+        # Qt enums that aren't enum.Enum (Shiboken) still convert to int.
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise _NotManifestable("{} is a {}".format("/".join(map(str, path)), value_type.__name__))
+        encoded = {"~": "enum", "type": _type_reference(value_type), "value": number}
+    try:
+        rebuilt = _decode_manifest_value(encoded, None, path)
+    except Exception:
+        rebuilt = None
+    if rebuilt != value:
+        raise _NotManifestable("{} doesn't round-trip".format("/".join(map(str, path))))
+    return encoded
+
+
+def _decode_manifest_value(value, package_name, path=()):
+    if isinstance(value, list):
+        return [_decode_manifest_value(item, package_name, path + (index,)) for index, item in enumerate(value)]
+    if not isinstance(value, dict):
+        return value
+    kind = value.get("~")
+    if kind is None:
+        return {key: _decode_manifest_value(item, package_name, path + (key,)) for key, item in value.items()}
+    if kind == "tuple":
+        return tuple(
+            _decode_manifest_value(item, package_name, path + (index,))
+            for index, item in enumerate(value["items"])
+        )
+    if kind == "separator":
+        from TheKeyMachine.ui.tooltips import separator
+
+        return separator
+    if kind == "dataclass":
+        return _resolve_type(value["type"])(**{
+            name: _decode_manifest_value(item, package_name, path + (name,))
+            for name, item in value["fields"].items()
+        })
+    if kind == "enum":
+        return _resolve_type(value["type"])(_decode_manifest_value(value["value"], package_name, path))
+    if kind == "callable":
+        return _deferred_callable(package_name, path, value)
+    raise ValueError("Unknown manifest value kind {!r}".format(kind))
+
+
+def _deferred_definition_value(package_name, path):
+    """The real value at *path* in *package_name*'s definitions."""
+    definitions = _DEFERRED_PACKAGES.get(package_name)
+    if definitions is None:
+        started = time.perf_counter()
+        package_tools, package_sections = _import_package_definitions(package_name)
+        definitions = _DEFERRED_PACKAGES[package_name] = {"tools": package_tools, "sections": package_sections}
+        STARTUP_TIMINGS.setdefault("deferred_packages_ms", {})[package_name] = (
+            time.perf_counter() - started
+        ) * 1000.0
+    value = definitions
+    for step in path:
+        value = value[step] if isinstance(value, (dict, list, tuple)) else getattr(value, step)
+    return value
+
+
+def _deferred_callable(package_name, path, spec):
+    """Proxy for a manifest callable that imports its package on first call."""
+    resolved = []
+
+    def call(*args, **kwargs):
+        if not resolved:
+            resolved.append(_deferred_definition_value(package_name, path))
+        return resolved[0](*args, **kwargs)
+
+    call.__name__ = spec["name"]
+    call.__qualname__ = "{}.{}".format(package_name, spec["name"])
+    # register_command() and the widget helpers filter keyword arguments by
+    # signature; the placeholder default only marks a parameter optional.
+    call.__signature__ = inspect.Signature([
+        inspect.Parameter(
+            name,
+            getattr(inspect.Parameter, kind),
+            default=None if has_default else inspect.Parameter.empty,
+        )
+        for name, kind, has_default in spec["signature"]
+    ])
+    for name, item in spec["attributes"].items():
+        setattr(call, name, item)
+    return call
+
+
+def _manifest_path():
+    from TheKeyMachine.core import application
+
+    return application.get_tool_data_path("registry", "manifest.json")
+
+
+def _package_signature(package_folder):
+    """``[latest mtime, file count]`` over every file under *package_folder*.
+
+    Walks subpackages and data folders too, so an edit to a nested api or a
+    tooltip file invalidates the manifest; the count catches deletions.
+    """
+    latest = 0.0
+    count = 0
+    for root, folders, files in os.walk(package_folder):
+        folders[:] = [folder for folder in folders if folder != "__pycache__"]
+        for filename in files:
+            try:
+                latest = max(latest, os.path.getmtime(os.path.join(root, filename)))
+            except OSError:
+                continue
+            count += 1
+    return [latest, count]
+
+
+def _manifest_signature():
+    import TheKeyMachine
+    import TheKeyMachine.tools as tools_package
+
+    packages = {}
+    for folder in tools_package.__path__:
+        for module_info in pkgutil.iter_modules([folder]):
+            if not module_info.ispkg:
+                continue
+            packages[module_info.name] = _package_signature(os.path.join(folder, module_info.name))
+    try:
+        registry_mtime = os.path.getmtime(__file__)
+    except OSError:
+        registry_mtime = None
+    return {
+        "version": _MANIFEST_VERSION,
+        "build": getattr(TheKeyMachine, "__build__", None),
+        # Icon, tooltip media and package file paths are stored resolved.
+        "root": os.path.dirname(os.path.abspath(TheKeyMachine.__file__)),
+        "platform": sys.platform,
+        "registry": registry_mtime,
+        "packages": packages,
+    }
+
+
+def _manifest_commands(tools, sections):
+    commands = {}
+    for tool_id, definition in tools.items():
+        if callable(definition.get("callback")):
+            commands[tool_id] = definition.get("_package")
+    for section in sections.values():
+        if section.get("type") != "slider":
+            continue
+        prefix = section.get("slider_type")
+        for mode in section.get("modes") or ():
+            mode_key = getattr(mode, "key", None)
+            if prefix and mode_key:
+                for value in trigger.SLIDER_BUTTON_VALUES:
+                    commands[trigger.slider_command_name(prefix, mode_key, value)] = section.get("_package")
+    return commands
+
+
+def _manifest_package_definitions(package_definitions):
+    encoded = []
+    for package_name, package_tools, package_sections in package_definitions:
+        try:
+            definitions = _encode_manifest_value({"tools": package_tools, "sections": package_sections})
+        except _NotManifestable:
+            definitions = None
+        encoded.append([package_name, definitions])
+    return encoded
+
+
+def _save_manifest(manifest):
+    path = _manifest_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as stream:
+            # Not sort_keys: definition order is toolbar and menu order.
+            json.dump(manifest, stream)
+        os.replace(temporary_path, path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return manifest
+
+
+def _write_manifest(tools, sections, package_definitions, discovery_ms):
+    return _save_manifest({
+        "signature": _manifest_signature(),
+        "cold_discovery_ms": discovery_ms,
+        "cold_toolbar_ms": {},
+        "commands": _manifest_commands(tools, sections),
+        "definitions": _manifest_package_definitions(package_definitions),
+    })
+
+
+def _load_manifest():
+    """Return the current manifest, or None when it is missing or stale."""
+    global _MANIFEST
+    if _MANIFEST is None:
+        started = time.perf_counter()
+        manifest = False
+        try:
+            with open(_manifest_path(), "r", encoding="utf-8") as stream:
+                payload = json.load(stream)
+            if payload.get("signature") == _manifest_signature():
+                manifest = payload
+        except (OSError, ValueError, AttributeError):
+            pass
+        _MANIFEST = manifest
+        STARTUP_TIMINGS["manifest_load_ms"] = (time.perf_counter() - started) * 1000.0
+        STARTUP_TIMINGS["manifest_valid"] = bool(manifest)
+    return _MANIFEST or None
+
+
+def _manifest_definitions(manifest):
+    """Merged ``(tools, sections)`` decoded from *manifest*.
+
+    Skips the graph validation: the definitions passed it when the manifest
+    was written, and the signature guarantees the packages haven't changed.
+    """
+    tools = {}
+    sections = {}
+    tool_owners = {}
+    section_owners = {}
+    for package_name, definitions in manifest["definitions"]:
+        if definitions is None:
+            package_tools, package_sections = _import_package_definitions(package_name)
+            STARTUP_TIMINGS.setdefault("eager_packages", []).append(package_name)
+        else:
+            decoded = _decode_manifest_value(definitions, package_name)
+            package_tools, package_sections = decoded["tools"], decoded["sections"]
+        _merge_owned(tools, tool_owners, package_tools, package_name, "tool")
+        _merge_owned(sections, section_owners, package_sections, package_name, "section")
     return tools, sections
 
 
+def manifest_command_package(command_name):
+    """Owning package of *command_name* per the manifest, or None."""
+    manifest = _load_manifest()
+    if not manifest:
+        return None
+    return manifest.get("commands", {}).get(command_name)
+
+
+def manifest_cold_discovery_ms():
+    manifest = _load_manifest()
+    return manifest.get("cold_discovery_ms") if manifest else None
+
+
+def manifest_cold_toolbar_ms():
+    """Toolbar build times, by layout, of the session that wrote the manifest."""
+    manifest = _load_manifest()
+    return dict(manifest.get("cold_toolbar_ms") or {}) if manifest else {}
+
+
+def record_toolbar_build(layout_id, elapsed_ms):
+    """Record the first build time of a toolbar layout for the startup report.
+
+    A session that just ran the cold discovery also stores it in the
+    manifest, so later sessions can compare their manifest builds with it.
+    """
+    builds = STARTUP_TIMINGS.setdefault("toolbar_build_ms", {})
+    if layout_id in builds:
+        return
+    builds[layout_id] = elapsed_ms
+    if _MANIFEST_WRITTEN and _MANIFEST:
+        _MANIFEST.setdefault("cold_toolbar_ms", {})[layout_id] = elapsed_ms
+        _save_manifest(_MANIFEST)
+
+
 def reset_package_cache():
     """Force package metadata to be rediscovered after an in-process reload."""
-    global _PACKAGE_TOOL_DEFINITIONS, _PACKAGE_SECTION_DEFINITIONS, _CHOICE_SETTINGS_BY_OWNER
+    global _PACKAGE_TOOL_DEFINITIONS, _PACKAGE_SECTION_DEFINITIONS, _CHOICE_SETTINGS_BY_OWNER, _MANIFEST
+    global _MANIFEST_WRITTEN
     _PACKAGE_TOOL_DEFINITIONS = None
     _PACKAGE_SECTION_DEFINITIONS = None
     _CHOICE_SETTINGS_BY_OWNER = None
+    _MANIFEST = None
+    _MANIFEST_WRITTEN = False
+    _DEFERRED_PACKAGES.clear()
+    STARTUP_TIMINGS.clear()
 
 
 def _package_definitions():
-    global _PACKAGE_TOOL_DEFINITIONS, _PACKAGE_SECTION_DEFINITIONS
+    global _PACKAGE_TOOL_DEFINITIONS, _PACKAGE_SECTION_DEFINITIONS, _MANIFEST, _MANIFEST_WRITTEN
     if _PACKAGE_TOOL_DEFINITIONS is None:
-        tools, sections = _collect_package_definitions()
+        tools = sections = None
+        manifest = _load_manifest()
+        if manifest:
+            started = time.perf_counter()
+            try:
+                tools, sections = _manifest_definitions(manifest)
+            except Exception:
+                tools = sections = None
+            else:
+                STARTUP_TIMINGS["manifest_definitions_ms"] = (time.perf_counter() - started) * 1000.0
+        if tools is None:
+            started = time.perf_counter()
+            tools, sections, package_definitions = _collect_package_definitions()
+            discovery_ms = (time.perf_counter() - started) * 1000.0
+            STARTUP_TIMINGS["discovery_ms"] = discovery_ms
+            _MANIFEST = _write_manifest(tools, sections, package_definitions, discovery_ms) or False
+            _MANIFEST_WRITTEN = bool(_MANIFEST)
         # Wrap (not copy) the memoized registry. get_tool()/get_tool_section()
         # already make their own per-item dict(...) copy before applying
         # overrides -- nothing needs a fresh top-level copy of the whole
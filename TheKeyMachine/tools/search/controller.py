@@ -82,6 +82,92 @@ def ranked_command_rows(rows, text):
     return [row for _rank, row in matches]
 
 
+def _trigrams(text):
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Prebuilt match data for ``ranked_command_rows`` over one catalog.
+
+    Built once on the catalog thread: each row's lowered title, title
+    words, command and tooltip text are cached, and trigram postings map
+    every three-character slice of those fields to the rows containing it.
+    Every non-empty rank needs the query inside one of those fields, so a
+    query's candidates are the rows holding all of its trigrams. When the
+    new text contains the previous query -- the usual next keystroke --
+    only the previous candidates are searched.
+    """
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self._fields = []
+        self._postings = {}
+        for row_index, row in enumerate(self.rows):
+            title_lower = str(row.get("title") or "").lower()
+            command_lower = str(row.get("command") or "").lower().replace("_", " ")
+            tooltip_text = _searchable_tooltip_text(row)
+            self._fields.append((title_lower, title_lower.split(), command_lower, tooltip_text))
+            for gram in _trigrams(title_lower) | _trigrams(command_lower) | _trigrams(tooltip_text):
+                self._postings.setdefault(gram, []).append(row_index)
+        self._all = range(len(self.rows))
+        self._last_query = None
+        self._last_candidates = self._all
+
+    def _rank(self, row_index, query):
+        title_lower, title_words, command_lower, tooltip_text = self._fields[row_index]
+        if title_lower.startswith(query):
+            return 0
+        if any(word.startswith(query) for word in title_words):
+            return 1
+        if query in title_lower:
+            return 2
+        if query in command_lower:
+            return 3
+        if query in tooltip_text:
+            return 4
+        return None
+
+    def _candidates(self, query):
+        if self._last_query and self._last_query in query:
+            candidates = self._last_candidates
+        else:
+            candidates = self._all
+        grams = _trigrams(query)
+        if grams:
+            postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+            allowed = set(postings[0])
+            for posting in postings[1:]:
+                allowed.intersection_update(posting)
+                if not allowed:
+                    break
+            if candidates is self._all:
+                candidates = sorted(allowed)
+            else:
+                candidates = [row_index for row_index in candidates if row_index in allowed]
+        return candidates
+
+    def ranked(self, text):
+        """Same rows, in the same order, as ``ranked_command_rows(rows, text)``."""
+        query = normalize_query(text)
+        if not query:
+            return list(self.rows)
+        matches = []
+        survivors = []
+        for row_index in self._candidates(query):
+            rank = self._rank(row_index, query)
+            if rank is not None:
+                matches.append((rank, row_index))
+                survivors.append(row_index)
+        self._last_query = query
+        self._last_candidates = survivors
+        matches.sort(key=lambda entry: entry[0])
+        return [self.rows[row_index] for _rank, row_index in matches]
+
+
+def build_search_index():
+    return SearchIndex(build_command_rows())
+
+
 def completion_suffix(typed, title):
     typed = str(typed)
     title = str(title)
@@ -113,5 +199,7 @@ def clear_position():
 
 
 class SearchCatalogThread(BackgroundCallThread):
+    """Build the command catalog and its ``SearchIndex`` off the main thread."""
+
     def __init__(self, parent=None):
-        super().__init__(build_command_rows, parent=parent)
+        super().__init__(build_search_index, parent=parent)
@@ -259,7 +259,7 @@ class SearchDialog(customDialogs.QFlatFloatingWidget):
         self.grip.hide()
         self.grip.setEnabled(False)
 
-        self._rows = []
+        self._index = controller.SearchIndex(())
         self._catalog_ready = False
         self._pending_result_rows = []
         self._pending_result_index = 0
@@ -386,13 +386,13 @@ class SearchDialog(customDialogs.QFlatFloatingWidget):
         self._catalog_thread.failed.connect(self._on_catalog_failed)
         self._catalog_thread.start()
 
-    def _on_catalog_loaded(self, rows):
-        self._rows = list(rows or [])
+    def _on_catalog_loaded(self, index):
+        self._index = index if index is not None else controller.SearchIndex(())
         self._catalog_ready = True
         self._filter_results(self.search_input.text())
 
     def _on_catalog_failed(self, error):
-        self._rows = []
+        self._index = controller.SearchIndex(())
         self._catalog_ready = True
         if error:
             print("[TheKeyMachine] Search catalog failed to load: {}".format(error))
@@ -422,7 +422,7 @@ class SearchDialog(customDialogs.QFlatFloatingWidget):
             self._set_results_visible(False)
             return
 
-        matches = controller.ranked_command_rows(self._rows, text)
+        matches = self._index.ranked(text)
 
         self.results.clear()
         self._clear_tooltip_preview()
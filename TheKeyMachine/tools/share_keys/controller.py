@@ -6,6 +6,8 @@ from collections import Counter
 from maya import cmds
 
 from TheKeyMachine.maya import animation
+from TheKeyMachine.maya import api_undo
+from TheKeyMachine.maya import maya_api
 from TheKeyMachine.maya import selection as maya_selection
 from TheKeyMachine.core import settings
 from TheKeyMachine.tools import common as toolCommon
@@ -82,8 +84,53 @@ def _curves_by_object(target_info, objects):
     }
 
 
+def _key_curves_bulk(curves, frames, values_by_curve=None, remove_others=False, operation=None, step=1):
+    """Key *frames* on every curve through the API, as one undoable change.
+
+    Each curve costs one ``maya_api.set_anim_curve_keys`` pass and advances
+    *operation* by *step*. Returns the curves the API couldn't
+    key, for the command path, or ``None`` if nothing was written because
+    the API path is unavailable or failed (its partial edit rolled back).
+    """
+    change = api_undo.begin()
+    if change is None:
+        return None
+    skipped = []
+    try:
+        for curve in curves:
+            if operation and operation.cancelled:
+                break
+            values = (values_by_curve or {}).get(curve)
+            added = maya_api.set_anim_curve_keys(
+                curve,
+                frames,
+                values=values,
+                remove_others=remove_others,
+                change=change,
+            )
+            if added is None:
+                skipped.append(curve)
+                continue
+            if operation:
+                operation.step(step)
+    except Exception:
+        api_undo.rollback(change)
+        return None
+    if not api_undo.commit(change):
+        api_undo.rollback(change)
+        return None
+    return skipped
+
+
 def _set_missing_keys(curves, frames, insert=False, operation=None):
-    for curve in _unique(curves):
+    curves = _unique(curves)
+    if not insert:
+        # setKeyframe -insert's shape-preserving tangents have no API
+        # equivalent, so only plain keying takes the bulk path.
+        skipped = _key_curves_bulk(curves, frames, operation=operation, step=len(frames))
+        if skipped is not None:
+            curves = skipped
+    for curve in curves:
         existing_frames = set(
             _normalize_key_frames(
                 cmds.keyframe(
@@ -262,6 +309,21 @@ def _bake_curves_to_source_frames(curves, frames, operation=None, preserve_shape
     frame_lookup = set(frames)
     time_range = (frames[0], frames[-1])
     shape_data = animation.capture_curve_shape(curves, frames) if preserve_shape else {}
+    values_by_curve = {
+        curve: {float(frame): sample["value"] for frame, sample in samples.items() if sample}
+        for curve, samples in shape_data.items()
+    }
+    skipped = _key_curves_bulk(
+        curves,
+        frames,
+        values_by_curve=values_by_curve,
+        remove_others=True,
+        operation=operation,
+    )
+    if skipped is not None:
+        if operation and operation.cancelled:
+            return
+        curves = skipped
     for curve in curves:
         if operation and operation.cancelled:
             return
@@ -4,6 +4,7 @@ TheKeyMachine - Curve-level Slider Operations
 Operations that work directly on animation curves and their keys.
 """
 
+import math
 import random
 
 from maya import cmds
@@ -16,8 +17,8 @@ except ImportError:
 from TheKeyMachine.data.colors import COLORS
 from TheKeyMachine.maya import animation, maya_api
 from TheKeyMachine.tools.sliders import (
+    curve_values,
     curve_writer,
-    math as slider_math,
     session as slider_session,
     targeting,
 )
@@ -25,74 +26,70 @@ from TheKeyMachine.tools.sliders import (
 
 def _ensure_curve_value_cache(session, curve, keys):
     """Caches original values for ALL keyframes on a curve for stable dragging."""
-    if curve not in session.cache.original_keyframes:
-        cached = None
+    with session.profile_phase("cache"):
+        _fill_curve_value_cache(session, curve, keys)
+
+
+def _fill_curve_value_cache(session, curve, keys):
+    cached = session.cache.original_keyframes.get(curve)
+    if cached is None:
         curve_fn = maya_api.anim_curve_fn(curve)
         if curve_fn is not None:
             try:
                 num_keys = curve_fn.numKeys() if callable(curve_fn.numKeys) else curve_fn.numKeys
-                cached = {
-                    float(curve_fn.input(i).value): curve_fn.value(i)
-                    for i in range(num_keys)
-                }
+                cached = curve_values.CurveValues(
+                    [float(curve_fn.input(i).value) for i in range(num_keys)],
+                    [curve_fn.value(i) for i in range(num_keys)],
+                )
             except Exception:
-                pass
+                cached = None
         if cached is None:
             data = cmds.keyframe(curve, query=True, timeChange=True, valueChange=True) or []
-            cached = {float(data[i]): data[i + 1] for i in range(0, len(data), 2)}
+            cached = curve_values.CurveValues(data[0::2], data[1::2])
         session.cache.original_keyframes[curve] = cached
 
     # Current-frame targets are valid even without an existing key. Cache the
     # evaluated drag-start value so every value slider treats that virtual key
-    # exactly like an existing selected key, then creates it through _apply_value.
-    original_data = session.cache.original_keyframes[curve]
-    curve_fn = maya_api.anim_curve_fn(curve)
+    # exactly like an existing selected key, then creates it through _write_values.
+    curve_fn = None
     for time in keys or []:
         time = float(time)
-        if time in original_data:
+        if time in cached:
             continue
-        value = None
-        if curve_fn is not None and om is not None:
-            try:
-                value = curve_fn.evaluate(om.MTime(time, maya_api.time_unit()))
-            except Exception:
-                pass
-        if value is None:
-            try:
-                values = cmds.keyframe(curve, query=True, eval=True, time=(time, time)) or []
-                value = float(values[0]) if values else None
-            except Exception:
-                pass
+        if curve_fn is None:
+            curve_fn = maya_api.anim_curve_fn(curve)
+        value = _evaluate_curve(curve, curve_fn, time)
         if value is not None:
-            original_data[time] = value
-
-
-def _cached_curve_values(session, curve, keys):
-    _ensure_curve_value_cache(session, curve, keys)
-    return session.cache.original_keyframes[curve]
+            cached.set(time, value)
 
 
-def _cached_value_at_time(session, curve, time):
-    original_data = _cached_curve_values(session, curve, [time])
-    if time in original_data:
-        return original_data[time]
-    curve_fn = maya_api.anim_curve_fn(curve)
+def _evaluate_curve(curve, curve_fn, time):
     if curve_fn is not None and om is not None:
         try:
-            value = curve_fn.evaluate(om.MTime(float(time), maya_api.time_unit()))
-            original_data[time] = value
-            return value
+            return curve_fn.evaluate(om.MTime(float(time), maya_api.time_unit()))
         except Exception:
             pass
     try:
         values = cmds.keyframe(curve, query=True, eval=True, time=(time, time)) or []
-        if values:
-            value = float(values[0])
-            original_data[time] = value
-            return value
+        return float(values[0]) if values else None
     except Exception:
-        pass
-    return None
+        return None
+
+
+def _cached_curve_values(session, curve, keys):
+    _ensure_curve_value_cache(session, curve, keys)
+    return session.cache.original_keyframes[curve]
+
+
+def _cached_value_at_time(session, curve, time):
+    cached = _cached_curve_values(session, curve, [time])
+    value = cached.get(time)
+    if value is not None:
+        return value
+    value = _evaluate_curve(curve, maya_api.anim_curve_fn(curve), time)
+    if value is not None:
+        cached.set(time, value)
+    return value
 
 
 # ---------------------------------------------------------------------------------------------------------------------
@@ -100,22 +97,35 @@ def _cached_value_at_time(session, curve, time):
 # ---------------------------------------------------------------------------------------------------------------------
 
 
-# Redundant helpers removed, using utils instead
+def _block_neighbors(session, curve, cached, time, target_times_set):
+    neighbors = session.cache.neighbor_index(curve, cached.times, target_times_set)
+    return neighbors.block_neighbors(time)
 
 
-def _neighbor_values(curve, time, target_times_set, all_keys, original_data):
-    p_time, n_time = slider_math.block_neighbors(time, target_times_set, all_keys)
-    orig_val = original_data.get(time, original_data.get(p_time, 0.0))
-    p_val = original_data.get(p_time, orig_val)
-    n_val = original_data.get(n_time, orig_val)
+def _neighbor_values(session, curve, cached, time, target_times_set):
+    p_time, n_time = _block_neighbors(session, curve, cached, time, target_times_set)
+    orig_val = cached.get(time, cached.get(p_time, 0.0))
+    p_val = cached.get(p_time, orig_val)
+    n_val = cached.get(n_time, orig_val)
     return p_time, p_val, n_time, n_val
 
 
-def _apply_value(session, curve, time, value):
-    if getattr(session, "preview", False):
-        curve_writer.write_curve_value(session, curve, time, value, create=True, allow_command_fallback=False)
-        return
-    curve_writer.write_curve_value(session, curve, time, value, create=True, allow_command_fallback=True)
+def _apply_values(writes, curve, times, values):
+    pairs = writes.setdefault(curve, [])
+    for time, value in zip(times, values):
+        # NaN marks keys the operation leaves untouched.
+        if not math.isnan(value):
+            pairs.append((time, value))
+
+
+def _write_values(session, writes):
+    """Write one tick's ``{curve: [(time, value), ...]}`` in a single batch."""
+    curve_writer.write_curve_values(
+        session,
+        writes,
+        create=True,
+        allow_command_fallback=not getattr(session, "preview", False),
+    )
 
 
 def _curve_default_value(curve):
@@ -141,190 +151,171 @@ def _curve_default_value(curve):
 def apply_smooth(session, curves=None, factor=1.0):
     """Smooths the curve values toward the average of their block-aware neighbors."""
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = target_times_per_curve.get(curve, [])
         if not keys:
             continue
 
-        original_data = _cached_curve_values(session, curve, keys)
-        all_keys = sorted(original_data.keys())
-        target_times_set = set(keys)
-
-        for time in keys:
-            if time not in original_data:
-                continue
-
-            orig_val = original_data[time]
-            p_time, p_val, n_time, n_val = _neighbor_values(curve, time, target_times_set, all_keys, original_data)
-
-            w_p = 1.0 / abs(time - p_time) if p_time is not None and p_time != time else 0
-            w_n = 1.0 / abs(n_time - time) if n_time is not None and n_time != time else 0
-
-            if w_p + w_n > 0:
-                avg = (p_val * w_p + n_val * w_n) / (w_p + w_n)
-                res = orig_val + (avg - orig_val) * factor
-                _apply_value(session, curve, time, res)
+        cached = _cached_curve_values(session, curve, keys)
+        times, indices = cached.present(keys)
+        if not indices:
+            continue
+        columns = curve_values.neighbor_columns(cached, indices)
+        _apply_values(writes, curve, times, curve_values.smooth(columns, factor))
+    _write_values(session, writes)
 
 
 def apply_rough(session, curves=None, factor=1.0):
     """Push keys away from the neighbor trend only when that trend has motion."""
     factor = 1.0 + max(0.0, factor)
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = target_times_per_curve.get(curve, [])
         if not keys:
             continue
 
-        original_data = _cached_curve_values(session, curve, keys)
-        all_keys = sorted(original_data.keys())
-        target_times_set = set(keys)
-
-        for time in keys:
-            if time not in original_data:
-                continue
-
-            orig_val = original_data[time]
-            p_time, p_val, n_time, n_val = _neighbor_values(curve, time, target_times_set, all_keys, original_data)
-            if p_time is None or n_time is None or p_time == n_time:
-                continue
-            if p_val is None or n_val is None or abs(n_val - p_val) <= 0.000001:
-                continue
-
-            lerp_t = (time - p_time) / (n_time - p_time)
-            pivot = p_val + lerp_t * (n_val - p_val)
-            _apply_value(session, curve, time, pivot + (orig_val - pivot) * factor)
+        cached = _cached_curve_values(session, curve, keys)
+        times, indices = cached.present(keys)
+        if not indices:
+            continue
+        columns = curve_values.neighbor_columns(cached, indices)
+        _apply_values(writes, curve, times, curve_values.rough(columns, factor))
+    _write_values(session, writes)
 
 
 def apply_noise(session, curves=None, factor=1.0):
     """Add stable random noise scaled to each curve's value range."""
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = target_times_per_curve.get(curve, [])
         if not keys:
             continue
 
-        original_data = _cached_curve_values(session, curve, keys)
-        curve_values = list(original_data.values())
-        value_range = (max(curve_values) - min(curve_values)) if curve_values else 0.0
-        amplitude = max(value_range * 0.15, 0.001) * max(0.0, min(1.0, factor))
+        cached = _cached_curve_values(session, curve, keys)
+        amplitude = max(cached.value_range() * 0.15, 0.001) * max(0.0, min(1.0, factor))
         if curve not in session.cache.initial_noise:
             session.cache.initial_noise[curve] = [random.uniform(-1, 1) for _ in keys]
 
         noise_seeds = session.cache.initial_noise[curve]
-
-        for i, time in enumerate(keys):
-            if time in original_data:
-                init_val = original_data[time]
-                noise = noise_seeds[i] * amplitude
-                _apply_value(session, curve, time, init_val + noise)
+        times, indices, offsets = [], [], []
+        for seed, time in zip(noise_seeds, keys):
+            index = cached.index(time)
+            if index is not None:
+                times.append(time)
+                indices.append(index)
+                offsets.append(seed * amplitude)
+        _apply_values(writes, curve, times, curve_values.offset(cached, indices, offsets))
+    _write_values(session, writes)
 
 
 def apply_wave(session, curves=None, factor=1.0):
     """Offset consecutive keys with an alternating positive/negative wave."""
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = sorted(set(target_times_per_curve.get(curve, [])))
         if not keys:
             continue
 
-        original_data = _cached_curve_values(session, curve, keys)
-        target_values = [original_data[time] for time in keys if time in original_data]
-        if not target_values:
+        cached = _cached_curve_values(session, curve, keys)
+        times, indices, directions = [], [], []
+        for position, time in enumerate(keys):
+            index = cached.index(time)
+            if index is not None:
+                times.append(time)
+                indices.append(index)
+                directions.append(1.0 if position % 2 == 0 else -1.0)
+        if not indices:
             continue
 
+        target_values = [cached.values[index] for index in indices]
         value_range = max(target_values) - min(target_values)
         if abs(value_range) <= 0.000001:
             max_amplitude = maya_api.anim_curve_attr_value_to_curve_value(curve, 1.0)
         else:
             max_amplitude = value_range * 3.0
         amplitude = max_amplitude * max(0.0, min(1.0, factor))
-
-        for index, time in enumerate(keys):
-            if time not in original_data:
-                continue
-            direction = 1.0 if index % 2 == 0 else -1.0
-            _apply_value(session, curve, time, original_data[time] + direction * amplitude)
+        offsets = [direction * amplitude for direction in directions]
+        _apply_values(writes, curve, times, curve_values.offset(cached, indices, offsets))
+    _write_values(session, writes)
 
 
 def apply_ease(session, curve_list=None, factor=0.5):
     """Applies easing (in/out) to the curve values."""
-
-    def ease_in(t, p=3):
-        return pow(t, p)
-
-    def ease_out(t, p=3):
-        return 1 - pow(1 - t, p)
+    if factor < 0.5:
+        blend = 1 - (factor * 2)
+        ease_out = False
+    else:
+        blend = (factor - 0.5) * 2
+        ease_out = True
+    power = blend * 3 + 1
 
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = target_times_per_curve.get(curve, [])
         if not keys or len(keys) < 2:
             continue
 
-        original_data = _cached_curve_values(session, curve, keys)
+        cached = _cached_curve_values(session, curve, keys)
 
         first_t, last_t = min(keys), max(keys)
-        total_time = last_t - first_t
-        if total_time == 0:
+        if last_t - first_t == 0:
             continue
 
-        first_v = original_data.get(first_t)
-        last_v = original_data.get(last_t)
+        first_v = cached.get(first_t)
+        last_v = cached.get(last_t)
         if first_v is None or last_v is None:
             continue
 
-        for t in keys:
-            if t in original_data:
-                t_pos = (t - first_t) / total_time
-                if factor < 0.5:
-                    f = 1 - (factor * 2)
-                    e_pos = ease_in(t_pos, p=f * 3 + 1)
-                else:
-                    f = (factor - 0.5) * 2
-                    e_pos = ease_out(t_pos, p=f * 3 + 1)
-
-                target = slider_math.lerp(first_v, last_v, e_pos)
-                orig_v = original_data[t]
-                new_v = slider_math.lerp(orig_v, target, f)
-                _apply_value(session, curve, t, new_v)
+        times, indices = cached.present(keys)
+        values = curve_values.ease(
+            cached, indices, (first_t, first_v), (last_t, last_v), power, ease_out, blend
+        )
+        _apply_values(writes, curve, times, values)
+    _write_values(session, writes)
 
 
 def apply_scale(session, curves=None, factor=1.0):
     """Scales keyframe values relative to their average."""
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = target_times_per_curve.get(curve, [])
         if not keys:
             continue
 
-        original_data = _cached_curve_values(session, curve, keys)
-        selected_vals = {t: original_data[t] for t in keys if t in original_data}
-        if not selected_vals:
+        cached = _cached_curve_values(session, curve, keys)
+        times, indices = cached.present(keys)
+        if not indices:
             continue
-        avg = sum(selected_vals.values()) / len(selected_vals)
-
-        for t in keys:
-            if t in original_data:
-                init = original_data[t]
-                new_v = avg + (init - avg) * factor
-                _apply_value(session, curve, t, new_v)
+        selected = list(dict.fromkeys(indices))
+        avg = sum(cached.values[index] for index in selected) / len(selected)
+        _apply_values(writes, curve, times, curve_values.scaled(cached, indices, avg, factor))
+    _write_values(session, writes)
 
 
 def apply_scale_from_pivot(session, curves=None, pivot_getter=None, factor=1.0):
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = target_times_per_curve.get(curve, [])
         if not keys:
             continue
-        original_data = _cached_curve_values(session, curve, keys)
-        selected = {t: original_data[t] for t in keys if t in original_data}
+        cached = _cached_curve_values(session, curve, keys)
+        times, indices = cached.present(keys)
+        selected = dict(zip(times, (cached.values[index] for index in indices)))
         if not selected:
             continue
         pivot = pivot_getter(curve, keys, selected)
         if pivot is None:
             continue
-        for t, value in selected.items():
-            _apply_value(session, curve, t, pivot + (value - pivot) * factor)
+        indices = [cached.index(time) for time in selected]
+        _apply_values(writes, curve, list(selected), curve_values.scaled(cached, indices, pivot, factor))
+    _write_values(session, writes)
 
 
 # ---------------------------------------------------------------------------------------------------------------------
@@ -336,28 +327,19 @@ def apply_pull_push(session, curves=None, amount=0.0):
     """Pulls keys toward the interpolated neighbor line or pushes them away."""
     factor = 1.0 + amount
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     for curve in resolved_curves:
         keys = target_times_per_curve.get(curve, [])
         if not keys:
             continue
 
-        original_data = _cached_curve_values(session, curve, keys)
-        all_keys = sorted(original_data.keys())
-        target_times_set = set(keys)
-
-        for t in keys:
-            if t in original_data:
-                orig_v = original_data[t]
-                p_time, p_val, n_time, n_val = _neighbor_values(curve, t, target_times_set, all_keys, original_data)
-
-                if p_time is None or n_time is None or p_time == n_time:
-                    pivot = p_val if p_val is not None else (n_val if n_val is not None else orig_v)
-                else:
-                    lerp_t = (t - p_time) / (n_time - p_time)
-                    pivot = p_val + lerp_t * (n_val - p_val)
-
-                new_v = pivot + (orig_v - pivot) * factor
-                _apply_value(session, curve, t, new_v)
+        cached = _cached_curve_values(session, curve, keys)
+        times, indices = cached.present(keys)
+        if not indices:
+            continue
+        columns = curve_values.neighbor_columns(cached, indices)
+        _apply_values(writes, curve, times, curve_values.pull_push(columns, factor))
+    _write_values(session, writes)
 
 
 def _implicit_connect_block(direction, current_time, all_keys):
@@ -381,6 +363,7 @@ def _implicit_connect_block(direction, current_time, all_keys):
 def apply_connect_neighbors(session, curves, amount):
     """Shift the affected block vertically so its edge connects to a neighbor."""
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     direction = -1 if amount < 0 else 1
     factor = min(1.0, max(0.0, abs(amount)))
     current_time = float(cmds.currentTime(query=True))
@@ -392,21 +375,20 @@ def apply_connect_neighbors(session, curves, amount):
         if not resolved_keys:
             continue
 
-        original_data = _cached_curve_values(session, curve, resolved_keys)
+        cached = _cached_curve_values(session, curve, resolved_keys)
         _cached_value_at_time(session, curve, current_time)
-        all_keys = sorted(original_data.keys())
 
         if has_selected_range:
             keys = resolved_keys
             target_times_set = set(keys)
             if direction < 0:
                 anchor_time = min(keys)
-                neighbor_time, _right_time = slider_math.block_neighbors(anchor_time, target_times_set, all_keys)
+                neighbor_time, _right_time = _block_neighbors(session, curve, cached, anchor_time, target_times_set)
             else:
                 anchor_time = max(keys)
-                _left_time, neighbor_time = slider_math.block_neighbors(anchor_time, target_times_set, all_keys)
+                _left_time, neighbor_time = _block_neighbors(session, curve, cached, anchor_time, target_times_set)
         else:
-            keys, neighbor_time = _implicit_connect_block(direction, current_time, all_keys)
+            keys, neighbor_time = _implicit_connect_block(direction, current_time, list(cached.times))
             anchor_time = current_time
 
         for time in keys:
@@ -426,8 +408,9 @@ def apply_connect_neighbors(session, curves, amount):
             value = _cached_value_at_time(session, curve, time)
             if value is None:
                 continue
-            _apply_value(session, curve, time, value + offset)
+            writes.setdefault(curve, []).append((time, value + offset))
 
+    _write_values(session, writes)
     if affected_tint_times:
         session.show_target_tint((min(affected_tint_times), max(affected_tint_times)))
 
@@ -435,6 +418,7 @@ def apply_connect_neighbors(session, curves, amount):
 def apply_gap_stitcher(session, curves, amount):
     """Close a boundary gap and feather its offset across the selected block."""
     resolved_curves, target_times_per_curve = targeting.curves_for_session(session)
+    writes = {}
     direction = -1 if amount < 0.0 else 1
     blend = min(1.0, max(0.0, abs(float(amount))))
     affected_times = []
@@ -442,11 +426,10 @@ def apply_gap_stitcher(session, curves, amount):
         keys = sorted(float(time) for time in (target_times_per_curve.get(curve, []) or []))
         if not keys:
             continue
-        original_data = _cached_curve_values(session, curve, keys)
-        all_keys = sorted(original_data)
+        cached = _cached_curve_values(session, curve, keys)
         selected_set = set(keys)
         anchor = keys[0] if direction < 0 else keys[-1]
-        previous_time, next_time = slider_math.block_neighbors(anchor, selected_set, all_keys)
+        previous_time, next_time = _block_neighbors(session, curve, cached, anchor, selected_set)
         neighbor = previous_time if direction < 0 else next_time
         if neighbor is None or neighbor == anchor:
             continue
@@ -466,8 +449,9 @@ def apply_gap_stitcher(session, curves, amount):
                 feather = 1.0 - (index / float(count - 1))
             else:
                 feather = index / float(count - 1)
-            _apply_value(session, curve, time, value + full_offset * feather * blend)
+            writes.setdefault(curve, []).append((time, value + full_offset * feather * blend))
             affected_times.append(time)
+    _write_values(session, writes)
     if affected_times:
         session.show_target_tint((min(affected_times), max(affected_times)))
 
@@ -609,11 +593,11 @@ def apply_scale_neighbor_left(session, curves, factor):
     _, target_times_per_curve = targeting.curves_for_session(session)
 
     def _pivot(curve, keys, selected):
-        original_data = session.cache.original_keyframes.get(curve, {})
-        all_keys = sorted(original_data.keys())
-        target_times_set = set(keys)
+        cached = session.cache.original_keyframes.get(curve)
+        if cached is None:
+            cached = curve_values.CurveValues()
         first_key = min(selected)
-        p_time, p_val, _n_time, _n_val = _neighbor_values(curve, first_key, target_times_set, all_keys, original_data)
+        p_time, p_val, _n_time, _n_val = _neighbor_values(session, curve, cached, first_key, set(keys))
         return p_val if p_time is not None else None
 
     apply_scale_from_pivot(session, curves, _pivot, factor)
@@ -623,11 +607,11 @@ def apply_scale_neighbor_right(session, curves, factor):
     _, target_times_per_curve = targeting.curves_for_session(session)
 
     def _pivot(curve, keys, selected):
-        original_data = session.cache.original_keyframes.get(curve, {})
-        all_keys = sorted(original_data.keys())
-        target_times_set = set(keys)
+        cached = session.cache.original_keyframes.get(curve)
+        if cached is None:
+            cached = curve_values.CurveValues()
         last_key = max(selected)
-        _p_time, _p_val, n_time, n_val = _neighbor_values(curve, last_key, target_times_set, all_keys, original_data)
+        _p_time, _p_val, n_time, n_val = _neighbor_values(session, curve, cached, last_key, set(keys))
         return n_val if n_time is not None else None
 
     apply_scale_from_pivot(session, curves, _pivot, factor)
@@ -784,6 +768,7 @@ def execute(mode, value, session=None):
     session = session or create_session(mode)
     if session.mode != mode:
         session.switch_mode(mode, title=mode_data.label, description=mode_data.description, tooltip=mode_data.tooltip)
+    session.begin_tick()
     try:
         if session.preview and mode in ("simplify_bake", "time_offsetter"):
             session.undo_preview_changes()
@@ -799,5 +784,6 @@ def execute(mode, value, session=None):
             TIME_OPERATIONS[mode](session, None, value / 10.0)
         return session
     finally:
+        session.end_tick()
         if standalone:
             session.finish()
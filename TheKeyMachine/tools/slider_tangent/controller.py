@@ -290,6 +290,7 @@ def execute(mode, value, session=None):
     session = session or create_session(mode)
     if session.mode != mode:
         session.switch_mode(mode, title=mode_data.label, description=mode_data.description, tooltip=mode_data.tooltip)
+    session.begin_tick()
     try:
         if session.preview:
             session.ensure_undo_open()
@@ -299,5 +300,6 @@ def execute(mode, value, session=None):
         apply_tangent_type_blend(session, None, TANGENT_TYPES[mode], value / 100.0)
         return session
     finally:
+        session.end_tick()
         if standalone:
             session.finish()
@@ -279,12 +279,13 @@ def prepare_tween_data(session, objs=None, attrs=None, attr_plugs=None, time_ran
             if keyframes is None:
                 keyframes = sorted([float(k) for k in (cmds.keyframe(attr_full, query=True) or [])])
                 target_times_set = set(float(t) for t in times)
+                neighbors = session.cache.neighbor_index(attr_full, keyframes, target_times_set)
 
             if not keyframes:
                 session.cache.tween_frame_data[(attr_full, current_time)] = TweenFrameData(needsCalculation=False, use_direct_attribute=True)
                 continue
 
-            prev_f, next_f = slider_math.block_neighbors(current_time, target_times_set, keyframes)
+            prev_f, next_f = neighbors.block_neighbors(current_time)
 
             # If no neighbor on one side, fallback to the other
             if prev_f is None and next_f is None:
@@ -353,8 +354,9 @@ def cache_neighbor_keyframe_data(session, affected_map, time_range=None):
                 if keyframes is None:
                     keyframes = sorted([float(k) for k in (cmds.keyframe(attr_full, query=True) or [])])
                     target_times_set = set(float(t) for t in times)
+                    neighbors = session.cache.neighbor_index(attr_full, keyframes, target_times_set)
 
-                prev_f, next_f = slider_math.block_neighbors(current_time, target_times_set, keyframes)
+                prev_f, next_f = neighbors.block_neighbors(current_time)
 
                 if prev_f is not None:
                     try:
@@ -396,7 +398,8 @@ def apply_tween(session, value, world_space=False):
         if not affected_map:
             return
         session.snapshot_pose_buffer(affected_map)
-        prepare_tween_data(session, attr_plugs=affected_map, time_range=time_range)
+        with session.profile_phase("cache"):
+            prepare_tween_data(session, attr_plugs=affected_map, time_range=time_range)
 
     t = (float(value) + 100.0) / 200.0
     initial_time = cmds.currentTime(query=True)
@@ -487,7 +490,8 @@ def apply_blend_to_neighbors(session, percentage, world_space=False):
         if not affected_map:
             return
         session.snapshot_pose_buffer(affected_map)
-        cache_neighbor_keyframe_data(session, affected_map, time_range=time_range)
+        with session.profile_phase("cache"):
+            cache_neighbor_keyframe_data(session, affected_map, time_range=time_range)
         session.cache.is_cached = True
 
     processed_world_targets = set()
@@ -536,7 +540,8 @@ def apply_blend_to_ease(session, percentage, world_space=False):
         if not affected_map:
             return
         session.snapshot_pose_buffer(affected_map)
-        cache_neighbor_keyframe_data(session, affected_map, time_range=time_range)
+        with session.profile_phase("cache"):
+            cache_neighbor_keyframe_data(session, affected_map, time_range=time_range)
         session.cache.is_cached = True
 
     blend = float(percentage) / 100.0
@@ -963,6 +968,7 @@ def execute(mode, value, session=None):
     if session.mode != mode:
         session.switch_mode(mode, title=mode_data.label, description=mode_data.description, tooltip=mode_data.tooltip)
     world_space = bool(mode_data and mode_data.world_space)
+    session.begin_tick()
     try:
         if session.preview and world_space:
             return session
@@ -975,5 +981,6 @@ def execute(mode, value, session=None):
             function(session, value, world_space)
         return session
     finally:
+        session.end_tick()
         if standalone:
             session.finish()
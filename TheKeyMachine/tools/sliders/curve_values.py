@@ -0,0 +1,229 @@
+"""Columnar drag-start key caches for curve-level slider operations.
+
+Pure data and math: no Maya imports, so benchmarks can load this directly.
+Every operation computes the new values of all affected keys of one curve
+in a single pass -- through NumPy when it is importable, plain Python loops
+over the same ``array('d')`` columns otherwise.
+"""
+
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NAN = float("nan")
+
+
+class CurveValues:
+    """Sorted key times and drag-start values of one curve.
+
+    ``times`` and ``values`` are parallel ``array('d')`` columns. Lookups
+    bisect ``times``; evaluated values for times without a key (virtual
+    keys) are inserted in order, exactly as they joined the old dict cache.
+    """
+
+    __slots__ = ("times", "values")
+
+    def __init__(self, times=(), values=()):
+        pairs = {}
+        for time, value in zip(times, values):
+            pairs[float(time)] = float(value)
+        ordered = sorted(pairs)
+        self.times = array("d", ordered)
+        self.values = array("d", (pairs[time] for time in ordered))
+
+    def __len__(self):
+        return len(self.times)
+
+    def __contains__(self, time):
+        return self.index(time) is not None
+
+    def index(self, time):
+        if time is None:
+            return None
+        position = bisect_left(self.times, time)
+        if position < len(self.times) and self.times[position] == time:
+            return position
+        return None
+
+    def get(self, time, default=None):
+        index = self.index(time)
+        return default if index is None else self.values[index]
+
+    def set(self, time, value):
+        time = float(time)
+        position = bisect_left(self.times, time)
+        if position < len(self.times) and self.times[position] == time:
+            self.values[position] = float(value)
+            return
+        self.times.insert(position, time)
+        self.values.insert(position, float(value))
+
+    def value_range(self):
+        if not self.values:
+            return 0.0
+        return max(self.values) - min(self.values)
+
+    def present(self, keys):
+        """``(times, indices)`` of the *keys* cached here, in *keys* order."""
+        times = []
+        indices = []
+        for time in keys:
+            index = self.index(time)
+            if index is not None:
+                times.append(time)
+                indices.append(index)
+        return times, indices
+
+    def neighbor_indices(self, indices):
+        """Block-neighbor key indices for each of *indices*.
+
+        *indices* are the selected keys; each contiguous run of them is
+        bounded by the key just outside it, or by its own end key at the
+        curve's ends -- ``math.block_neighbors`` for every key at once, in
+        O(k) instead of a walk per key.
+        """
+        last = len(self.times) - 1
+        unique = sorted(set(indices))
+        bounds = {}
+        run_start = 0
+        for position, index in enumerate(unique):
+            if position + 1 < len(unique) and unique[position + 1] == index + 1:
+                continue
+            start = unique[run_start]
+            previous = start - 1 if start > 0 else 0
+            following = index + 1 if index < last else last
+            for member in unique[run_start:position + 1]:
+                bounds[member] = (previous, following)
+            run_start = position + 1
+        previous = [bounds[index][0] for index in indices]
+        following = [bounds[index][1] for index in indices]
+        return previous, following
+
+
+def _columns(cache, *index_lists):
+    if numpy is not None:
+        times = numpy.array(cache.times, dtype=float)
+        values = numpy.array(cache.values, dtype=float)
+        result = []
+        for indices in index_lists:
+            indices = numpy.asarray(indices, dtype=numpy.intp)
+            result.extend((times[indices], values[indices]))
+        return result
+    result = []
+    for indices in index_lists:
+        result.append([cache.times[index] for index in indices])
+        result.append([cache.values[index] for index in indices])
+    return result
+
+
+def _as_list(values):
+    return values.tolist() if numpy is not None else values
+
+
+def neighbor_columns(cache, indices):
+    """``(t, v, previous_t, previous_v, next_t, next_v)`` aligned with *indices*."""
+    previous, following = cache.neighbor_indices(indices)
+    return _columns(cache, indices, previous, following)
+
+
+def smooth(columns, factor):
+    """Blend each key toward the distance-weighted mean of its block neighbors."""
+    t, v, pt, pv, nt, nv = columns
+    if numpy is not None:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            w_p = numpy.where(pt != t, 1.0 / numpy.abs(t - pt), 0.0)
+            w_n = numpy.where(nt != t, 1.0 / numpy.abs(nt - t), 0.0)
+            total = w_p + w_n
+            average = (pv * w_p + nv * w_n) / total
+        return _as_list(numpy.where(total > 0, v + (average - v) * factor, NAN))
+    result = []
+    for time, value, p_time, p_val, n_time, n_val in zip(t, v, pt, pv, nt, nv):
+        w_p = 1.0 / abs(time - p_time) if p_time != time else 0
+        w_n = 1.0 / abs(n_time - time) if n_time != time else 0
+        if w_p + w_n > 0:
+            average = (p_val * w_p + n_val * w_n) / (w_p + w_n)
+            result.append(value + (average - value) * factor)
+        else:
+            result.append(NAN)
+    return result
+
+
+def rough(columns, factor):
+    """Push keys away from the neighbor line; keys on flat spans are left alone."""
+    t, v, pt, pv, nt, nv = columns
+    if numpy is not None:
+        moving = (pt != nt) & (numpy.abs(nv - pv) > 0.000001)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            pivot = pv + (t - pt) / (nt - pt) * (nv - pv)
+        return _as_list(numpy.where(moving, pivot + (v - pivot) * factor, NAN))
+    result = []
+    for time, value, p_time, p_val, n_time, n_val in zip(t, v, pt, pv, nt, nv):
+        if p_time == n_time or abs(n_val - p_val) <= 0.000001:
+            result.append(NAN)
+            continue
+        pivot = p_val + (time - p_time) / (n_time - p_time) * (n_val - p_val)
+        result.append(pivot + (value - pivot) * factor)
+    return result
+
+
+def pull_push(columns, factor):
+    """Scale each key about the neighbor line (the previous key at curve ends)."""
+    t, v, pt, pv, nt, nv = columns
+    if numpy is not None:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            pivot = numpy.where(pt == nt, pv, pv + (t - pt) / (nt - pt) * (nv - pv))
+        return _as_list(pivot + (v - pivot) * factor)
+    result = []
+    for time, value, p_time, p_val, n_time, n_val in zip(t, v, pt, pv, nt, nv):
+        if p_time == n_time:
+            pivot = p_val
+        else:
+            pivot = p_val + (time - p_time) / (n_time - p_time) * (n_val - p_val)
+        result.append(pivot + (value - pivot) * factor)
+    return result
+
+
+def ease(cache, indices, start, end, power, ease_out, blend):
+    """Blend keys toward an ease-in/out curve between ``start`` and ``end``.
+
+    ``start`` and ``end`` are ``(time, value)`` pairs spanning the selection.
+    """
+    first_t, first_v = start
+    last_t, last_v = end
+    total = last_t - first_t
+    t, v = _columns(cache, indices)
+    if numpy is not None:
+        position = (t - first_t) / total
+        if ease_out:
+            eased = 1 - numpy.power(1 - position, power)
+        else:
+            eased = numpy.power(position, power)
+        target = first_v + (last_v - first_v) * eased
+        return _as_list(v + (target - v) * blend)
+    result = []
+    for time, value in zip(t, v):
+        position = (time - first_t) / total
+        eased = 1 - pow(1 - position, power) if ease_out else pow(position, power)
+        target = first_v + (last_v - first_v) * eased
+        result.append(value + (target - value) * blend)
+    return result
+
+
+def scaled(cache, indices, pivot, factor):
+    """Scale key values about *pivot*."""
+    _t, v = _columns(cache, indices)
+    if numpy is not None:
+        return _as_list(pivot + (v - pivot) * factor)
+    return [pivot + (value - pivot) * factor for value in v]
+
+
+def offset(cache, indices, offsets):
+    """Add per-key *offsets* to key values."""
+    _t, v = _columns(cache, indices)
+    if numpy is not None:
+        return _as_list(v + numpy.asarray(offsets, dtype=float))
+    return [value + amount for value, amount in zip(v, offsets)]
@@ -1,10 +1,18 @@
 """Preview and commit animation values for interactive slider sessions."""
 
+from bisect import bisect_left
+import time as _time
+
 from maya import cmds
 
+from TheKeyMachine.core import runtime
 from TheKeyMachine.maya import maya_api
+from TheKeyMachine.tools import common as tool_common
 from TheKeyMachine.tools.sliders import targeting
 
+# Same tolerance maya_api.anim_curve_key_index matches key times with.
+KEY_TIME_TOLERANCE = 0.000001
+
 
 def curve_for_attribute(session, attribute):
     return targeting.editable_curve_for_attribute(session, attribute)
@@ -53,6 +61,30 @@ def write_attribute_curve_value(
     curve=None,
     key_index=None,
     create_key=False,
+):
+    with session.profile_phase("write"):
+        _write_attribute_curve_value(
+            session,
+            attribute,
+            value,
+            current_time,
+            use_direct_attribute=use_direct_attribute,
+            curve=curve,
+            key_index=key_index,
+            create_key=create_key,
+        )
+    session.profile_writes((curve or attribute,), 1)
+
+
+def _write_attribute_curve_value(
+    session,
+    attribute,
+    value,
+    current_time,
+    use_direct_attribute=False,
+    curve=None,
+    key_index=None,
+    create_key=False,
 ):
     attribute_value = _clamp_attribute_value(
         attribute,
@@ -156,11 +188,118 @@ def write_curve_value(
     create=True,
     allow_command_fallback=True,
 ):
-    if not session.preview:
+    session.profile_writes((curve,), 1)
+    with session.profile_phase("write"):
+        if not session.preview:
+            if allow_command_fallback:
+                _write_curve_with_commands(curve, time, value)
+            return
+        if _write_curve_with_maya_api(session, curve, time, value, create=create):
+            return
         if allow_command_fallback:
             _write_curve_with_commands(curve, time, value)
+
+
+class _KeyTimes:
+    """Sorted key times of one curve answering tolerant index lookups."""
+
+    def __init__(self, times):
+        self.times = sorted(float(time) for time in times)
+
+    @classmethod
+    def from_fn(cls, curve_fn):
+        count = curve_fn.numKeys() if callable(curve_fn.numKeys) else curve_fn.numKeys
+        return cls(curve_fn.input(index).value for index in range(count))
+
+    def index(self, time):
+        position = bisect_left(self.times, float(time) - KEY_TIME_TOLERANCE)
+        if position < len(self.times) and abs(self.times[position] - float(time)) <= KEY_TIME_TOLERANCE:
+            return position
+        return None
+
+
+def _write_curve_batch_with_maya_api(session, curve, writes, create=False):
+    """Write one curve's keys through its MFnAnimCurve; return what was left."""
+    curve_fn = maya_api.anim_curve_fn(curve)
+    if curve_fn is None:
+        return list(writes)
+    try:
+        key_times = _KeyTimes.from_fn(curve_fn)
+        if create:
+            missing = [time for time, _value in writes if key_times.index(time) is None]
+            for time in missing:
+                maya_api.add_anim_curve_key(curve_fn, time, change=session.anim_change)
+            if missing:
+                # Inserted keys shift every later index; re-read once.
+                key_times = _KeyTimes.from_fn(curve_fn)
+    except Exception:
+        return list(writes)
+    remaining = []
+    for time, value in writes:
+        index = key_times.index(time)
+        if index is None or not maya_api.set_anim_curve_value_by_index(
+            curve_fn,
+            index,
+            value,
+            change=session.anim_change,
+        ):
+            remaining.append((time, value))
+    return remaining
+
+
+def _write_curve_batch_with_commands(curve, writes):
+    """``_write_curve_with_commands`` for many keys: one key query per curve."""
+    to_attr_value = maya_api.anim_curve_attr_value_converter(curve)
+    try:
+        key_times = _KeyTimes(cmds.keyframe(curve, query=True, timeChange=True) or [])
+    except Exception:
+        key_times = _KeyTimes([])
+    for time, value in writes:
+        command_value = to_attr_value(value)
+        if key_times.index(time) is not None:
+            try:
+                cmds.keyframe(
+                    curve,
+                    edit=True,
+                    time=(time, time),
+                    valueChange=command_value,
+                )
+                continue
+            except Exception:
+                pass
+        cmds.setKeyframe(curve, time=(time,), value=command_value)
+
+
+def write_curve_values(session, writes, create=True, allow_command_fallback=True):
+    """Write one tick of ``{curve: [(time, value), ...]}`` as a single batch.
+
+    Preview writes go through each curve's MFnAnimCurve into the session's
+    ``anim_change``, resolving key indices once per curve instead of once per
+    key; committed writes use commands grouped per curve. Anim-curve edit
+    callbacks are delivered once for the whole batch. The batch size and
+    duration land in ``session.last_write_timing``.
+    """
+    writes = {curve: pairs for curve, pairs in (writes or {}).items() if pairs}
+    if not writes:
         return
-    if _write_curve_with_maya_api(session, curve, time, value, create=create):
-        return
-    if allow_command_fallback:
-        _write_curve_with_commands(curve, time, value)
+    started = _time.perf_counter()
+    with session.profile_phase("write"):
+        curve_objects = [
+            mobject
+            for mobject in (maya_api.mobject_from_node(curve) for curve in writes)
+            if mobject is not None
+        ]
+        with runtime.get_runtime_manager().coalesce_anim_curve_callbacks(curve_objects):
+            for curve, pairs in writes.items():
+                if session.preview:
+                    pairs = _write_curve_batch_with_maya_api(session, curve, pairs, create=create)
+                if pairs and allow_command_fallback:
+                    _write_curve_batch_with_commands(curve, pairs)
+    elapsed = (_time.perf_counter() - started) * 1000.0
+    session.last_write_timing = {
+        "curves": len(writes),
+        "keys": sum(len(pairs) for pairs in writes.values()),
+        "ms": elapsed,
+    }
+    session.profile_writes(writes, session.last_write_timing["keys"])
+    tool_common.debug_timing_log("slider_write {}".format(session.mode), write=elapsed)
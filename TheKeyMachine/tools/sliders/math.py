@@ -1,5 +1,7 @@
 """Pure interpolation and key-neighbor calculations shared by slider tools."""
 
+from bisect import bisect_left
+
 
 def block_neighbors(time, target_times, all_keys):
     """Return the bounding keys outside the selected continuous block."""
@@ -24,6 +26,58 @@ def block_neighbors(time, target_times, all_keys):
     return previous, following
 
 
+class NeighborIndex:
+    """Precomputed ``block_neighbors`` answers for one curve and selection.
+
+    Built once from the sorted key times and the selected set: every key's
+    block bounds are resolved in two linear passes, so a query on a key time
+    is a dict lookup and any other time costs one bisect.
+    """
+
+    __slots__ = ("keys", "target_count", "positions", "previous", "following")
+
+    def __init__(self, all_keys, target_times):
+        keys = list(all_keys)
+        count = len(keys)
+        self.keys = keys
+        self.target_count = len(target_times)
+        self.positions = {}
+        for index, key in enumerate(keys):
+            self.positions.setdefault(key, index)
+
+        previous = [None] * count
+        for index in range(count):
+            if index > 0 and keys[index - 1] in target_times:
+                previous[index] = previous[index - 1]
+            else:
+                previous[index] = keys[index - 1] if index > 0 else keys[index]
+
+        following = [None] * count
+        for index in range(count - 1, -1, -1):
+            if index < count - 1 and keys[index + 1] in target_times:
+                following[index] = following[index + 1]
+            else:
+                following[index] = keys[index + 1] if index < count - 1 else keys[index]
+
+        self.previous = previous
+        self.following = following
+
+    def block_neighbors(self, time):
+        """Same result as ``block_neighbors(time, target_times, all_keys)``."""
+        current = float(time)
+        index = self.positions.get(current)
+        if index is not None:
+            return self.previous[index], self.following[index]
+
+        keys = self.keys
+        if not keys:
+            return current, current
+        position = bisect_left(keys, current)
+        previous = keys[position - 1] if position > 0 else keys[0]
+        following = keys[position] if position < len(keys) else keys[-1]
+        return previous, following
+
+
 def lerp(start, end, amount):
     while isinstance(start, (list, tuple)) and len(start) == 1:
         start = start[0]
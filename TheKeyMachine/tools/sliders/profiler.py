@@ -0,0 +1,174 @@
+"""Opt-in per-tick timing for slider drags.
+
+Off unless ``TKM_DEBUG_TIMING`` is on or it is switched on from the TKM
+Debug menu. Every finished tick records how long it spent resolving
+targets, building drag-start caches and writing keys, plus the curves and
+keys it wrote, into a rolling window per slider mode. Whatever a tick spent
+outside those phases is reported as ``compute`` (the mode's math, and any
+cache a mode builds inline on its first tick).
+
+No Maya imports: the session owns one ``TickProfile`` per tick and this
+module only keeps the numbers.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+
+WINDOW = 240
+PHASES = ("targets", "cache", "compute", "write")
+
+NO_PHASE = nullcontext()
+
+_enabled = None
+_ticks = {}
+
+
+def enabled():
+    global _enabled
+    if _enabled is None:
+        try:
+            from TheKeyMachine.tools import common as tool_common
+
+            _enabled = tool_common.debug_timing_enabled()
+        except Exception:
+            _enabled = False
+    return _enabled
+
+
+def set_enabled(value):
+    global _enabled
+    _enabled = bool(value)
+
+
+def reset():
+    _ticks.clear()
+
+
+class _Phase:
+    __slots__ = ("profile", "name", "started")
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+        self.started = None
+
+    def __enter__(self):
+        # Phases nest (a cache helper that writes, a write that re-resolves);
+        # only the outermost one owns the time so nothing is counted twice.
+        if self.profile.active is None:
+            self.profile.active = self.name
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc):
+        if self.started is not None:
+            elapsed = (time.perf_counter() - self.started) * 1000.0
+            phases = self.profile.phases
+            phases[self.name] = phases.get(self.name, 0.0) + elapsed
+            self.profile.active = None
+        return False
+
+
+class TickProfile:
+    """Phase times and write counts of one slider tick."""
+
+    __slots__ = ("mode", "index", "started", "phases", "active", "curves", "keys")
+
+    def __init__(self, mode, index):
+        self.mode = mode
+        self.index = index
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.active = None
+        self.curves = set()
+        self.keys = 0
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def count_writes(self, curves, keys):
+        self.curves.update(curves)
+        self.keys += keys
+
+    def finish(self, preview=False):
+        total = (time.perf_counter() - self.started) * 1000.0
+        phases = {name: self.phases.get(name, 0.0) for name in PHASES if name != "compute"}
+        phases["compute"] = max(0.0, total - sum(phases.values()))
+        record = {
+            "tick": self.index,
+            "ms": total,
+            "phases": phases,
+            "curves": len(self.curves),
+            "keys": self.keys,
+            "preview": bool(preview),
+        }
+        _ticks.setdefault(self.mode, deque(maxlen=WINDOW)).append(record)
+        return record
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summary():
+    """``{mode: {...}}`` with p50/p95 tick ms over each mode's rolling window."""
+    result = {}
+    for mode, records in _ticks.items():
+        if not records:
+            continue
+        ordered = sorted(record["ms"] for record in records)
+        result[mode] = {
+            "ticks": len(records),
+            "p50_ms": _percentile(ordered, 0.5),
+            "p95_ms": _percentile(ordered, 0.95),
+            "max_ms": ordered[-1],
+            "curves": max(record["curves"] for record in records),
+            "keys": max(record["keys"] for record in records),
+            "phases_p50_ms": {
+                name: _percentile(sorted(record["phases"][name] for record in records), 0.5)
+                for name in PHASES
+            },
+        }
+    return result
+
+
+def summary_lines():
+    lines = []
+    for mode, entry in sorted(summary().items()):
+        phases = " ".join(
+            "{}={:.1f}".format(name, entry["phases_p50_ms"][name]) for name in PHASES
+        )
+        lines.append(
+            "{}: p50 {:.1f} ms, p95 {:.1f} ms over {} ticks, up to {} keys on {} curves ({})".format(
+                mode,
+                entry["p50_ms"],
+                entry["p95_ms"],
+                entry["ticks"],
+                entry["keys"],
+                entry["curves"],
+                phases,
+            )
+        )
+    return lines
+
+
+def dump_json(path):
+    """Write the summary and every recorded tick to *path*; return the path."""
+    payload = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "window": WINDOW,
+        "summary": summary(),
+        "ticks": {mode: list(records) for mode, records in _ticks.items()},
+    }
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(payload, stream, indent=2, sort_keys=True)
+    return path
@@ -12,6 +12,9 @@ except ImportError:
 from TheKeyMachine.core import runtime
 from TheKeyMachine.data.colors import COLORS
 from TheKeyMachine.tools import common as tool_common
+from TheKeyMachine.tools.sliders.curve_values import CurveValues
+from TheKeyMachine.tools.sliders import profiler
+from TheKeyMachine.tools.sliders.math import NeighborIndex
 from TheKeyMachine.ui.widgets import timeline
 
 
@@ -36,14 +39,27 @@ class SliderTargetContext:
 @dataclass
 class SliderCaches:
     is_cached: bool = False
-    original_keyframes: Dict[str, Dict[float, float]] = field(default_factory=dict)
+    original_keyframes: Dict[str, CurveValues] = field(default_factory=dict)
     generated_positions: Dict[str, List[float]] = field(default_factory=dict)
     initial_noise: Dict[str, List[float]] = field(default_factory=dict)
     frame_data: Dict[Tuple[str, float], Any] = field(default_factory=dict)
     tween_frame_data: Dict[Tuple[str, float], Any] = field(default_factory=dict)
     pose_buffer: Dict[Tuple[str, float], float] = field(default_factory=dict)
+    neighbor_indexes: Dict[Any, NeighborIndex] = field(default_factory=dict)
     auxiliary: Dict[Any, Any] = field(default_factory=dict)
 
+    def neighbor_index(self, owner, all_keys, target_times):
+        """Block-neighbor index for *owner*'s keys, built once per session.
+
+        Targets are resolved once per session, so an index is only rebuilt
+        when its curve gained keys since (virtual keys cached mid-drag).
+        """
+        index = self.neighbor_indexes.get(owner)
+        if index is None or len(index.keys) != len(all_keys) or index.target_count != len(target_times):
+            index = NeighborIndex(all_keys, target_times)
+            self.neighbor_indexes[owner] = index
+        return index
+
     def clear(self, keep_pose=False):
         self.is_cached = False
         self.original_keyframes.clear()
@@ -51,6 +67,7 @@ class SliderCaches:
         self.initial_noise.clear()
         self.frame_data.clear()
         self.tween_frame_data.clear()
+        self.neighbor_indexes.clear()
         self.auxiliary.clear()
         if not keep_pose:
             self.pose_buffer.clear()
@@ -77,9 +94,36 @@ class SliderSession:
         self.committing_preview = False
         self.command_preview = False
         self.anim_change = self._new_anim_change()
+        # Set by curve_writer.write_curve_values after every batched tick.
+        self.last_write_timing = None
+        # Only set between begin_tick() and end_tick() while the profiler is on.
+        self.profile = None
+        self._tick_count = 0
         self._tint_key = "slider_{}_range".format(self.mode)
         self._tint_range = None
 
+    def begin_tick(self):
+        """Start profiling one slider tick if the slider profiler is on."""
+        self.profile = None
+        if profiler.enabled():
+            self.profile = profiler.TickProfile(self.mode, self._tick_count)
+        self._tick_count += 1
+
+    def end_tick(self):
+        profile, self.profile = self.profile, None
+        if profile is not None:
+            profile.finish(preview=self.preview)
+
+    def profile_phase(self, name):
+        """Context manager timing one tick phase; free when not profiling."""
+        if self.profile is None:
+            return profiler.NO_PHASE
+        return self.profile.phase(name)
+
+    def profile_writes(self, curves, keys):
+        if self.profile is not None:
+            self.profile.count_writes(curves, keys)
+
     def begin_preview(self):
         self.preview = True
 
@@ -190,6 +234,10 @@ class SliderSession:
 
     def snapshot_pose_buffer(self, affected_map):
         """Capture the current pose for modes that need an original-pose target."""
+        with self.profile_phase("cache"):
+            self._snapshot_pose_buffer(affected_map)
+
+    def _snapshot_pose_buffer(self, affected_map):
         self.cache.pose_buffer.clear()
         for attr_full, times in (affected_map or {}).items():
             if not cmds.objExists(attr_full):
@@ -223,5 +271,7 @@ class SliderSession:
             except Exception:
                 pass
         self.command_preview = False
+        self.profile = None
+        self._tick_count = 0
         self.targets.clear()
         self.cache.clear()
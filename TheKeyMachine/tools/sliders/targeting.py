@@ -94,7 +94,8 @@ def _show_resolved_range(session):
 
 def curves_for_session(session):
     if not session.targets.resolved:
-        curves, times, time_range, has_graph_keys = resolve_curve_targets(session)
+        with session.profile_phase("targets"):
+            curves, times, time_range, has_graph_keys = resolve_curve_targets(session)
         session.targets.curves = curves
         session.targets.affected_map = times
         session.targets.time_range = time_range
@@ -106,7 +107,8 @@ def curves_for_session(session):
 
 def keyframes_for_session(session):
     if not session.targets.resolved:
-        affected, time_range = resolve_keyframe_targets(session)
+        with session.profile_phase("targets"):
+            affected, time_range = resolve_keyframe_targets(session)
         session.targets.affected_map = affected
         session.targets.time_range = time_range
         session.targets.resolved = True
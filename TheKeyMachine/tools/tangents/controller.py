@@ -62,10 +62,10 @@ def _collect_targets(key_scope="selection"):
     if key_scope != "all" and time_context and time_context.mode == "graph_editor_keys":
         selected = target_info.selected_keys or []
     if selected:
-        by_curve = {}
-        for curve, frame in selected:
-            by_curve.setdefault(curve, set()).add(float(frame))
-        targets = {curve: sorted(frames) for curve, frames in by_curve.items()}
+        targets = {
+            curve: sorted(set(frames))
+            for curve, frames in target_info.selected_keys_by_curve.items()
+        }
     else:
         targets = {
             curve: _normalize_frames(target_info.key_times(curve))
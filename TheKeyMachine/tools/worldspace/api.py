@@ -1,3 +1,5 @@
+from array import array
+
 from maya import cmds
 
 from TheKeyMachine.maya import animation
@@ -11,6 +13,9 @@ import TheKeyMachine.ui.widgets.util as wutil
 
 
 WORLDSPACE_CLIPBOARD = "worldspace"
+# Frames sampled per main-thread hop while copying.
+WORLDSPACE_SAMPLE_CHUNK = 48
+MATRIX_SIZE = 16
 
 
 def _world_matrix(node, frame=None):
@@ -24,7 +29,29 @@ def _apply_worldspace_values(node, values):
     return True
 
 
-def _copy_worldspace_frames(selected_objects, frames, timerange, tool_id, label):
+def _world_matrix_block(node, frames):
+    """Per-frame fallback with the same ``(frames, values)`` result as a sampler."""
+    sampled = []
+    values = array("d")
+    for frame in frames:
+        matrix = _world_matrix(node, frame)
+        if matrix is None:
+            continue
+        sampled.append(frame)
+        values.extend(matrix)
+    return sampled, values
+
+
+def _copy_worldspace_frames(
+    selected_objects,
+    frames,
+    timerange,
+    tool_id,
+    label,
+    chunk_size=WORLDSPACE_SAMPLE_CHUNK,
+):
+    # Per object: {"frames": [frame, ...], "matrices": array('d')}, holding
+    # 16 world matrix values per copied frame, in frame order.
     animation_data = {}
     frames = tuple(dict.fromkeys(frames or ()))
     if not frames:
@@ -41,19 +68,39 @@ def _copy_worldspace_frames(selected_objects, frames, timerange, tool_id, label)
         undo=False,
         suspend_refresh=True,
     ) as operation:
-        def _collect_frame(frame):
+        samplers = {}
+
+        def _resolve_samplers():
+            for source_obj in selected_objects:
+                samplers[source_obj] = maya_api.world_matrix_sampler(source_obj)
+
+        def _collect_chunk(chunk):
             for source_obj in selected_objects:
-                worldspace_values = _world_matrix(source_obj, frame)
-                if worldspace_values is None:
+                sampler = samplers.get(source_obj)
+                if sampler is None:
+                    sampled, values = _world_matrix_block(source_obj, chunk)
+                else:
+                    sampled, values = sampler(chunk)
+                if not sampled:
                     continue
-                animation_data.setdefault(source_obj, {})[int(frame)] = worldspace_values
+                block = animation_data.setdefault(
+                    source_obj,
+                    {"frames": [], "matrices": array("d")},
+                )
+                block["frames"].extend(int(frame) for frame in sampled)
+                block["matrices"].extend(values)
 
         def _collect_all():
-            for frame in frames:
+            # worldMatrix plugs are resolved once, then each hop to the
+            # main thread evaluates a whole chunk of frames.
+            operation.run_on_main(_resolve_samplers)
+            size = max(1, int(chunk_size or 1))
+            for start in range(0, len(frames), size):
                 if operation.cancelled:
                     break
-                operation.run_on_main(_collect_frame, frame)
-                operation.step()
+                chunk = frames[start:start + size]
+                operation.run_on_main(_collect_chunk, chunk)
+                operation.step(len(chunk))
 
         # Off the main thread so a Cancel press actually gets a chance to
         # register while this samples potentially many frames' worth of
@@ -170,9 +217,7 @@ def paste_worldspace_single_frame(*args):
         copied_frames = [
             frame
             for obj_name in ordered_sources
-            for frame_key in (animation_data.get(obj_name) or {})
-            for frame in (_worldspace_frame_number(frame_key),)
-            if frame is not None
+            for frame, _values in _worldspace_frame_values(animation_data.get(obj_name))
         ]
         frame_range = (
             (min(copied_frames), max(copied_frames))
@@ -211,11 +256,8 @@ def paste_worldspace_single_frame(*args):
         operation.set_total(len(target_objects))
 
         def _first_frame_values(obj_name):
-            obj_data = animation_data.get(obj_name) or {}
-            if not isinstance(obj_data, dict) or not obj_data:
-                return None
-            first_frame = next(iter(obj_data))
-            return obj_data[first_frame]
+            frame_values = _worldspace_frame_values(animation_data.get(obj_name))
+            return frame_values[0][1] if frame_values else None
 
         def _paste_to_target(obj, values):
             if cmds.objExists(obj):
@@ -266,15 +308,33 @@ def _worldspace_frame_number(frame_key):
         return None
 
 
-def _worldspace_frame_value_map(obj_data):
-    values_by_frame = {}
+def _worldspace_frame_values(obj_data):
+    """``(frame, values)`` pairs of one copied object, in copy order.
+
+    Reads the flat frame/matrix blocks copies store now as well as the
+    ``{frame: values}`` dicts older clipboard files hold.
+    """
     if not isinstance(obj_data, dict):
-        return values_by_frame
+        return []
+    if "matrices" in obj_data:
+        matrices = obj_data.get("matrices") or ()
+        pairs = []
+        for position, frame_key in enumerate(obj_data.get("frames") or ()):
+            frame = _worldspace_frame_number(frame_key)
+            values = list(matrices[position * MATRIX_SIZE:(position + 1) * MATRIX_SIZE])
+            if frame is not None and len(values) == MATRIX_SIZE:
+                pairs.append((frame, values))
+        return pairs
+    pairs = []
     for frame_key, values in obj_data.items():
         frame = _worldspace_frame_number(frame_key)
         if frame is not None:
-            values_by_frame[frame] = values
-    return values_by_frame
+            pairs.append((frame, values))
+    return pairs
+
+
+def _worldspace_frame_value_map(obj_data):
+    return dict(_worldspace_frame_values(obj_data))
 
 
 def worldspace_paste_animation(*args):
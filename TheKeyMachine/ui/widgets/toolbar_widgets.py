@@ -7,6 +7,7 @@ build the same controls from the same definitions.
 
 import importlib
 import random
+import time
 import warnings
 
 from TheKeyMachine.core import settings  # type: ignore
@@ -14,15 +15,7 @@ from TheKeyMachine.maya import shelf  # type: ignore
 from TheKeyMachine.data import icons
 from TheKeyMachine.maya import selection  # type: ignore
 from TheKeyMachine.core import runtime  # type: ignore
-import TheKeyMachine.tools.animation_layers.api as animationLayersApi  # type: ignore
-import TheKeyMachine.tools.animation_offset.api as animationOffsetApi  # type: ignore
-import TheKeyMachine.tools.attribute_switcher.api as attributeSwitcherApi  # type: ignore
-import TheKeyMachine.tools.depth_mover.api as depthMoverApi  # type: ignore
-import TheKeyMachine.tools.gimbal_fixer.api as gimbalFixerApi  # type: ignore
-import TheKeyMachine.tools.micro_move.api as microMoveApi  # type: ignore
 from TheKeyMachine.tools.custom_tools import service as connect_entries
-import TheKeyMachine.tools.orbit.api as orbitApi  # type: ignore
-import TheKeyMachine.tools.selection_sets.api as selectionSetsApi  # type: ignore
 from TheKeyMachine.tools import common as toolCommon  # type: ignore
 from TheKeyMachine.ui.widgets import sliderWidget as sw  # type: ignore
 from TheKeyMachine.ui.widgets import customWidgets as cw  # type: ignore
@@ -137,11 +130,19 @@ def add_tool_button(section, item_data, *, overrides=None):
     if overrides:
         data.update(overrides)
     tool_id = item_key(data)
+    # Tool apis are imported here, not at module level, so building a toolbar
+    # from the registry manifest doesn't import every tool package up front.
     if tool_id == "animation_offset":
+        from TheKeyMachine.tools.animation_offset import api as animationOffsetApi
+
         data["changed_signal"] = animationOffsetApi.get_controller().stateChanged
     elif tool_id == "depth_mover":
+        from TheKeyMachine.tools.depth_mover import api as depthMoverApi
+
         data["changed_signal"] = depthMoverApi.get_controller().stateChanged
     elif tool_id == "micro_move":
+        from TheKeyMachine.tools.micro_move import api as microMoveApi
+
         data["changed_signal"] = microMoveApi.get_controller().stateChanged
     btn = cw.create_tool_button_from_data(data)
     if tool_id == "background_runners":
@@ -605,9 +606,13 @@ def add_main_tool_item(section, item_data, owner):
     if key == "selector":
         return add_selector_button(section, item_data)
     if key == "orbit":
+        from TheKeyMachine.tools.orbit import api as orbitApi
+
         owner.orbit_button_widget = add_bound_tool_button(section, item_data, orbitApi.bind_orbit_toolbar_button)
         return owner.orbit_button_widget
     if key == "selection_sets":
+        from TheKeyMachine.tools.selection_sets import api as selectionSetsApi
+
         return add_bound_tool_button(
             section,
             item_data,
@@ -617,10 +622,16 @@ def add_main_tool_item(section, item_data, owner):
             ),
         )
     if key == "animation_layers":
+        from TheKeyMachine.tools.animation_layers import api as animationLayersApi
+
         return add_bound_tool_button(section, item_data, animationLayersApi.bind_animation_layers_toolbar_button)
     if key == "attribute_switcher":
+        from TheKeyMachine.tools.attribute_switcher import api as attributeSwitcherApi
+
         return add_bound_tool_button(section, item_data, attributeSwitcherApi.bind_attribute_switcher_toolbar_button)
     if key == "gimbal":
+        from TheKeyMachine.tools.gimbal_fixer import api as gimbalFixerApi
+
         return add_bound_tool_button(section, item_data, gimbalFixerApi.bind_gimbal_fixer_toolbar_button)
     return add_tool_button(section, item_data)
 
@@ -674,6 +685,7 @@ def _populate_toolbar_from_layout(
     """
     from TheKeyMachine.tools import registry
 
+    started = time.perf_counter()
     sections = registry.get_toolbar_sections(layout_id, resolve_items=False)
     for section_def in sections:
         sec_id = section_def["id"]
@@ -723,6 +735,8 @@ def _populate_toolbar_from_layout(
             add_group_items_fn=add_group_items_fn,
         )
 
+    registry.record_toolbar_build(layout_id, (time.perf_counter() - started) * 1000.0)
+
     for section in getattr(animations_widget, "_tkm_sections", ()) if animations_widget is not None else ():
         section.enable_entry_animations()
 
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Check and time the compact clipboard slot format against indented JSON.
+
+Runs with any Python 3 interpreter (no Maya needed): the clipboard module
+is loaded straight from its file and its user folder is pointed at a
+temporary directory. Checks, over random copy payloads:
+
+* a compact slot file decodes to exactly what a JSON round trip gives;
+* ``save`` serves the payload from memory at once and writes the file
+  behind, so a fresh session (empty memory) loads the same data;
+* an older JSON slot file still loads when there is no compact file, and
+  is removed once a compact one is written;
+* ``export_to`` still writes JSON that ``import_from`` reads back.
+
+Then times saving one large animation copy both ways.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def load_clipboard(root):
+    spec = importlib.util.spec_from_file_location(
+        "tkm_clipboard", REPO_ROOT / "TheKeyMachine" / "tools" / "clipboard.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module._root = lambda: root
+    return module
+
+
+def animation_payload(rng, controls, keys):
+    data = {}
+    for control in range(controls):
+        channels = {}
+        for channel in ("tx", "ty", "tz", "rx", "ry", "rz", "visibility"):
+            count = rng.randrange(0, keys + 1)
+            frames = [float(frame) for frame in sorted(rng.sample(range(keys * 2), count))]
+            channels[channel] = {
+                "keyframes": frames,
+                "values": [rng.uniform(-100.0, 100.0) for _frame in frames],
+                "tangents": {
+                    "inTangentType": ["auto"] * count,
+                    "inAngle": [rng.uniform(-90.0, 90.0) for _frame in frames],
+                    "lock": [True] * count,
+                },
+            }
+        data["ctrl_{}".format(control)] = channels
+    return {"meta": {"type": "animation", "range": [0, keys * 2], "tiny": [1, 2.5]}, "controls": data}
+
+
+def worldspace_payload(rng, objects, frames):
+    return {
+        "meta": {"ordered_objects": ["obj{}".format(index) for index in range(objects)]},
+        "data": {
+            "obj{}".format(index): {
+                "frames": list(range(frames)),
+                "matrices": array("d", (rng.uniform(-10.0, 10.0) for _value in range(frames * 16))),
+            }
+            for index in range(objects)
+        },
+    }
+
+
+def json_round_trip(clipboard, data):
+    return json.loads(json.dumps(data, default=clipboard._json_default))
+
+
+def check(clipboard, root, trials, seed=1):
+    rng = random.Random(seed)
+    for trial in range(trials):
+        slot = rng.choice(("animation", "pose", "worldspace"))
+        if slot == "worldspace":
+            data = worldspace_payload(rng, rng.randrange(1, 4), rng.randrange(1, 30))
+        else:
+            data = animation_payload(rng, rng.randrange(1, 4), rng.randrange(0, 20))
+        data["meta"]["mixed"] = [1, 2.0, "x", None, True] * 3
+        data["meta"]["ints"] = list(range(-5, rng.randrange(0, 20)))
+        data["meta"]["huge"] = [2 ** 70] * 10
+        expected = json_round_trip(clipboard, data)
+        if clipboard.decode_compact(clipboard.encode_compact(data)) != expected:
+            raise SystemExit("Compact encoding differs from a JSON round trip")
+
+        legacy_path = clipboard._resolve(slot)
+        if trial % 5 == 0:
+            os.makedirs(os.path.dirname(legacy_path), exist_ok=True)
+            with open(legacy_path, "w", encoding="utf-8") as fh:
+                json.dump(expected, fh)
+            compact_path = clipboard._resolve_compact(slot)
+            if os.path.exists(compact_path):
+                os.remove(compact_path)
+            clipboard._MEMORY.clear()
+            if clipboard.load(slot) != expected:
+                raise SystemExit("An older JSON slot file no longer loads")
+
+        clipboard.save(slot, data)
+        if clipboard.load(slot) is not data:
+            raise SystemExit("A saved slot isn't served from memory")
+        clipboard.flush()
+        clipboard._MEMORY.clear()
+        if clipboard.load(slot) != expected:
+            raise SystemExit("The slot file written behind differs from the saved data")
+        if os.path.exists(legacy_path):
+            raise SystemExit("The older JSON slot file was left next to the compact one")
+
+        target = os.path.join(root, "export.json")
+        clipboard.export_to(slot, target)
+        with open(target, "r", encoding="utf-8") as fh:
+            if json.load(fh) != expected:
+                raise SystemExit("export_to no longer writes the slot as JSON")
+        if clipboard.import_from(slot, target) != expected:
+            raise SystemExit("import_from no longer reads exported JSON")
+        clipboard.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--controls", type=int, default=150)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--trials", type=int, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        clipboard = load_clipboard(root)
+        check(clipboard, root, args.trials)
+
+        data = animation_payload(random.Random(0), args.controls, args.keys)
+        json_path = os.path.join(root, "indented.json")
+        started = time.perf_counter()
+        with open(json_path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2, ensure_ascii=False)
+            fh.write("\n")
+        json_ms = (time.perf_counter() - started) * 1000.0
+
+        started = time.perf_counter()
+        clipboard.save("animation", data)
+        save_ms = (time.perf_counter() - started) * 1000.0
+        clipboard.flush()
+        compact_path = clipboard._resolve_compact("animation")
+
+        clipboard._MEMORY.clear()
+        started = time.perf_counter()
+        clipboard.load("animation")
+        compact_load_ms = (time.perf_counter() - started) * 1000.0
+        started = time.perf_counter()
+        with open(json_path, "r", encoding="utf-8") as fh:
+            json.load(fh)
+        json_load_ms = (time.perf_counter() - started) * 1000.0
+
+        print("{} controls x 7 channels, up to {} keys (compact matches JSON round trips)".format(args.controls, args.keys))
+        print("{:>16}: save {:8.1f} ms  load {:8.1f} ms  {:>10} bytes".format(
+            "indented JSON", json_ms, json_load_ms, os.path.getsize(json_path)))
+        print("{:>16}: save {:8.1f} ms  load {:8.1f} ms  {:>10} bytes (file written behind)".format(
+            "compact", save_ms, compact_load_ms, os.path.getsize(compact_path)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Time Hermite span fitting: one span at a time vs ``hermite.fit_spans``.
+
+Runs with any Python 3 interpreter (no Maya needed): the hermite module is
+loaded straight from its file so the TheKeyMachine package, which imports
+Maya, is never initialized. Before timing, random curves are fitted both
+ways and checked against the per-span least-squares loop that
+``capture_curve_shape`` used to run, for both the NumPy and the pure-Python
+path when NumPy is importable.
+"""
+
+import argparse
+import bisect
+import importlib.util
+import math
+import random
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ANIMATION_ROOT = REPO_ROOT / "TheKeyMachine" / "maya" / "animation"
+
+
+def load_module(name, filename):
+    spec = importlib.util.spec_from_file_location(name, ANIMATION_ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def reference_fit(start, end, start_value, end_value, samples):
+    """The per-span loop ``curves._fit_hermite_samples`` ran before."""
+    duration = float(end) - float(start)
+    if duration <= 0:
+        return 0.0, 0.0
+    aa = ab = bb = ar = br = 0.0
+    for frame, value in samples:
+        u = (frame - float(start)) / duration
+        u2 = u * u
+        u3 = u2 * u
+        h00 = 2.0 * u3 - 3.0 * u2 + 1.0
+        h01 = -2.0 * u3 + 3.0 * u2
+        a = duration * (u3 - 2.0 * u2 + u)
+        b = duration * (u3 - u2)
+        residual = value - (h00 * start_value + h01 * end_value)
+        aa += a * a
+        ab += a * b
+        bb += b * b
+        ar += a * residual
+        br += b * residual
+    determinant = aa * bb - ab * ab
+    if abs(determinant) <= 1e-12:
+        secant = (end_value - start_value) / duration
+        return secant, secant
+    return (ar * bb - br * ab) / determinant, (br * aa - ar * ab) / determinant
+
+
+def synthetic_curve(rng, knot_count):
+    knots = sorted(float(frame) for frame in rng.sample(range(knot_count * 4), knot_count))
+
+    def value_at(frame):
+        return math.sin(frame * 0.13) * 5.0 + math.cos(frame * 0.041) * 2.0
+
+    probes = set(float(frame) for frame in range(int(knots[-1]) + 1))
+    for start, end in zip(knots, knots[1:]):
+        duration = end - start
+        count = max(9, int(math.ceil(duration * 4.0)) + 1)
+        probes.update(start + duration * index / float(count - 1) for index in range(1, count - 1))
+    frames = sorted(probes)
+    return knots, [value_at(frame) for frame in knots], frames, [value_at(frame) for frame in frames]
+
+
+def per_span(knots, knot_values, frames, values):
+    out_slopes, in_slopes = [], []
+    for index, (start, end) in enumerate(zip(knots, knots[1:])):
+        first = bisect.bisect_right(frames, start)
+        stop = bisect.bisect_left(frames, end)
+        samples = list(zip(frames[first:stop], values[first:stop]))
+        out_slope, in_slope = reference_fit(start, end, knot_values[index], knot_values[index + 1], samples)
+        out_slopes.append(out_slope)
+        in_slopes.append(in_slope)
+    return out_slopes, in_slopes
+
+
+def close(left, right):
+    return len(left) == len(right) and all(
+        abs(a - b) <= 1e-7 * max(1.0, abs(a), abs(b)) for a, b in zip(left, right)
+    )
+
+
+def check_equivalence(hermite, trials, seed=1):
+    rng = random.Random(seed)
+    for _trial in range(trials):
+        curve = synthetic_curve(rng, rng.randrange(2, 40))
+        expected = per_span(*curve)
+        result = hermite.fit_spans(*curve)
+        if not (close(result[0], expected[0]) and close(result[1], expected[1])):
+            raise SystemExit("fit_spans differs from the per-span fit (numpy={})".format(hermite.numpy is not None))
+        knots, knot_values, frames, values = curve
+        inside = [(frame, value) for frame, value in zip(frames, values) if knots[0] < frame < knots[1]]
+        single = hermite.fit_samples(
+            knots[0], knots[1], knot_values[0], knot_values[1],
+            [frame for frame, _value in inside], [value for _frame, value in inside],
+        )
+        if not close(single, reference_fit(knots[0], knots[1], knot_values[0], knot_values[1], inside)):
+            raise SystemExit("fit_samples differs from the per-span fit")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--curves", type=int, default=200)
+    parser.add_argument("--knots", type=int, default=250)
+    parser.add_argument("--trials", type=int, default=300)
+    args = parser.parse_args()
+
+    hermite = load_module("tkm_hermite", "hermite.py")
+    numpy = hermite.numpy
+    check_equivalence(hermite, args.trials)
+    if numpy is not None:
+        hermite.numpy = None
+        check_equivalence(hermite, args.trials)
+        hermite.numpy = numpy
+
+    rng = random.Random(0)
+    curves = [synthetic_curve(rng, args.knots) for _index in range(args.curves)]
+    samples = sum(len(curve[2]) for curve in curves)
+    print("{} curves, {} samples, numpy={}".format(len(curves), samples, numpy is not None))
+
+    started = time.perf_counter()
+    for curve in curves:
+        per_span(*curve)
+    print("{:>18}: {:8.1f} ms".format("per-span", (time.perf_counter() - started) * 1000.0))
+
+    variants = [("fit_spans python", None)]
+    if numpy is not None:
+        variants.append(("fit_spans numpy", numpy))
+    for label, module in variants:
+        hermite.numpy = module
+        started = time.perf_counter()
+        for curve in curves:
+            hermite.fit_spans(*curve)
+        print("{:>18}: {:8.1f} ms".format(label, (time.perf_counter() - started) * 1000.0))
+    hermite.numpy = numpy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Check and time bulk key reads against the per-key queries they replace.
+
+Runs with any Python 3 interpreter (no Maya needed). The keys module is
+imported without the animation package ``__init__`` (which needs Maya) and
+reads a fake MFnAnimCurve. Checks, over random curves and selections:
+
+* ``keys.read_keys`` with selected times matches one
+  ``keyframe -time t:t -valueChange`` query per time, skipping times with
+  no key and keeping the requested order;
+* with a time range it matches ``keyframe -time start:end``;
+* ``keys.group_by_curve`` gives every curve the times the old per-curve
+  scan of the whole selection did.
+
+Then times targeting a large Graph Editor selection both ways.
+"""
+
+import argparse
+import random
+import sys
+import time
+import types
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ANIMATION_ROOT = REPO_ROOT / "TheKeyMachine" / "maya" / "animation"
+TOLERANCE = 0.000001
+
+
+class FakeTime:
+    def __init__(self, value):
+        self.value = value
+
+    def asUnits(self, _unit):
+        return self.value
+
+
+class FakeCurve:
+    """The MFnAnimCurve reads ``read_keys`` makes, storing radians."""
+
+    def __init__(self, times, values):
+        self.times = times
+        self.values = values
+        self.calls = 0
+
+    @property
+    def numKeys(self):
+        return len(self.times)
+
+    def input(self, index):
+        self.calls += 1
+        return FakeTime(self.times[index])
+
+    def value(self, index):
+        self.calls += 1
+        return self.values[index]
+
+
+def query_value(curve, key_time, convert):
+    """One ``keyframe -query -time t:t -valueChange``."""
+    for frame, value in zip(curve.times, curve.values):
+        if abs(frame - key_time) <= TOLERANCE:
+            return [convert(value)]
+    return []
+
+
+def per_key(curve, key_times, convert):
+    data = []
+    for key_time in key_times:
+        values = query_value(curve, key_time, convert)
+        if values:
+            data.append((float(key_time), float(values[0])))
+    return data
+
+
+def load_keys():
+    sys.path.insert(0, str(REPO_ROOT))
+    # The real package __init__ imports the whole Maya-bound workflow API.
+    package = types.ModuleType("TheKeyMachine.maya.animation")
+    package.__path__ = [str(ANIMATION_ROOT)]
+    sys.modules["TheKeyMachine.maya.animation"] = package
+    from TheKeyMachine.maya.animation import keys
+
+    return keys
+
+
+def random_curve(rng, key_count):
+    times = sorted(set(float(rng.randrange(-50, key_count * 3)) for _index in range(key_count)))
+    times += [times[-1] + 0.5] if times else []
+    return FakeCurve(times, [rng.uniform(-3.0, 3.0) for _time in times])
+
+
+def to_degrees(value):
+    return value * 57.29577951308232
+
+
+def check(keys, trials, seed=1):
+    rng = random.Random(seed)
+    for _trial in range(trials):
+        curve = random_curve(rng, rng.randrange(1, 60))
+        requested = rng.sample(curve.times, rng.randrange(0, len(curve.times) + 1))
+        requested += [rng.uniform(-60.0, 200.0) for _index in range(rng.randrange(0, 4))]
+        rng.shuffle(requested)
+        times, values = keys.read_keys(curve, None, to_degrees, key_times=requested)
+        if list(zip(times, values)) != per_key(curve, requested, to_degrees):
+            raise SystemExit("read_keys differs from per-key value queries")
+
+        start = rng.uniform(-60.0, 200.0)
+        end = start + rng.uniform(0.0, 80.0)
+        times, values = keys.read_keys(curve, None, to_degrees, time_range=(start, end))
+        expected = [
+            (frame, to_degrees(value))
+            for frame, value in zip(curve.times, curve.values)
+            if start - TOLERANCE <= frame <= end + TOLERANCE
+        ]
+        if list(zip(times, values)) != expected:
+            raise SystemExit("read_keys differs from a time-range query")
+
+        selection = [
+            ("curve{}".format(rng.randrange(5)), float(rng.randrange(100)))
+            for _index in range(rng.randrange(0, 40))
+        ]
+        grouped = keys.group_by_curve(selection)
+        for name in {curve_name for curve_name, _time in selection}:
+            if grouped[name] != [key_time for curve_name, key_time in selection if curve_name == name]:
+                raise SystemExit("group_by_curve differs from scanning the selection")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--curves", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=500)
+    parser.add_argument("--trials", type=int, default=300)
+    args = parser.parse_args()
+
+    keys = load_keys()
+    check(keys, args.trials)
+
+    rng = random.Random(0)
+    curves = {
+        "curve{}".format(index): FakeCurve(
+            [float(frame) for frame in range(args.keys)],
+            [rng.uniform(-3.0, 3.0) for _frame in range(args.keys)],
+        )
+        for index in range(args.curves)
+    }
+    selection = [(name, frame) for name, curve in curves.items() for frame in curve.times]
+    print("{} curves, {} selected keys (bulk reads match per-key queries)".format(len(curves), len(selection)))
+
+    started = time.perf_counter()
+    scanned = 0
+    for name, curve in curves.items():
+        key_times = [float(key_time) for selected, key_time in selection if selected == name]
+        scanned += len(selection)
+        per_key(curve, key_times[:: max(1, len(key_times) // 20)], to_degrees)
+    elapsed = (time.perf_counter() - started) * 1000.0
+    print("{:>20}: {:8.1f} ms {:>10} pairs scanned (values for 1 in 20 keys)".format("per-curve scan", elapsed, scanned))
+
+    started = time.perf_counter()
+    grouped = keys.group_by_curve(selection)
+    for name, curve in curves.items():
+        keys.read_keys(curve, None, to_degrees, key_times=grouped[name])
+    elapsed = (time.perf_counter() - started) * 1000.0
+    print("{:>20}: {:8.1f} ms {:>10} pairs scanned (values for every key)".format("grouped bulk read", elapsed, len(selection)))
+
+
+if __name__ == "__main__":
+    main()
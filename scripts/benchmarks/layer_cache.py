@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Check and time ``LayerCache.tool_context()`` reuse against a fake layer backend.
+
+Runs with any Python 3 interpreter (no Maya needed). The layers module is
+imported without the animation package ``__init__`` (which needs Maya) and
+its ``cmds`` is pointed at a fake scene of animation layers that counts
+every query; a fake RuntimeManager records the callbacks the cache
+registers so the checks can fire them the way Maya would.
+
+Checks, over random layer states and edits:
+
+* a reused scope always equals one built from a fresh capture;
+* with the generation unchanged, ``tool_context()`` issues no queries;
+* a layer attribute change or a layer-structure event is picked up on
+  the next call, and structure events re-watch the new set of layers;
+* every call hands out its own copy, so annotating one can't leak;
+* without a RuntimeManager every call captures afresh, as before.
+"""
+
+import argparse
+import random
+import sys
+import time
+import types
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ANIMATION_ROOT = REPO_ROOT / "TheKeyMachine" / "maya" / "animation"
+FLAGS = ("selected", "preferred", "lock", "mute", "override", "passthrough")
+
+
+class FakeScene:
+    """Animation layers as ``cmds`` sees them, with a query counter."""
+
+    def __init__(self, rng, layer_count):
+        self.rng = rng
+        self.queries = 0
+        self.root = "BaseAnimation"
+        self.layers = {}
+        self.order = []
+        self.created = 0
+        for _index in range(layer_count):
+            self.add_layer()
+
+    def add_layer(self):
+        self.created += 1
+        name = "layer{}".format(self.created)
+        self.order.append(name)
+        self.layers[name] = {flag: self.rng.random() < 0.3 for flag in FLAGS}
+        self.layers[name]["passthrough"] = True
+        self.layers[name]["parent"] = self.rng.choice([None, self.root] + self.order[:-1])
+        return name
+
+    def remove_layer(self):
+        name = self.order.pop(self.rng.randrange(len(self.order)))
+        del self.layers[name]
+        for data in self.layers.values():
+            if data["parent"] == name:
+                data["parent"] = self.root
+        return name
+
+    # -- cmds --------------------------------------------------------------
+    def animLayer(self, name=None, query=False, root=False, **flags):
+        self.queries += 1
+        if root:
+            return self.root if self.order else None
+        (flag,) = flags
+        if name == self.root:
+            return False
+        return self.layers[name][flag]
+
+    def ls(self, type=None):
+        self.queries += 1
+        return ([self.root] + list(self.order)) if self.order else []
+
+    def getAttr(self, plug):
+        self.queries += 1
+        return 0
+
+    def listConnections(self, node, **_flags):
+        self.queries += 1
+        parent = (self.layers.get(node) or {}).get("parent")
+        return ["{}.childrenLayers[0]".format(parent)] if parent else []
+
+
+class FakeSignal:
+    def __init__(self):
+        self.handlers = []
+
+    def emit(self):
+        for handler in list(self.handlers):
+            handler()
+
+
+class FakeManager:
+    """The RuntimeManager registration calls ``LayerCache`` uses."""
+
+    def __init__(self):
+        self.scene_opened = FakeSignal()
+        self.scene_new = FakeSignal()
+        self.scriptjobs = {}
+        self.attribute_callbacks = {}
+
+    def add_scriptjob(self, event=None, key=None, callback=None, **_kwargs):
+        self.scriptjobs.setdefault(event, []).append(callback)
+
+    def connect_signal(self, signal, handler, key=None, unique=True):
+        signal.handlers.append(handler)
+
+    def add_node_attribute_changed_callbacks(self, nodes, handler, key=None):
+        for node in nodes:
+            self.attribute_callbacks[node] = handler
+
+    def disconnect_callbacks(self, key):
+        if key.endswith(":attributes"):
+            self.attribute_callbacks.clear()
+
+    def fire_event(self, event):
+        for callback in self.scriptjobs.get(event, []):
+            callback()
+
+    def fire_attribute(self, node):
+        handler = self.attribute_callbacks.get(node)
+        if handler is not None:
+            handler(1, None, None, None, node)
+
+
+def load_layers():
+    sys.path.insert(0, str(REPO_ROOT))
+    # The real package __init__ imports the whole Maya-bound workflow API.
+    package = types.ModuleType("TheKeyMachine.maya.animation")
+    package.__path__ = [str(ANIMATION_ROOT)]
+    sys.modules["TheKeyMachine.maya.animation"] = package
+    runtime = types.ModuleType("TheKeyMachine.core.runtime")
+    runtime.manager = None
+    runtime.get_existing_runtime_manager = lambda: runtime.manager
+    import TheKeyMachine.core
+
+    TheKeyMachine.core.runtime = runtime
+    sys.modules["TheKeyMachine.core.runtime"] = runtime
+    from TheKeyMachine.maya.animation import graph, layers
+
+    return layers, graph, runtime
+
+
+def use_scene(layers, graph, scene):
+    layers.cmds = scene
+    graph.cmds = scene
+
+
+def fresh_scope(layers, runtime):
+    """What ``tool_context()`` always returned: a capture with nothing watched."""
+    manager, runtime.manager = runtime.manager, None
+    try:
+        return layers.LayerCache().tool_context()
+    finally:
+        runtime.manager = manager
+
+
+def random_edit(rng, scene, manager):
+    choice = rng.random()
+    if choice < 0.6 and scene.order:
+        name = rng.choice(scene.order)
+        flag = rng.choice(FLAGS[:5])
+        scene.layers[name][flag] = not scene.layers[name][flag]
+        manager.fire_attribute(name)
+    elif choice < 0.8 or not scene.order:
+        scene.add_layer()
+        manager.fire_event("AnimLayerAdded")
+    else:
+        scene.remove_layer()
+        manager.fire_event("AnimLayerRemoved")
+
+
+def check(layers, graph, runtime, trials, seed=1):
+    rng = random.Random(seed)
+    for _trial in range(trials):
+        scene = FakeScene(rng, rng.randrange(0, 8))
+        use_scene(layers, graph, scene)
+        manager = FakeManager()
+        runtime.manager = manager
+        cache = layers.LayerCache()
+        for _step in range(12):
+            scope = cache.tool_context()
+            if scope != fresh_scope(layers, runtime):
+                raise SystemExit("Cached tool context differs from a fresh capture")
+            scope["curve_layers"] = {"curve": "layer"}
+            scope["context"]["layers"].clear()
+            scene.queries = 0
+            again = cache.tool_context()
+            if scene.queries:
+                raise SystemExit("Unchanged generation still queried the layers")
+            if "curve_layers" in again or again != fresh_scope(layers, runtime):
+                raise SystemExit("Annotating one tool context leaked into the next")
+            if set(manager.attribute_callbacks) != set(scene.layers) | ({scene.root} if scene.order else set()):
+                raise SystemExit("Layer attribute callbacks don't cover the current layers")
+            random_edit(rng, scene, manager)
+
+        runtime.manager = None
+        cache.tool_context()
+        scene.queries = 0
+        cache.tool_context()
+        if not scene.queries:
+            raise SystemExit("Tool context reused a scope without a RuntimeManager")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", type=int, default=12)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--trials", type=int, default=200)
+    args = parser.parse_args()
+
+    layers, graph, runtime = load_layers()
+    check(layers, graph, runtime, args.trials)
+
+    scene = FakeScene(random.Random(0), args.layers)
+    use_scene(layers, graph, scene)
+    print("{} layers, {} tool_context() calls (reuse matches fresh captures)".format(args.layers, args.calls))
+    for label, manager in (("capture every call", None), ("generation reuse", FakeManager())):
+        runtime.manager = manager
+        cache = layers.LayerCache()
+        scene.queries = 0
+        started = time.perf_counter()
+        for _index in range(args.calls):
+            cache.tool_context()
+        elapsed = (time.perf_counter() - started) * 1000.0
+        print("{:>18}: {:8.1f} ms {:>8} layer queries".format(label, elapsed, scene.queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Check Animation Recovery curve capture and delta detection on fake curves.
+
+Runs with any Python 3 interpreter (no Maya needed). The recovery
+controller is imported with Maya, Qt and the rest of the TheKeyMachine
+runtime replaced by inert stub modules, and its ``cmds`` pointed at a fake
+scene of anim curves. Checks, over random curves and edits:
+
+* ``_api_curve_keys`` reads a fake MFnAnimCurve into exactly the columns
+  the scene holds, in command units;
+* ``_capture_curve`` takes its keys from the injected ``key_reader``;
+* after a baseline, an incremental checkpoint carries exactly the curves
+  whose stored data changed -- including edits Python's ``hash()`` can't
+  tell apart, such as a key moving from -1 to -2 -- and reports deleted
+  curves as removed.
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+import types
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TANGENT_KEYS = ("itt", "ott", "ia", "oa", "iw", "ow")
+
+
+class _StubType(type):
+    """Any attribute of a stub is another stub class, so Qt base classes and
+    ``QtCore.Signal(str)`` class attributes resolve at import time."""
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return stub(name)
+
+
+def stub(name):
+    return _StubType(name, (), {"__init__": lambda self, *args, **kwargs: None})
+
+
+class StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = stub(name)
+        setattr(self, name, value)
+        return value
+
+
+def load_controller():
+    sys.path.insert(0, str(REPO_ROOT))
+    for name in (
+        "maya", "maya.cmds", "maya.api", "maya.api.OpenMaya", "maya.api.OpenMayaAnim",
+        "TheKeyMachine.maya.maya_api", "TheKeyMachine.maya.runtime",
+        "TheKeyMachine.core.Qt", "TheKeyMachine.core.application", "TheKeyMachine.core.settings",
+        "TheKeyMachine.data.icons", "TheKeyMachine.tools.registry", "TheKeyMachine.tools.common",
+        "TheKeyMachine.ui.widgets.util",
+    ):
+        sys.modules[name] = StubModule(name)
+    # The real package __init__ files import the whole Maya-bound tool.
+    for name, folder in (
+        ("TheKeyMachine.maya.animation", "maya/animation"),
+        ("TheKeyMachine.tools.animation_recovery", "tools/animation_recovery"),
+    ):
+        package = types.ModuleType(name)
+        package.__path__ = [str(REPO_ROOT / "TheKeyMachine" / folder)]
+        sys.modules[name] = package
+    from TheKeyMachine.maya.animation import tangents
+
+    sys.modules["TheKeyMachine.maya.animation"].tangents = tangents
+    from TheKeyMachine.tools.animation_recovery import controller
+
+    controller.maya_api.time_unit = lambda: None
+    controller.maya_api.anim_curve_value_converter = lambda fn: fn.to_command
+    return controller
+
+
+class FakeTime:
+    def __init__(self, value):
+        self.value = value
+
+    def asUnits(self, _unit):
+        return self.value
+
+
+class FakeAngle:
+    def __init__(self, degrees):
+        self.degrees = degrees
+
+    def asDegrees(self):
+        return self.degrees
+
+
+class FakeCurveFn:
+    """The MFnAnimCurve reads ``_api_curve_keys`` makes, storing internal units."""
+
+    SCALE = 2.0
+
+    def __init__(self, data):
+        self.data = data
+        self.numKeys = len(data["positions"])
+        self.isUnitlessInput = False
+        self.isWeighted = data["weighted_tangents"]
+        self.preInfinityType = data["pre_infinity"]
+        self.postInfinityType = data["post_infinity"]
+
+    def to_command(self, value):
+        return value * self.SCALE
+
+    def input(self, index):
+        return FakeTime(self.data["positions"][index])
+
+    def value(self, index):
+        return self.data["values"][index] / self.SCALE
+
+    def getTangentAngleWeight(self, index, is_in_tangent):
+        side = "i" if is_in_tangent else "o"
+        tangents = self.data["tangents"]
+        return FakeAngle(tangents[side + "a"][index]), tangents[side + "w"][index]
+
+
+class FakeScene:
+    """Anim curves as the ``cmds`` queries capture makes see them."""
+
+    def __init__(self, rng, count):
+        self.rng = rng
+        self.curves = {}
+        self.created = 0
+        for _index in range(count):
+            self.add_curve()
+
+    def add_curve(self):
+        self.created += 1
+        count = self.rng.randrange(1, 12)
+        positions = sorted(self.rng.sample(range(-5, 60), count))
+        self.curves["curve{}".format(self.created)] = {
+            "positions": [float(value) for value in positions],
+            "values": [float(self.rng.choice((-2, -1, 0, 1, 2, 3.5))) for _value in positions],
+            "tangents": {
+                "itt": [self.rng.choice(("auto", "linear")) for _value in positions],
+                "ott": [self.rng.choice(("auto", "linear")) for _value in positions],
+                "ia": [float(self.rng.choice((-2, -1, 0, 45))) for _value in positions],
+                "oa": [float(self.rng.choice((-2, -1, 0, 45))) for _value in positions],
+                "iw": [1.0 for _value in positions],
+                "ow": [1.0 for _value in positions],
+            },
+            "weighted_tangents": False,
+            "pre_infinity": 0,
+            "post_infinity": 0,
+        }
+
+    def edit(self, name):
+        """A change restore would have to replay, often a -1 <-> -2 swap."""
+        data = self.curves[name]
+        column = self.rng.choice(("values", "ia", "oa", "infinity", "positions"))
+        index = self.rng.randrange(len(data["positions"]))
+        if column == "infinity":
+            data["post_infinity"] = 1 - data["post_infinity"]
+            return
+        values = data[column] if column in ("values", "positions") else data["tangents"][column]
+        if column == "positions":
+            taken = set(values)
+            if -1.0 in taken and -2.0 not in taken:
+                values[values.index(-1.0)] = -2.0
+            elif -2.0 in taken and -1.0 not in taken:
+                values[values.index(-2.0)] = -1.0
+            else:
+                values[-1] += 1.0
+            values.sort()
+            return
+        values[index] = {-1.0: -2.0, -2.0: -1.0}.get(values[index], -1.0)
+
+    # -- cmds --------------------------------------------------------------
+    def nodeType(self, node):
+        return "animCurveTL"
+
+    def ls(self, *nodes, type=None, uuid=False, **_flags):
+        if type == "animCurve":
+            return list(self.curves)
+        if uuid:
+            return ["uuid-{}".format(node) for node in nodes]
+        return []
+
+    def listConnections(self, *_args, **_kwargs):
+        return []
+
+    def __getattr__(self, name):
+        def _unavailable(*_args, **_kwargs):
+            raise RuntimeError(name)
+
+        return _unavailable
+
+
+def fake_reader(controller, scene):
+    def _read(curve):
+        data = scene.curves[curve]
+        tangent_types = {key: list(data["tangents"][key]) for key in ("itt", "ott")}
+        return controller._api_curve_keys(curve, fn=FakeCurveFn(data), tangent_types=tangent_types)
+
+    return _read
+
+
+def service(controller, reader):
+    instance = controller.AnimationRecoveryService.__new__(controller.AnimationRecoveryService)
+    instance.scene_id = "scene"
+    instance.curve_key_reader = reader
+    instance._curve_cache = {}
+    instance._curve_hashes = {}
+    return instance
+
+
+def baseline(controller, instance, scene):
+    for name in scene.curves:
+        curve_data = controller._capture_curve(name, key_reader=instance.curve_key_reader)
+        instance._curve_cache[name] = controller._curve_marker(curve_data)
+        instance._curve_hashes[controller._curve_cache_key(curve_data)] = controller._curve_content_hash(curve_data)
+
+
+def check(controller, trials, seed=1):
+    if hash((1.0, (0.0, -1.0, 3.5))) == hash((1.0, (0.0, -2.0, 3.5))):
+        data = {"name": "c", "positions": [1.0], "values": [0.0, -1.0, 3.5]}
+        edited = dict(data, values=[0.0, -2.0, 3.5])
+        if controller._curve_content_hash(data) == controller._curve_content_hash(edited):
+            raise SystemExit("The content hash collides on a -1 -> -2 edit")
+
+    rng = random.Random(seed)
+    for _trial in range(trials):
+        scene = FakeScene(rng, rng.randrange(1, 12))
+        controller.cmds = scene
+        reader = fake_reader(controller, scene)
+        for name, data in scene.curves.items():
+            keys = reader(name)
+            for key in ("positions", "values", "weighted_tangents", "pre_infinity", "post_infinity"):
+                if keys[key] != data[key]:
+                    raise SystemExit("_api_curve_keys misread {}".format(key))
+            if {key: keys["tangents"][key] for key in TANGENT_KEYS} != data["tangents"]:
+                raise SystemExit("_api_curve_keys misread the tangents")
+            if controller._capture_curve(name, key_reader=reader)["values"] != data["values"]:
+                raise SystemExit("_capture_curve ignored its key_reader")
+
+        instance = service(controller, reader)
+        baseline(controller, instance, scene)
+        for _step in range(6):
+            before = copy.deepcopy(scene.curves)
+            for name in rng.sample(list(scene.curves), rng.randrange(0, len(scene.curves) + 1)):
+                scene.edit(name)
+            removed = set()
+            if len(scene.curves) > 1 and rng.random() < 0.3:
+                removed.add(rng.choice(list(scene.curves)))
+                del scene.curves[next(iter(removed))]
+            if rng.random() < 0.3:
+                scene.add_curve()
+            expected = {name for name, data in scene.curves.items() if before.get(name) != data}
+            payload, _created = instance._incremental_payload(
+                "edit", list(before) + list(scene.curves), [], {}
+            )
+            changed = {curve["name"] for curve in payload["curves"]}
+            if changed != expected:
+                raise SystemExit("Checkpoint delta {} != edited curves {}".format(sorted(changed), sorted(expected)))
+            if {marker["name"] for marker in payload["removed_curves"]} != removed:
+                raise SystemExit("Checkpoint delta missed a removed curve")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--curves", type=int, default=2000)
+    parser.add_argument("--trials", type=int, default=200)
+    args = parser.parse_args()
+
+    controller = load_controller()
+    check(controller, args.trials)
+
+    scene = FakeScene(random.Random(0), args.curves)
+    controller.cmds = scene
+    instance = service(controller, fake_reader(controller, scene))
+    baseline(controller, instance, scene)
+    started = time.perf_counter()
+    payload, _created = instance._incremental_payload("edit", list(scene.curves), [], {})
+    elapsed = (time.perf_counter() - started) * 1000.0
+    print("{} curves re-captured, {} in the delta (checks passed): {:.1f} ms".format(
+        len(scene.curves), len(payload["curves"]), elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Compare Animation Recovery checkpoint formats on a synthetic payload.
+
+Runs with any Python 3 interpreter (no Maya needed): the format module is
+loaded straight from its file so the TheKeyMachine package, which imports
+Maya, is never initialized. Before timing, checks that the packed v8 codec
+round-trips columns that exercise each of its encodings: subframe and huge
+integral times, float32-exact and full-precision values, -0.0, NaN and
+infinities, and string tables past the one- and two-byte index widths.
+"""
+
+import argparse
+import importlib.util
+import math
+import random
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+STORAGE_PATH = REPO_ROOT / "TheKeyMachine" / "tools" / "animation_recovery" / "storage.py"
+
+
+def load_storage():
+    spec = importlib.util.spec_from_file_location("tkm_recovery_storage", STORAGE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_payload(curve_count, key_count, seed=0):
+    rng = random.Random(seed)
+    curves = []
+    for index in range(curve_count):
+        node = "ctrl_{:05d}".format(index // 9)
+        attribute = ("translateX", "translateY", "translateZ", "rotateX", "rotateY",
+                     "rotateZ", "scaleX", "scaleY", "scaleZ")[index % 9]
+        positions = sorted(rng.sample(range(1, key_count * 4), key_count))
+        curves.append({
+            "name": "{}_{}".format(node, attribute),
+            "uuid": "{:08X}-0000-0000-0000-{:012X}".format(index, index),
+            "node_type": "animCurveTA" if attribute.startswith("rotate") else "animCurveTL",
+            "unitless_input": False,
+            "positions": [float(value) for value in positions],
+            "values": [rng.uniform(-100.0, 100.0) for _value in positions],
+            "tangents": {
+                "itt": ["auto"] * key_count,
+                "ott": ["auto"] * key_count,
+                "ia": [rng.uniform(-90.0, 90.0) for _value in positions],
+                "oa": [rng.uniform(-90.0, 90.0) for _value in positions],
+                "iw": [1.0] * key_count,
+                "ow": [1.0] * key_count,
+            },
+            "weighted_tangents": False,
+            "pre_infinity": 0,
+            "post_infinity": 0,
+            "input_connections": [],
+            "output_connections": [{
+                "plug": "{}.{}".format(node, attribute),
+                "node": node,
+                "node_uuid": "{:08X}-1111-0000-0000-000000000000".format(index // 9),
+                "attribute": attribute,
+            }],
+            "layer": None,
+        })
+    return {
+        "meta": {"reason": "animation", "full_snapshot": True, "source_file": "shot.ma"},
+        "curves": curves,
+        "objects": [],
+        "removed_curves": [],
+        "layers": [],
+    }
+
+
+def _same(left, right):
+    """Equal, with NaN equal to NaN and -0.0 told apart from 0.0."""
+    if isinstance(left, float) and isinstance(right, float):
+        if math.isnan(left) or math.isnan(right):
+            return math.isnan(left) and math.isnan(right)
+        return left == right and math.copysign(1.0, left) == math.copysign(1.0, right)
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(_same(left[key], right[key]) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(_same(a, b) for a, b in zip(left, right))
+    return left == right
+
+
+def check(storage, seed=1):
+    rng = random.Random(seed)
+    columns = (
+        [float(value) for value in range(-40, 200)],
+        [value + 0.5 for value in range(100)],
+        [float(2 ** 40), 1.0, -float(2 ** 40)] * 30,
+        [0.25 * value for value in range(-200, 200)],
+        [rng.uniform(-1.0, 1.0) for _value in range(300)],
+        # Past the leading probe, only the full checks see what won't narrow.
+        [float(value) for value in range(100)] + [0.5, 2.0 ** 40 + 1.0, 0.1],
+        [0.25 * value for value in range(100)] + [0.1],
+        [0.0, -0.0, 3.0] * 40,
+        [float("nan"), float("inf"), -float("inf"), 1.0] * 20,
+        [1.0] * 100,
+        [],
+    )
+    # Each payload holds one column's values everywhere: columns are narrowed
+    # over all curves together, so mixing them would hide an encoding.
+    for column in columns:
+        for string_count in (3, 300, 70000):
+            curve = dict(synthetic_payload(1, 1)["curves"][0])
+            curve["positions"] = list(column)
+            curve["values"] = list(reversed(column))
+            curve["tangents"] = {
+                "itt": ["type_{}".format(rng.randrange(string_count)) for _value in column],
+                "ott": ["auto"] * len(column),
+                "ia": list(column),
+                "oa": list(reversed(column)),
+                "iw": list(column),
+                "ow": list(column),
+            }
+            # A keyless curve ahead of it fills the string table, so the
+            # tangent type indices need the wider index widths.
+            filler = dict(curve, name="filler", positions=[], values=[], tangents={})
+            filler["input_connections"] = [
+                {"plug": "node.attr_{}".format(index), "node": "node",
+                 "node_uuid": None, "attribute": "attr_{}".format(index)}
+                for index in range(string_count)
+            ]
+            filler["tangents"] = {key: [] for key in curve["tangents"]}
+            payload = synthetic_payload(0, 0)
+            payload["curves"] = [filler, curve]
+            decoded = storage.decode_recovery(storage.encode_recovery(payload))
+            if not _same(decoded["curves"], payload["curves"]):
+                raise SystemExit("Packed v8 did not round-trip an edge-case column ({} strings)".format(
+                    string_count))
+
+
+def measure(callback, repeat):
+    best = None
+    for _index in range(repeat):
+        start = time.perf_counter()
+        result = callback()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--curves", type=int, default=5000)
+    parser.add_argument("--keys", type=int, default=48, help="Keys per curve")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    storage = load_storage()
+    check(storage)
+    payload = synthetic_payload(args.curves, args.keys)
+    level = storage.COMPRESSION_LEVEL
+    variants = (
+        ("v7 json+zlib9", {"version": storage.LEGACY_SCHEMA_VERSION}),
+        ("v8 columnar raw", {"compression_level": 0}),
+        ("v8 columnar zlib{}".format(level), {"compression_level": level, "packed": False}),
+        ("v8 packed zlib{}".format(level), {"compression_level": level}),
+    )
+    print("{} curves x {} keys".format(args.curves, args.keys))
+    print("{:<22} {:>12} {:>12} {:>12}".format("format", "bytes", "write ms", "read ms"))
+    for label, kwargs in variants:
+        write_time, compiled = measure(lambda: storage.encode_recovery(payload, **kwargs), args.repeat)
+        read_time, decoded = measure(lambda: storage.decode_recovery(compiled), args.repeat)
+        if decoded["curves"] != payload["curves"]:
+            raise SystemExit("{} did not round-trip the payload".format(label))
+        print("{:<22} {:>12,} {:>12.1f} {:>12.1f}".format(
+            label, len(compiled), write_time * 1000.0, read_time * 1000.0
+        ))
+
+
+if __name__ == "__main__":
+    main()
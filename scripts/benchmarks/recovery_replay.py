@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Check and time indexed checkpoint replay against the list replay it replaced.
+
+Runs with any Python 3 interpreter (no Maya needed). The recovery
+controller is loaded with the same stub modules ``recovery_capture.py``
+uses. Replays random synthetic checkpoint chains -- curves matched by uuid,
+by name with and without a uuid, and by shared output targets, removal
+markers, object attribute deltas and full snapshots -- through the
+``_ReplayIndex`` versions of ``_merge_curve``, ``_remove_curve`` and
+``_merge_object`` and through the original list versions, and checks the
+merged curves and objects are the same records in the same order.
+
+Then times replaying one long chain both ways.
+"""
+
+import argparse
+import copy
+import random
+import time
+
+from recovery_capture import load_controller
+
+
+# -- the list replay, as it was before _ReplayIndex -------------------------
+def list_merge_curve(controller, items, item):
+    items[:] = [existing for existing in items if not controller._curve_matches(existing, item)]
+    items.append(item)
+
+
+def list_remove_curve(controller, items, marker):
+    items[:] = [existing for existing in items if not controller._curve_matches(existing, marker)]
+
+
+def list_merge_object(controller, items, item):
+    for existing in items:
+        if not controller._entity_matches(existing, item):
+            continue
+        existing["name"] = item.get("name") or existing.get("name")
+        existing["uuid"] = item.get("uuid") or existing.get("uuid")
+        existing.setdefault("attributes", {}).update(item.get("attributes") or {})
+        return
+    items.append({
+        "name": item.get("name"),
+        "uuid": item.get("uuid"),
+        "attributes": dict(item.get("attributes") or {}),
+    })
+
+
+def list_replay(controller, chain):
+    curves = []
+    objects = []
+    for payload in chain:
+        if payload["meta"]["full_snapshot"]:
+            curves = []
+            objects = []
+        for marker in payload["removed_curves"]:
+            list_remove_curve(controller, curves, marker)
+        for curve in payload["curves"]:
+            list_merge_curve(controller, curves, curve)
+        for object_data in payload["objects"]:
+            list_merge_object(controller, objects, object_data)
+    return curves, objects
+
+
+def indexed_replay(controller, chain):
+    curves = controller._ReplayIndex(track_targets=True)
+    objects = controller._ReplayIndex()
+    for payload in chain:
+        if payload["meta"]["full_snapshot"]:
+            curves = controller._ReplayIndex(track_targets=True)
+            objects = controller._ReplayIndex()
+        for marker in payload["removed_curves"]:
+            controller._remove_curve(curves, marker)
+        for curve in payload["curves"]:
+            controller._merge_curve(curves, curve)
+        for object_data in payload["objects"]:
+            controller._merge_object(objects, object_data)
+    return curves.values(), objects.values()
+
+
+# -- synthetic chains --------------------------------------------------------
+def endpoint(rng, nodes):
+    node = rng.randrange(nodes)
+    attribute = rng.choice(("tx", "ty", "rz", "visibility"))
+    kind = rng.random()
+    if kind < 0.5:
+        return {"node_uuid": "node-uuid-{}".format(node), "node": "ctrl{}".format(node), "attribute": attribute}
+    if kind < 0.8:
+        return {"node": "ctrl{}".format(node), "attribute": attribute}
+    return {"plug": "ctrl{}.{}".format(node, attribute)}
+
+
+def curve_record(rng, pool, nodes):
+    identity = rng.randrange(pool)
+    uuid_roll = rng.random()
+    return {
+        "name": "curve{}".format(identity) if rng.random() < 0.95 else None,
+        "uuid": None if uuid_roll < 0.3 else "curve-uuid-{}".format(
+            identity if uuid_roll < 0.9 else rng.randrange(pool)
+        ),
+        "output_connections": [endpoint(rng, nodes) for _index in range(rng.choice((0, 1, 1, 2)))],
+        "positions": [float(rng.randrange(100))],
+    }
+
+
+def object_record(rng, pool):
+    identity = rng.randrange(pool)
+    return {
+        "name": "ctrl{}".format(identity) if rng.random() < 0.9 else "ctrl{}".format(rng.randrange(pool)),
+        "uuid": None if rng.random() < 0.3 else "node-uuid-{}".format(identity),
+        "attributes": {
+            rng.choice(("tx", "ty", "rz", "visibility")): rng.randrange(10)
+            for _index in range(rng.randrange(0, 3))
+        },
+    }
+
+
+def random_chain(rng, length, pool, per_checkpoint):
+    nodes = max(2, pool // 3)
+    chain = []
+    for index in range(length):
+        full = index == 0 or rng.random() < 0.05
+        chain.append({
+            "meta": {"full_snapshot": full},
+            "removed_curves": [] if full else [
+                curve_record(rng, pool, nodes) for _index in range(rng.randrange(0, 3))
+            ],
+            "curves": [curve_record(rng, pool, nodes) for _index in range(rng.randrange(0, per_checkpoint + 1))],
+            "objects": [object_record(rng, nodes) for _index in range(rng.randrange(0, per_checkpoint // 2 + 1))],
+        })
+    return chain
+
+
+def check(controller, trials, seed=1):
+    rng = random.Random(seed)
+    for _trial in range(trials):
+        chain = random_chain(rng, rng.randrange(1, 30), rng.randrange(2, 40), rng.randrange(1, 25))
+        expected = list_replay(controller, copy.deepcopy(chain))
+        if indexed_replay(controller, copy.deepcopy(chain)) != expected:
+            raise SystemExit("Indexed replay differs from the list replay")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checkpoints", type=int, default=100)
+    parser.add_argument("--curves", type=int, default=2000)
+    parser.add_argument("--trials", type=int, default=500)
+    args = parser.parse_args()
+
+    controller = load_controller()
+    check(controller, args.trials)
+
+    rng = random.Random(0)
+    chain = random_chain(rng, args.checkpoints, args.curves, args.curves // 20)
+    chain[0]["curves"] = [curve_record(rng, args.curves, args.curves // 3) for _index in range(args.curves)]
+    print("{} checkpoints over {} curves (indexed replay matches the list replay)".format(
+        args.checkpoints, args.curves))
+    for label, replay in (("list replay", list_replay), ("indexed replay", indexed_replay)):
+        payload = copy.deepcopy(chain)
+        started = time.perf_counter()
+        curves, objects = replay(controller, payload)
+        elapsed = (time.perf_counter() - started) * 1000.0
+        print("{:>16}: {:10.1f} ms  {} curves, {} objects".format(label, elapsed, len(curves), len(objects)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Check and time building tool definitions from the registry manifest.
+
+Runs with any Python 3 interpreter (no Maya needed). The registry is
+loaded with Qt and the toolbar menus replaced by inert stub modules, and
+``TheKeyMachine.tools`` pointed at a temporary folder of generated tool
+packages (the definition graph check, which wants the real toolbars, is
+skipped). Every package's api logs its import; its definitions hold
+plain and partial callbacks, lambdas, ``_tkm_*`` flags, tuples, tooltips
+with media and separators, and slider modes whose shortcuts are enum
+keys. One package also holds a class, which the manifest can't defer.
+
+Checks:
+
+* a cold discovery imports every package and writes the manifest;
+* the next session decodes definitions equal to the cold ones without
+  importing any deferrable package, and imports the other one eagerly;
+* decoded callables keep their signature and flags, and the first call
+  imports just their own package and returns what the real callable does;
+* touching a package file makes the manifest stale.
+
+Then times a cold discovery against a manifest load.
+"""
+
+import argparse
+import enum
+import inspect
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+IMPORTED = []
+
+
+class Key(enum.IntEnum):
+    Shift = 1
+    Control = 2
+    Alt = 3
+
+
+class StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = type(name, (), {})
+        setattr(self, name, value)
+        return value
+
+
+PACKAGE_INIT = '''
+from functools import partial
+
+from TheKeyMachine.tools.registry import ToolObject
+from TheKeyMachine.data.movies import TooltipMedia
+from TheKeyMachine.ui.sliders.model import SliderMode
+from TheKeyMachine.ui.tooltips import separator
+from registry_manifest import Key
+from TheKeyMachine.tools.{name} import api
+
+TOOLTIP = ["{name} tool", separator, TooltipMedia("{media}")]
+
+
+class ToolObject{index}(ToolObject):
+    ORDER = {order}
+    TOOLS = {{
+        "{name}_run": {{
+            "type": "tool", "label": "{name} run", "icon": "{icon}",
+            "callback": api.run, "tooltip": TOOLTIP,
+        }},
+        "{name}_scoped": {{
+            "type": "tool", "label": "{name} scoped", "icon": "{icon}",
+            "callback": partial(api.run, scope="all"), "get_checked": api.is_checked,
+        }},
+        "{name}_help": {{
+            "type": "tool", "label": "{name} help",
+            "callback": lambda *args: api.run("help"),
+            "menu": api.show_menu,
+        }},
+    }}
+    SECTION = {{
+        "id": "{name}_section", "label": "{name}", "type": "slider", "slider_type": "{name}",
+        "items": [{{"id": "{name}_run", "shortcuts": [{{"id": "{name}_scoped", "keys": [Key.Shift, Key.Alt]}}]}}],
+        "modes": [
+            SliderMode("{name}_blend", "Blend", shortcut=(Key.Control,), tooltip=TOOLTIP),
+            "separator",
+        ],
+        "range": ({order}, 100),
+        {extra}
+    }}
+'''
+
+PACKAGE_API = '''
+from registry_manifest import IMPORTED
+
+IMPORTED.append(__name__)
+
+
+def run(value=None, scope="selection", *, anchor_widget=None):
+    return ("{name}", value, scope)
+
+
+def is_checked():
+    return {index} % 2 == 0
+
+
+def show_menu(menu, source_widget=None):
+    return ("{name}", menu)
+
+
+show_menu._tkm_non_tool_action = True
+'''
+
+
+def write_packages(root, count):
+    media = os.path.join(root, "media.gif")
+    open(media, "w").close()
+    names = []
+    for index in range(count):
+        name = "pkg{:02d}".format(index)
+        folder = os.path.join(root, "tools", name)
+        os.makedirs(folder)
+        # The last package holds a class, which only an import can rebuild.
+        extra = '"widget_class": ValueError,' if index == count - 1 else ""
+        with open(os.path.join(folder, "__init__.py"), "w") as stream:
+            stream.write(PACKAGE_INIT.format(
+                name=name, index=index, order=1000 - index, icon=media, media=media, extra=extra))
+        with open(os.path.join(folder, "api.py"), "w") as stream:
+            stream.write(PACKAGE_API.format(name=name, index=index))
+        names.append(name)
+    return names
+
+
+def load_registry(root):
+    sys.path.insert(0, str(REPO_ROOT))
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    sys.modules["registry_manifest"] = sys.modules[__name__]
+    for name in ("TheKeyMachine.core.Qt", "TheKeyMachine.ui.widgets.toolbar_menus", "TheKeyMachine.data.colors"):
+        sys.modules[name] = StubModule(name)
+    tooltips = types.ModuleType("TheKeyMachine.ui.tooltips")
+    tooltips.separator = object()
+    sys.modules[tooltips.__name__] = tooltips
+    application = types.ModuleType("TheKeyMachine.core.application")
+    application.get_tool_data_path = lambda *parts: os.path.join(root, "data", *parts)
+    sys.modules[application.__name__] = application
+    # Only the generated packages are discovered; the registry itself is the real file.
+    import TheKeyMachine.tools as tools_package
+
+    tools_package.__path__ = [os.path.join(root, "tools"), str(REPO_ROOT / "TheKeyMachine" / "tools")]
+    from TheKeyMachine.tools import registry
+
+    tools_package.__path__ = [os.path.join(root, "tools")]
+    # The graph check wants the real toolbars' sections and workspace pins.
+    registry._validate_definition_graph = lambda tools, sections: None
+    return registry
+
+
+def forget_packages(names):
+    for module_name in list(sys.modules):
+        if any(module_name.startswith("TheKeyMachine.tools.{}".format(name)) for name in names):
+            del sys.modules[module_name]
+    del IMPORTED[:]
+
+
+def new_session(registry, names):
+    forget_packages(names)
+    registry.reset_package_cache()
+    started = time.perf_counter()
+    tools, sections = registry._package_definitions()
+    return tools, sections, (time.perf_counter() - started) * 1000.0
+
+
+def strip_callables(value):
+    if isinstance(value, dict):
+        return {key: strip_callables(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(strip_callables(item) for item in value)
+    if callable(value) and not isinstance(value, type):
+        return "<callable>"
+    return value
+
+
+def signature_shape(callback):
+    return [
+        (parameter.name, parameter.kind, parameter.default is parameter.empty)
+        for parameter in inspect.signature(callback).parameters.values()
+    ]
+
+
+def check(registry, names):
+    cold_tools, cold_sections, _elapsed = new_session(registry, names)
+    if not registry.STARTUP_TIMINGS.get("discovery_ms") or not registry._MANIFEST_WRITTEN:
+        raise SystemExit("The cold session didn't run a full discovery and write the manifest")
+    if sorted(IMPORTED) != sorted("TheKeyMachine.tools.{}.api".format(name) for name in names):
+        raise SystemExit("The cold discovery didn't import every package: {}".format(IMPORTED))
+    registry.record_toolbar_build("main", 12.5)
+
+    tools, sections, _elapsed = new_session(registry, names)
+    eager = names[-1]
+    if "manifest_definitions_ms" not in registry.STARTUP_TIMINGS:
+        raise SystemExit("The warm session didn't build from the manifest")
+    if IMPORTED != ["TheKeyMachine.tools.{}.api".format(eager)]:
+        raise SystemExit("The manifest load imported {}".format(IMPORTED))
+    if registry.STARTUP_TIMINGS.get("eager_packages") != ["TheKeyMachine.tools.{}".format(eager)]:
+        raise SystemExit("The undeferrable package wasn't reported as eager")
+    if registry.manifest_cold_toolbar_ms() != {"main": 12.5}:
+        raise SystemExit("The cold toolbar build wasn't stored in the manifest")
+    if list(tools) != list(cold_tools) or list(sections) != list(cold_sections):
+        raise SystemExit("Manifest definitions are in a different order")
+    if strip_callables(dict(tools)) != strip_callables(dict(cold_tools)):
+        raise SystemExit("Manifest tool definitions differ from the cold ones")
+    if strip_callables(dict(sections)) != strip_callables(dict(cold_sections)):
+        raise SystemExit("Manifest section definitions differ from the cold ones")
+
+    for tool_id, definition in tools.items():
+        for key in ("callback", "get_checked", "menu"):
+            proxy = definition.get(key)
+            if proxy is None:
+                continue
+            real = cold_tools[tool_id][key]
+            # Defaults are placeholders; names, kinds and optionality must match.
+            if signature_shape(proxy) != signature_shape(real):
+                raise SystemExit("{} {} has signature {}".format(tool_id, key, inspect.signature(proxy)))
+            if getattr(proxy, "_tkm_non_tool_action", False) != getattr(real, "_tkm_non_tool_action", False):
+                raise SystemExit("{} {} lost its _tkm_non_tool_action flag".format(tool_id, key))
+
+    name = names[0]
+    del IMPORTED[:]
+    result = tools["{}_scoped".format(name)]["callback"]("x")
+    if result != (name, "x", "all") or IMPORTED != ["TheKeyMachine.tools.{}.api".format(name)]:
+        raise SystemExit("A deferred call returned {} after importing {}".format(result, IMPORTED))
+    if tools["{}_help".format(name)]["callback"]() != (name, "help", "selection"):
+        raise SystemExit("A deferred lambda returned the wrong value")
+    if IMPORTED != ["TheKeyMachine.tools.{}.api".format(name)]:
+        raise SystemExit("A second call in the same package imported it again")
+
+    os.utime(os.path.join(tools_package_folder(registry), names[1], "api.py"))
+    registry.reset_package_cache()
+    if registry._load_manifest():
+        raise SystemExit("Touching a package file didn't make the manifest stale")
+
+
+def tools_package_folder(registry):
+    import TheKeyMachine.tools as tools_package
+
+    return tools_package.__path__[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--packages", type=int, default=40)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="tkm_registry_manifest_")
+    try:
+        names = write_packages(root, max(3, args.packages))
+        registry = load_registry(root)
+        check(registry, names)
+
+        _tools, _sections, cold_ms = new_session(registry, names)
+        _tools, _sections, manifest_ms = new_session(registry, names)
+        print("{} generated tool packages (manifest definitions match a cold discovery)".format(len(names)))
+        print("{:>16}: {:8.1f} ms".format("cold discovery", cold_ms))
+        print("{:>16}: {:8.1f} ms  (+{:.1f} ms reading the file)".format(
+            "manifest", manifest_ms, registry.STARTUP_TIMINGS.get("manifest_load_ms", 0.0)))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env mayapy
+"""Time Share Keys' keying: one setKeyframe per curve per frame vs one API pass per curve.
+
+Needs Maya: run it with ``mayapy``. A synthetic scene of locators with
+sparse, randomly timed keys on every keyable channel is keyed on the union
+of all key times twice -- once through the commands path Share Keys used
+to take, once through ``maya_api.set_anim_curve_keys`` under a single
+committed ``MAnimCurveChange`` -- and the resulting key times and values
+are compared before the timings are printed. The scene is reopened between
+the two runs so both start from identical curves.
+
+Key times must match exactly. New key values are reported, not required to
+match: the commands path evaluates each frame on a curve already reshaped
+by the keys it inserted before it, while the API path samples every frame
+from the original curve.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+CHANNELS = ("tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz", "v")
+
+
+def build_scene(cmds, objects, keys, frame_range, seed=0):
+    rng = random.Random(seed)
+    cmds.file(new=True, force=True)
+    curves = []
+    all_frames = set()
+    for index in range(objects):
+        node = cmds.spaceLocator(name="bench_{}".format(index))[0]
+        for channel in CHANNELS[:-1]:
+            frames = sorted(rng.sample(range(frame_range), keys))
+            for frame in frames:
+                cmds.setKeyframe(node, attribute=channel, time=(frame,), value=rng.uniform(-10.0, 10.0))
+            all_frames.update(frames)
+        curves.extend(cmds.keyframe(node, query=True, name=True) or [])
+    return curves, sorted(all_frames)
+
+
+def curve_state(cmds, curves):
+    return {
+        curve: (
+            tuple(round(value, 6) for value in cmds.keyframe(curve, query=True, timeChange=True) or []),
+            tuple(round(value, 6) for value in cmds.keyframe(curve, query=True, valueChange=True) or []),
+        )
+        for curve in curves
+    }
+
+
+def commands_path(cmds, curves, frames):
+    for curve in curves:
+        existing = set(cmds.keyframe(curve, query=True, timeChange=True) or [])
+        for frame in frames:
+            if frame not in existing:
+                cmds.setKeyframe(curve, time=(frame,))
+
+
+def api_path(maya_api, api_undo, curves, frames):
+    change = api_undo.begin()
+    if change is None:
+        raise SystemExit("Could not load the anim-curve undo plug-in")
+    for curve in curves:
+        if maya_api.set_anim_curve_keys(curve, frames, change=change) is None:
+            raise SystemExit("API path could not key {}".format(curve))
+    api_undo.commit(change)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=34)
+    parser.add_argument("--keys", type=int, default=12)
+    parser.add_argument("--frames", type=int, default=1000)
+    args = parser.parse_args()
+
+    import maya.standalone
+
+    maya.standalone.initialize(name="python")
+    from maya import cmds
+    from TheKeyMachine.maya import api_undo, maya_api
+
+    cmds.undoInfo(state=True, infinity=True)
+    results = {}
+    states = {}
+    for label in ("commands", "api"):
+        curves, frames = build_scene(cmds, args.objects, args.keys, args.frames)
+        started = time.perf_counter()
+        if label == "commands":
+            commands_path(cmds, curves, frames)
+        else:
+            api_path(maya_api, api_undo, curves, frames)
+        results[label] = (time.perf_counter() - started) * 1000.0
+        states[label] = curve_state(cmds, curves)
+        if label == "api":
+            cmds.undo()
+            undone = curve_state(cmds, curves)
+            cmds.redo()
+            if curve_state(cmds, curves) != states[label] or undone == states[label]:
+                raise SystemExit("API keying did not undo/redo as one step")
+
+    drift = 0.0
+    for curve, (times, values) in states["commands"].items():
+        api_times, api_values = states["api"][curve]
+        if times != api_times:
+            raise SystemExit("API keying differs from the commands path on {}".format(curve))
+        drift = max([drift] + [abs(a - b) for a, b in zip(values, api_values)])
+
+    print("{} curves x {} shared frames (key times match, max value drift {:.4f})".format(
+        len(curves), len(frames), drift
+    ))
+    for label, elapsed in results.items():
+        print("{:>9}: {:10.1f} ms".format(label, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Time block-neighbor queries: per-key ``block_neighbors`` vs ``NeighborIndex``.
+
+Runs with any Python 3 interpreter (no Maya needed): the slider math module
+is loaded straight from its file so the TheKeyMachine package, which imports
+Maya, is never initialized. Before timing, every selected key and a spread of
+in-between times are checked against ``block_neighbors`` for equivalence.
+"""
+
+import argparse
+import importlib.util
+import random
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SLIDERS_ROOT = REPO_ROOT / "TheKeyMachine" / "tools" / "sliders"
+
+
+def load_module(name, filename):
+    spec = importlib.util.spec_from_file_location(name, SLIDERS_ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_selection(key_count, selected_count, seed=0):
+    rng = random.Random(seed)
+    keys = sorted(rng.sample(range(key_count * 2), key_count))
+    keys = [float(key) for key in keys]
+    start = rng.randrange(0, max(1, key_count - selected_count))
+    selected = keys[start:start + selected_count]
+    # Scattered single keys and short runs, like a hand-made graph selection.
+    for _index in range(20):
+        run_start = rng.randrange(0, key_count)
+        selected.extend(keys[run_start:run_start + rng.randrange(1, 6)])
+    return keys, selected
+
+
+def check_equivalence(slider_math, trials, seed=1):
+    rng = random.Random(seed)
+    for _trial in range(trials):
+        keys = sorted({float(rng.randrange(0, 60)) for _index in range(rng.randrange(0, 30))})
+        selected = set(rng.sample(keys, rng.randrange(0, len(keys) + 1))) if keys else set()
+        index = slider_math.NeighborIndex(keys, selected)
+        probes = list(keys) + [rng.uniform(-5.0, 65.0) for _index in range(10)]
+        for probe in probes:
+            expected = slider_math.block_neighbors(probe, selected, keys)
+            if index.block_neighbors(probe) != expected:
+                raise SystemExit("NeighborIndex differs at {} (keys={}, selected={})".format(probe, keys, sorted(selected)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--selected", type=int, default=2000)
+    parser.add_argument("--trials", type=int, default=2000)
+    args = parser.parse_args()
+
+    slider_math = load_module("tkm_slider_math", "math.py")
+    check_equivalence(slider_math, args.trials)
+
+    keys, selected = synthetic_selection(args.keys, args.selected)
+    selected_set = set(selected)
+
+    started = time.perf_counter()
+    expected = [slider_math.block_neighbors(key, selected_set, keys) for key in selected]
+    scan_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    index = slider_math.NeighborIndex(keys, selected_set)
+    build_ms = (time.perf_counter() - started) * 1000.0
+    started = time.perf_counter()
+    result = [index.block_neighbors(key) for key in selected]
+    query_ms = (time.perf_counter() - started) * 1000.0
+
+    if result != expected:
+        raise SystemExit("NeighborIndex differs from block_neighbors on the benchmark selection")
+
+    print("{} keys, {} selected ({} trials equivalent)".format(len(keys), len(selected), args.trials))
+    print("{:>15}: {:8.1f} ms".format("block_neighbors", scan_ms))
+    print("{:>15}: {:8.1f} ms build + {:.1f} ms query".format("NeighborIndex", build_ms, query_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Time one Blend slider drag tick: dict cache vs columnar cache.
+
+Runs with any Python 3 interpreter (no Maya needed): the slider math modules
+are loaded straight from their files so the TheKeyMachine package, which
+imports Maya, is never initialized. The per-key writes a real tick also
+performs are left out -- this measures the value computation only.
+"""
+
+import argparse
+import importlib.util
+import math
+import random
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SLIDERS_ROOT = REPO_ROOT / "TheKeyMachine" / "tools" / "sliders"
+
+
+def load_module(name, filename):
+    spec = importlib.util.spec_from_file_location(name, SLIDERS_ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_curves(curve_count, key_count, selected_count, seed=0):
+    rng = random.Random(seed)
+    curves = []
+    for _index in range(curve_count):
+        times = [float(frame) for frame in range(key_count)]
+        values = [rng.uniform(-10.0, 10.0) for _frame in times]
+        start = rng.randrange(0, max(1, key_count - selected_count))
+        selected = times[start:start + selected_count]
+        # A few scattered keys outside the main block, like a real selection.
+        selected.extend(rng.sample(times, min(key_count, 5)))
+        curves.append((times, values, selected))
+    return curves
+
+
+def dict_tick(slider_math, cache, keys, factor):
+    """The per-key loop apply_smooth ran before the columnar cache."""
+    all_keys = sorted(cache.keys())
+    target_times_set = set(keys)
+    result = []
+    for key_time in keys:
+        if key_time not in cache:
+            continue
+        orig_val = cache[key_time]
+        p_time, n_time = slider_math.block_neighbors(key_time, target_times_set, all_keys)
+        p_val = cache.get(p_time, orig_val)
+        n_val = cache.get(n_time, orig_val)
+        w_p = 1.0 / abs(key_time - p_time) if p_time != key_time else 0
+        w_n = 1.0 / abs(n_time - key_time) if n_time != key_time else 0
+        if w_p + w_n > 0:
+            avg = (p_val * w_p + n_val * w_n) / (w_p + w_n)
+            result.append(orig_val + (avg - orig_val) * factor)
+        else:
+            result.append(math.nan)
+    return result
+
+
+def columnar_tick(curve_values, cache, keys, factor):
+    _times, indices = cache.present(keys)
+    return curve_values.smooth(curve_values.neighbor_columns(cache, indices), factor)
+
+
+def same(left, right):
+    return len(left) == len(right) and all(
+        (math.isnan(a) and math.isnan(b)) or abs(a - b) <= 1e-9 for a, b in zip(left, right)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--curves", type=int, default=300)
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--selected", type=int, default=400)
+    parser.add_argument("--ticks", type=int, default=5)
+    args = parser.parse_args()
+
+    slider_math = load_module("tkm_slider_math", "math.py")
+    curve_values = load_module("tkm_slider_curve_values", "curve_values.py")
+    curves = synthetic_curves(args.curves, args.keys, args.selected)
+    dict_caches = [dict(zip(times, values)) for times, values, _keys in curves]
+    columnar_caches = [curve_values.CurveValues(times, values) for times, values, _keys in curves]
+
+    for dict_cache, columnar_cache, (_times, _values, keys) in zip(dict_caches, columnar_caches, curves):
+        if not same(dict_tick(slider_math, dict_cache, keys, 0.5), columnar_tick(curve_values, columnar_cache, keys, 0.5)):
+            raise SystemExit("columnar smooth differs from the dict loop")
+
+    print("{} curves x {} keys, {} selected per curve, numpy={}".format(
+        args.curves, args.keys, args.selected + 5, curve_values.numpy is not None
+    ))
+    for label, tick, caches, module in (
+        ("dict", dict_tick, dict_caches, slider_math),
+        ("columnar", columnar_tick, columnar_caches, curve_values),
+    ):
+        started = time.perf_counter()
+        for _tick in range(args.ticks):
+            for cache, (_times, _values, keys) in zip(caches, curves):
+                tick(module, cache, keys, 0.5)
+        elapsed = (time.perf_counter() - started) * 1000.0 / args.ticks
+        print("{:>9}: {:8.1f} ms/tick".format(label, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""Check and time curve-level tangent snapshots against the per-key commands.
+
+Runs with any Python 3 interpreter (no Maya needed): the tangents module is
+loaded straight from its file so the TheKeyMachine package, which imports
+Maya, is never initialized. A fake anim curve answers both the
+``cmds.keyTangent``/``cmds.keyframe`` calls the old helpers made and the
+``MFnAnimCurve`` methods the batched pass uses, over the same key data, with
+the couplings that make restore order matter: editing an angle fixes that
+side and drags a locked partner along, computed types recompute their
+angle, and weights only move on weighted curves without a weight lock.
+
+Random curves are snapshotted both ways and must give equal snapshots,
+including times with no key and key times that don't line up with the
+query range. Random snapshots are then restored onto twin curves both
+ways and must leave them identical. Fake timings say little on their own;
+the command and API call counts are what carry over to Maya, where each
+command pays parsing, dispatch and undo journaling and an API call doesn't.
+"""
+
+import argparse
+import copy
+import importlib.util
+import math
+import random
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ANIMATION_ROOT = REPO_ROOT / "TheKeyMachine" / "maya" / "animation"
+
+TOLERANCE = 0.000001
+TYPES = ("auto", "spline", "linear", "flat", "clamped", "plateau", "fixed", "step", "autoease")
+COMPUTED_TYPES = {"auto", "spline", "linear", "flat", "clamped", "plateau", "autoease", "step"}
+QUERY_FLAGS = (
+    "inAngle",
+    "outAngle",
+    "inWeight",
+    "outWeight",
+    "inTangentType",
+    "outTangentType",
+    "lock",
+    "weightLock",
+)
+
+
+def load_module(name, filename):
+    spec = importlib.util.spec_from_file_location(name, ANIMATION_ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeKey:
+    __slots__ = ("time", "value", "inTangentType", "outTangentType", "inAngle", "outAngle",
+                 "inWeight", "outWeight", "lock", "weightLock")
+
+    def __init__(self, time, value):
+        self.time = time
+        self.value = value
+        self.inTangentType = "auto"
+        self.outTangentType = "auto"
+        self.inAngle = 0.0
+        self.outAngle = 0.0
+        self.inWeight = 1.0
+        self.outWeight = 1.0
+        self.lock = True
+        self.weightLock = False
+
+    def state(self):
+        return tuple(round(value, 9) if isinstance(value, float) else value
+                     for value in (getattr(self, slot) for slot in self.__slots__))
+
+
+class FakeCurve:
+    """Key data plus the edit rules both fake front ends share."""
+
+    def __init__(self, keys, weighted=False):
+        self.keys = keys
+        self.weighted = weighted
+        self.commands = 0
+        self.api_calls = 0
+
+    def state(self):
+        return self.weighted, [key.state() for key in self.keys]
+
+    def computed_angle(self, index, side, tangent_type):
+        if tangent_type == "flat":
+            return 0.0
+        neighbor = index - 1 if side == "in" else index + 1
+        if not 0 <= neighbor < len(self.keys):
+            return 0.0
+        key, other = self.keys[index], self.keys[neighbor]
+        slope = (other.value - key.value) / (other.time - key.time)
+        return round(math.degrees(math.atan(slope)), 6)
+
+    def set_type(self, index, side, tangent_type):
+        key = self.keys[index]
+        setattr(key, side + "TangentType", tangent_type)
+        if tangent_type in COMPUTED_TYPES:
+            setattr(key, side + "Angle", self.computed_angle(index, side, tangent_type))
+
+    def set_angle(self, index, side, degrees):
+        key = self.keys[index]
+        sides = ("in", "out") if key.lock else (side,)
+        for name in sides:
+            setattr(key, name + "Angle", float(degrees))
+            setattr(key, name + "TangentType", "fixed")
+
+    def set_weight(self, index, side, weight):
+        key = self.keys[index]
+        if self.weighted and not key.weightLock:
+            setattr(key, side + "Weight", float(weight))
+
+    def indices(self, time_range=None):
+        if time_range is None:
+            return list(range(len(self.keys)))
+        start, end = time_range
+        return [
+            index for index, key in enumerate(self.keys)
+            if start - TOLERANCE <= key.time <= end + TOLERANCE
+        ]
+
+
+class FakeCmds:
+    """The ``cmds`` calls the per-key helpers make, against one FakeCurve."""
+
+    def __init__(self, curve):
+        self.curve = curve
+
+    def keyframe(self, _curve, query=False, time=None, timeChange=False):
+        self.curve.commands += 1
+        return [self.curve.keys[index].time for index in self.curve.indices(time)]
+
+    def keyTangent(self, _curve, query=False, edit=False, time=None, **flags):
+        self.curve.commands += 1
+        curve = self.curve
+        if query:
+            if flags.get("weightedTangents"):
+                return [curve.weighted]
+            (flag,) = flags
+            return [getattr(curve.keys[index], flag) for index in curve.indices(time)]
+        if "weightedTangents" in flags:
+            curve.weighted = bool(flags["weightedTangents"])
+            return None
+        for index in curve.indices(time):
+            key = curve.keys[index]
+            if "lock" in flags:
+                key.lock = bool(flags["lock"])
+            if "weightLock" in flags:
+                key.weightLock = bool(flags["weightLock"])
+            for side in ("in", "out"):
+                if side + "TangentType" in flags:
+                    curve.set_type(index, side, flags[side + "TangentType"])
+            for side in ("in", "out"):
+                if side + "Angle" in flags:
+                    curve.set_angle(index, side, flags[side + "Angle"])
+                if side + "Weight" in flags:
+                    curve.set_weight(index, side, flags[side + "Weight"])
+        return None
+
+
+class FakeAngle:
+    def __init__(self, degrees):
+        self.degrees = float(degrees)
+
+    def asDegrees(self):
+        return self.degrees
+
+
+class FakeTime:
+    def __init__(self, frames):
+        self.frames = frames
+
+    def asUnits(self, _unit):
+        return self.frames
+
+
+class FakeFn:
+    """The ``MFnAnimCurve`` methods the batched pass uses, against one FakeCurve."""
+
+    def __init__(self, curve):
+        self.curve = curve
+
+    @property
+    def numKeys(self):
+        self.curve.api_calls += 1
+        return len(self.curve.keys)
+
+    @property
+    def isWeighted(self):
+        self.curve.api_calls += 1
+        return self.curve.weighted
+
+    def setIsWeighted(self, weighted, change=None):
+        self.curve.api_calls += 1
+        self.curve.weighted = bool(weighted)
+
+    def input(self, index):
+        self.curve.api_calls += 1
+        return FakeTime(self.curve.keys[index].time)
+
+    def getTangentAngleWeight(self, index, is_in_tangent):
+        self.curve.api_calls += 1
+        key = self.curve.keys[index]
+        if is_in_tangent:
+            return FakeAngle(key.inAngle), key.inWeight
+        return FakeAngle(key.outAngle), key.outWeight
+
+    def tangentsLocked(self, index):
+        self.curve.api_calls += 1
+        return self.curve.keys[index].lock
+
+    def weightsLocked(self, index):
+        self.curve.api_calls += 1
+        return self.curve.keys[index].weightLock
+
+    def setTangentsLocked(self, index, locked, change=None):
+        self.curve.api_calls += 1
+        self.curve.keys[index].lock = bool(locked)
+
+    def setWeightsLocked(self, index, locked, change=None):
+        self.curve.api_calls += 1
+        self.curve.keys[index].weightLock = bool(locked)
+
+    def setInTangentType(self, index, tangent_type, change=None):
+        self.curve.api_calls += 1
+        self.curve.set_type(index, "in", tangent_type)
+
+    def setOutTangentType(self, index, tangent_type, change=None):
+        self.curve.api_calls += 1
+        self.curve.set_type(index, "out", tangent_type)
+
+    def setAngle(self, index, angle, is_in_tangent, change=None):
+        self.curve.api_calls += 1
+        self.curve.set_angle(index, "in" if is_in_tangent else "out", angle.asDegrees())
+
+    def setWeight(self, index, weight, is_in_tangent, change=None):
+        self.curve.api_calls += 1
+        self.curve.set_weight(index, "in" if is_in_tangent else "out", weight)
+
+
+def reference_snapshots(cmds, curve, key_times):
+    """The commands path of ``curves.key_tangent_snapshots``."""
+    key_times = [float(value) for value in key_times or []]
+    snapshots = [{} for _time in key_times]
+    time_range = (min(key_times), max(key_times))
+    queried_times = [float(value) for value in cmds.keyframe(curve, query=True, time=time_range, timeChange=True) or []]
+    can_batch = len(queried_times) == len(key_times) and all(
+        abs(source - requested) <= 0.000001 for source, requested in zip(queried_times, key_times)
+    )
+    if can_batch:
+        for flag in QUERY_FLAGS:
+            values = cmds.keyTangent(curve, query=True, time=time_range, **{flag: True}) or []
+            for index, value in enumerate(values[:len(snapshots)]):
+                snapshots[index][flag] = value
+    else:
+        for index, key_time in enumerate(key_times):
+            for flag in QUERY_FLAGS:
+                result = cmds.keyTangent(curve, query=True, time=(key_time, key_time), **{flag: True}) or []
+                if result:
+                    snapshots[index][flag] = result[0]
+    weighted = cmds.keyTangent(curve, query=True, weightedTangents=True) or []
+    if weighted:
+        for snapshot in snapshots:
+            snapshot["weightedTangents"] = bool(weighted[0])
+    return snapshots
+
+
+def reference_apply(cmds, curve, key_time, snapshot, apply_weighted=True):
+    """``curves.apply_key_tangent_snapshot`` through commands, one key."""
+    if not snapshot:
+        return False
+
+    def edit(**values):
+        if values:
+            cmds.keyTangent(curve, edit=True, time=(key_time, key_time), **values)
+
+    weighted = snapshot.get("weightedTangents")
+    if apply_weighted and weighted is not None:
+        cmds.keyTangent(curve, edit=True, weightedTangents=bool(weighted))
+    edit(lock=False, weightLock=False)
+    tangent_types = {flag: snapshot[flag] for flag in ("inTangentType", "outTangentType") if flag in snapshot}
+    edit(**tangent_types)
+    automatic = {"auto", "autoease", "autoEase", "autoMix"}
+    details = {}
+    if snapshot.get("inTangentType") not in automatic:
+        details.update((flag, snapshot[flag]) for flag in ("inAngle", "inWeight") if flag in snapshot)
+    if snapshot.get("outTangentType") not in automatic:
+        details.update((flag, snapshot[flag]) for flag in ("outAngle", "outWeight") if flag in snapshot)
+    edit(**details)
+    if details:
+        edit(**tangent_types)
+    edit(**{flag: snapshot[flag] for flag in ("lock", "weightLock") if flag in snapshot})
+    return True
+
+
+def random_curve(rng, key_count):
+    times = sorted(float(frame) for frame in rng.sample(range(key_count * 3), key_count))
+    keys = [FakeKey(frame, rng.uniform(-10.0, 10.0)) for frame in times]
+    curve = FakeCurve(keys, weighted=rng.random() < 0.5)
+    for index, key in enumerate(keys):
+        key.lock = rng.random() < 0.7
+        key.weightLock = rng.random() < 0.3
+        for side in ("in", "out"):
+            curve.set_type(index, side, rng.choice(TYPES))
+            if getattr(key, side + "TangentType") == "fixed":
+                setattr(key, side + "Angle", round(rng.uniform(-80.0, 80.0), 4))
+            setattr(key, side + "Weight", round(rng.uniform(0.2, 4.0), 4))
+    return curve
+
+
+def random_times(rng, curve):
+    times = [key.time for key in curve.keys]
+    choice = rng.random()
+    if choice < 0.4:
+        return times
+    if choice < 0.7:
+        return sorted(rng.sample(times, rng.randrange(1, len(times) + 1)))
+    return sorted(set(rng.sample(times, rng.randrange(1, len(times) + 1)) + [times[-1] + 0.5, times[0] - 1.0]))
+
+
+def random_snapshots(rng, tangents, source, target):
+    times = [key.time for key in target.keys]
+    snapshots = tangents.read_snapshots(FakeFn(source), [key.time for key in source.keys], None, {
+        flag: [getattr(key, flag) for key in source.keys] for flag in tangents.TYPE_FLAGS
+    })
+    pairs = []
+    for key_time, snapshot in zip(times, snapshots):
+        if rng.random() < 0.3:
+            snapshot = {flag: value for flag, value in snapshot.items() if rng.random() < 0.6}
+        pairs.append((key_time, snapshot))
+    if rng.random() < 0.3:
+        pairs.append((times[-1] + 0.25, {"weightedTangents": not target.weighted}))
+    return pairs
+
+
+def api_snapshots(tangents, curve, key_times):
+    cmds = FakeCmds(curve)
+    tangent_types = {flag: cmds.keyTangent("curve", query=True, **{flag: True}) for flag in tangents.TYPE_FLAGS}
+    return tangents.read_snapshots(FakeFn(curve), key_times, None, tangent_types)
+
+
+def api_restore(tangents, curve, pairs, apply_weighted=True):
+    return tangents.restore_snapshots(FakeFn(curve), pairs, None, FakeAngle, lambda name: name, apply_weighted=apply_weighted)
+
+
+def check_equivalence(tangents, trials, seed=1):
+    rng = random.Random(seed)
+    for _trial in range(trials):
+        curve = random_curve(rng, rng.randrange(1, 30))
+        key_times = random_times(rng, curve)
+        expected = reference_snapshots(FakeCmds(curve), "curve", key_times)
+        if api_snapshots(tangents, curve, key_times) != expected:
+            raise SystemExit("Batched snapshots differ from the per-key queries")
+
+        source = random_curve(rng, len(curve.keys))
+        pairs = random_snapshots(rng, tangents, source, curve)
+        apply_weighted = rng.random() < 0.8
+        twin = copy.deepcopy(curve)
+        for key_time, snapshot in pairs:
+            reference_apply(FakeCmds(curve), "curve", key_time, snapshot, apply_weighted=apply_weighted)
+        if not api_restore(tangents, twin, pairs, apply_weighted=apply_weighted):
+            raise SystemExit("Batched restore refused known tangent types")
+        if twin.state() != curve.state():
+            raise SystemExit("Batched restore differs from the per-key edits")
+
+    curve = random_curve(rng, 4)
+    before = curve.state()
+    if tangents.restore_snapshots(FakeFn(curve), [(curve.keys[0].time, {"inTangentType": "bogus"})],
+                                  None, FakeAngle, lambda _name: None):
+        raise SystemExit("Batched restore accepted an unknown tangent type")
+    if curve.state() != before:
+        raise SystemExit("Refused batched restore still edited the curve")
+
+
+def measure(label, curves, callback):
+    for curve in curves:
+        curve.commands = curve.api_calls = 0
+    started = time.perf_counter()
+    for curve in curves:
+        callback(curve)
+    elapsed = (time.perf_counter() - started) * 1000.0
+    print("{:>18}: {:8.1f} ms {:>7} commands {:>7} API calls".format(
+        label,
+        elapsed,
+        sum(curve.commands for curve in curves),
+        sum(curve.api_calls for curve in curves),
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--curves", type=int, default=200)
+    parser.add_argument("--keys", type=int, default=60)
+    parser.add_argument("--trials", type=int, default=500)
+    args = parser.parse_args()
+
+    tangents = load_module("tkm_tangents", "tangents.py")
+    check_equivalence(tangents, args.trials)
+
+    rng = random.Random(0)
+    curves = [random_curve(rng, args.keys) for _index in range(args.curves)]
+    print("{} curves x {} keys (snapshots and restores match)".format(len(curves), args.keys))
+    # Every other key: the per-key helper can't batch a range with gaps.
+    times = {id(curve): [key.time for key in curve.keys[::2]] for curve in curves}
+    snapshots = {id(curve): api_snapshots(tangents, curve, times[id(curve)]) for curve in curves}
+
+    measure("per-key snapshots", curves, lambda curve: reference_snapshots(FakeCmds(curve), "curve", times[id(curve)]))
+    measure("curve snapshots", curves, lambda curve: api_snapshots(tangents, curve, times[id(curve)]))
+
+    def per_key_restore(curve):
+        cmds = FakeCmds(curve)
+        for key_time, snapshot in zip(times[id(curve)], snapshots[id(curve)]):
+            reference_apply(cmds, "curve", key_time, snapshot)
+
+    measure("per-key restore", curves, per_key_restore)
+    measure("curve restore", curves, lambda curve: api_restore(
+        tangents, curve, list(zip(times[id(curve)], snapshots[id(curve)]))
+    ))
+
+
+if __name__ == "__main__":
+    main()